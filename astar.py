@@ -0,0 +1,209 @@
+import heapq
+import math
+from typing import Callable, Dict, Generator, List, Optional, Set, Tuple
+
+from config import NUM_MARCOS
+from dijkstra import dijkstra_distancias, reconstruir_caminho
+from eventos import evento_relax, evento_visita
+
+
+def fator_euclidiano(grafo) -> float:
+    """
+    Maior k tal que k * |pos_u - pos_v| <= peso em toda rota ativa: com ele a
+    distância em linha reta ao destino nunca superestima o custo (heurística
+    admissível e consistente). 0 (busca vira Dijkstra) se houver peso negativo.
+    Uma passada por rota (a gêmea de uma rota bidirecional tem o mesmo peso).
+    """
+    if hasattr(grafo, "vizinhos_ids"):
+        return _fator_euclidiano_ids(grafo)
+    planetas = grafo.planetas
+    fator = math.inf
+    for e in grafo.rotas():
+        if not e.ativa:
+            continue
+        if e.peso < 0:
+            return 0.0
+        d = math.dist(planetas[e.u].pos, planetas[e.v].pos)
+        if d > 0:
+            fator = min(fator, e.peso / d)
+    return 0.0 if fator == math.inf else fator
+
+
+def _fator_euclidiano_ids(grafo) -> float:
+    """fator_euclidiano sobre os ids inteiros de um MapaCompacto, sem materializar Arestas."""
+    posicoes = [grafo.planetas[nome].pos for nome in grafo.nomes]
+    fator = math.inf
+    for u, pos_u in enumerate(posicoes):
+        for v, peso in grafo.vizinhos_ids(u):
+            if peso < 0:
+                return 0.0
+            d = math.dist(pos_u, posicoes[v])
+            if d > 0:
+                fator = min(fator, peso / d)
+    return 0.0 if fator == math.inf else fator
+
+
+class FatorEuclidiano:
+    """fator_euclidiano de uma versão do mapa, para o A* não varrer as rotas a cada consulta."""
+    def __init__(self, grafo):
+        self.versao = grafo.versao
+        self.id_mapa = id(grafo)
+        self.valor = fator_euclidiano(grafo)
+
+    def valido_para(self, grafo) -> bool:
+        return self.id_mapa == id(grafo) and self.versao == grafo.versao
+
+
+def heuristica_euclidiana(grafo, destino: str, fator: Optional[float] = None) -> Callable[[str], float]:
+    if fator is None:
+        fator = fator_euclidiano(grafo)
+    planetas, alvo = grafo.planetas, grafo.planetas[destino].pos
+    return lambda v: fator * math.dist(planetas[v].pos, alvo)
+
+
+class _Transposto:
+    """Vista do grafo com as arestas invertidas, para dijkstra_distancias calcular d(v, marco)."""
+    def __init__(self, grafo):
+        self.planetas = grafo.planetas
+        self.vizinhos = grafo.vizinhos_reversos
+
+
+class Marcos:
+    """
+    Distâncias de e para alguns planetas-marco (ALT: A*, Landmarks, Triangle inequality).
+    Pela desigualdade triangular, d(v, t) >= d(L, t) - d(L, v) e d(v, t) >= d(v, L) - d(t, L).
+    Os marcos são escolhidos do mais distante para o mais distante dos já escolhidos.
+    Mapas com rotas dirigidas precisam de vizinhos_reversos (para d(v, L)).
+    """
+    def __init__(self, grafo, quantidade: int = NUM_MARCOS):
+        self.versao = grafo.versao
+        self.id_mapa = id(grafo)
+        dirigido = any(e.dirigida for e in grafo.rotas())
+        if dirigido and not hasattr(grafo, "vizinhos_reversos"):
+            raise TypeError("Mapa com rotas dirigidas sem vizinhos_reversos: limites de marcos seriam inadmissíveis.")
+        self.nomes: List[str] = []
+        self.de: List[Dict[str, float]] = []    # d(L, v); planetas inalcançáveis ficam de fora
+        self.para: List[Dict[str, float]] = []  # d(v, L); o mesmo dict de `de` em mapas não dirigidos
+
+        # Distância ao marco mais próximo já escolhido; inalcançável conta como infinita,
+        # então setores isolados recebem marco próprio antes de se repetir um setor.
+        mais_proximo = {p: math.inf for p in grafo.planetas}
+        candidato = next(iter(grafo.planetas), None)
+        if candidato is not None:
+            # Primeiro marco: o planeta mais longe de um planeta qualquer (uma "borda" do mapa).
+            dist, _ = dijkstra_distancias(grafo, candidato)
+            candidato = max(dist, key=dist.get)
+        for _ in range(min(quantidade, len(grafo.planetas))):
+            de, _ = dijkstra_distancias(grafo, candidato)
+            self.nomes.append(candidato)
+            self.de.append(de)
+            self.para.append(dijkstra_distancias(_Transposto(grafo), candidato)[0] if dirigido else de)
+            for p, d in de.items():
+                if d < mais_proximo[p]:
+                    mais_proximo[p] = d
+            mais_proximo[candidato] = -1.0
+            candidato = max(mais_proximo, key=mais_proximo.get)
+            if mais_proximo[candidato] <= 0:
+                break
+
+    def valido_para(self, grafo) -> bool:
+        return self.id_mapa == id(grafo) and self.versao == grafo.versao
+
+    def limite(self, v: str, destino: str) -> float:
+        """Limite inferior de d(v, destino); infinito quando os marcos provam que destino é inalcançável."""
+        melhor = 0.0
+        for de, para in zip(self.de, self.para):
+            dlt, dlv = de.get(destino), de.get(v)
+            if dlv is not None:
+                if dlt is None:
+                    return math.inf  # L alcança v mas não destino: v também não alcança destino
+                melhor = max(melhor, dlt - dlv)
+            dtl, dvl = para.get(destino), para.get(v)
+            if dtl is not None:
+                if dvl is None:
+                    return math.inf  # destino alcança L mas v não: v não alcança destino
+                melhor = max(melhor, dvl - dtl)
+        return melhor
+
+
+def astar_generator(grafo, origem: str, destino: str, delta: bool = False, medidor=None,
+                    fator: Optional[FatorEuclidiano] = None) -> Generator[dict, None, Tuple[List[str], float]]:
+    """
+    A* com a distância euclidiana (Planeta.pos) ao destino, escalada por
+    fator_euclidiano para continuar admissível. Mesmos eventos do Dijkstra.
+    Reaproveita `fator` se ainda valer para o mapa; senão varre as rotas.
+    """
+    if fator is None or not fator.valido_para(grafo):
+        fator = FatorEuclidiano(grafo)
+    h = heuristica_euclidiana(grafo, destino, fator.valor)
+    return (yield from _busca_informada(grafo, origem, destino, h, "A*", delta, medidor))
+
+
+def alt_generator(grafo, origem: str, destino: str, delta: bool = False, marcos: Optional[Marcos] = None,
+                  medidor=None) -> Generator[dict, None, Tuple[List[str], float]]:
+    """
+    A* com limites de marcos (ALT). Reaproveita `marcos` se ainda valer para
+    o mapa; senão os calcula (NUM_MARCOS buscas completas, o dobro em mapas dirigidos).
+    """
+    if marcos is None or not marcos.valido_para(grafo):
+        marcos = Marcos(grafo)
+    h = lambda v: marcos.limite(v, destino)
+    yield {"tipo": "msg", "texto": f"Marcos de navegação: {', '.join(marcos.nomes)}."}
+    return (yield from _busca_informada(grafo, origem, destino, h, "ALT", delta, medidor))
+
+
+def _busca_informada(grafo, origem: str, destino: str, h: Callable[[str], float], titulo: str,
+                     delta: bool, medidor) -> Generator[dict, None, Tuple[List[str], float]]:
+    """
+    Dijkstra com heap ordenado por g + h(v). Com h consistente cada planeta é
+    fixado uma vez, como no Dijkstra, mas a busca se inclina para o destino.
+    Planetas com h infinito não alcançam o destino e nem entram no heap.
+    """
+    dist: Dict[str, float] = {p: math.inf for p in grafo.planetas}
+    prev: Dict[str, Optional[str]] = {p: None for p in grafo.planetas}
+    dist[origem] = 0.0
+
+    fixados: Set[str] = set()
+    # (f, -g, planeta): em empates de f sai primeiro o mais fundo, mais perto do destino.
+    heap: List[Tuple[float, float, str]] = [(h(origem), -0.0, origem)]
+
+    inicio = {"tipo": "msg", "texto": f"Iniciando {titulo}. Calculando rota de {origem} até {destino}..."}
+    if delta: inicio["mudancas"] = [("dist", origem, math.inf, 0.0)]
+    yield inicio
+
+    while heap:
+        _, neg_d, u = heapq.heappop(heap)
+        d = -neg_d
+        if medidor: medidor.conta("heap_pop")
+        if u in fixados or d > dist[u]:
+            if medidor: medidor.conta("heap_obsoletos")
+            continue
+
+        fixados.add(u)
+        yield evento_visita(u, dist, prev, delta)
+
+        if u == destino:
+            break
+
+        for v, w in grafo.vizinhos(u):
+            if medidor: medidor.conta("arestas_examinadas")
+            if v in fixados:
+                continue
+            alt = d + w
+            if alt < dist[v]:
+                estimativa = h(v)
+                if medidor: medidor.conta("heuristicas")
+                if estimativa == math.inf:
+                    continue
+                ev = evento_relax("djk_relax", u, v, alt, dist, prev, delta)
+                dist[v] = alt
+                prev[v] = u
+                heapq.heappush(heap, (alt + estimativa, -alt, v))
+                if medidor: medidor.conta("relaxamentos"); medidor.conta("heap_push")
+
+                yield ev
+
+    caminho = reconstruir_caminho(prev, dist, destino)
+    yield {"tipo": "msg", "texto": f"{titulo}: {len(fixados)} de {len(grafo.planetas)} planetas fixados."}
+    yield {"tipo": "djk_fim", "caminho": list(caminho), "custo": float(dist[destino])}
+    return (caminho, dist[destino])
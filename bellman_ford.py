@@ -1,10 +1,21 @@
 import math
-from typing import Generator, List, Dict, Optional, Tuple
+from array import array
+from typing import Generator, List, Dict, Optional, Sequence, Tuple
 
-def bellman_ford_generator(grafo, origem: str, destino: str) -> Generator[dict, None, Tuple[List[str], float]]:
+from dijkstra import reconstruir_caminho
+from eventos import evento_relax
+
+try:
+    import numpy as np
+except ImportError:  # NumPy é opcional: o motor em lote cai para laços em Python puro.
+    np = None
+
+def bellman_ford_generator(grafo, origem: str, destino: str, delta: bool = False, medidor=None) -> Generator[dict, None, Tuple[List[str], float]]:
     """
     Algoritmo de Bellman-Ford para caminho mínimo.
     Relaxa todas as arestas |V| - 1 vezes.
+    Com delta=True os eventos trazem só "mudancas" (ver eventos.EstadoAcumulado).
+    medidor: instrumentacao.Medidor opcional (contagens de operações).
     """
     dist: Dict[str, float] = {p: math.inf for p in grafo.planetas}
     prev: Dict[str, Optional[str]] = {p: None for p in grafo.planetas}
@@ -14,10 +25,13 @@ def bellman_ford_generator(grafo, origem: str, destino: str) -> Generator[dict,
     arestas = list(grafo.arestas())
     num_v = len(vertices)
 
-    yield {"tipo": "msg", "texto": f"Iniciando Bellman-Ford. Relaxando arestas para calibrar rotas de {origem}..."}
+    inicio = {"tipo": "msg", "texto": f"Iniciando Bellman-Ford. Relaxando arestas para calibrar rotas de {origem}..."}
+    if delta: inicio["mudancas"] = [("dist", origem, math.inf, 0.0)]
+    yield inicio
 
     for i in range(num_v - 1):
         mudou_algo = False
+        if medidor: medidor.conta("rodadas")
         yield {"tipo": "msg", "texto": f"Ciclo de relaxamento {i+1}/{num_v-1}..."}
         
         for aresta in arestas:
@@ -28,11 +42,14 @@ def bellman_ford_generator(grafo, origem: str, destino: str) -> Generator[dict,
                 direcoes.append((aresta.v, aresta.u))
             
             for u, v in direcoes:
+                if medidor: medidor.conta("arestas_examinadas")
                 if dist[u] != math.inf and dist[u] + aresta.peso < dist[v]:
+                    if medidor: medidor.conta("relaxamentos")
+                    ev = evento_relax("bf_relax", u, v, dist[u] + aresta.peso, dist, prev, delta)
                     dist[v] = dist[u] + aresta.peso
                     prev[v] = u
                     mudou_algo = True
-                    yield {"tipo": "bf_relax", "de": u, "para": v, "nova_dist": dist[v], "prev": dict(prev)}
+                    yield ev
         
         if not mudou_algo:
             yield {"tipo": "msg", "texto": "Nenhuma melhoria detectada neste ciclo. Otimização concluída prematuramente."}
@@ -42,16 +59,154 @@ def bellman_ford_generator(grafo, origem: str, destino: str) -> Generator[dict,
         if not aresta.ativa: continue
         u, v = aresta.u, aresta.v
         if dist[u] != math.inf and dist[u] + aresta.peso < dist[v]:
+             prev[v] = u
+             ciclo = _extrair_ciclo(lambda x: prev[x], v)
              yield {"tipo": "msg", "texto": "ERRO CRÍTICO: Ciclo de peso negativo detectado! O sistema é instável."}
+             if ciclo: yield {"tipo": "ciclo_encontrado", "ciclo": ciclo}
              return ([], math.inf)
 
-    caminho: List[str] = []
-    if dist[destino] < math.inf:
-        cur: Optional[str] = destino
-        while cur is not None:
-            caminho.append(cur)
-            cur = prev[cur]
-        caminho.reverse()
+    caminho = reconstruir_caminho(prev, dist, destino)
 
     yield {"tipo": "djk_fim", "caminho": list(caminho), "custo": float(dist[destino])} 
-    return (caminho, dist[destino])
\ No newline at end of file
+    return (caminho, dist[destino])
+
+def _extrair_ciclo(pred, x) -> Optional[List]:
+    """
+    Segue os predecessores a partir de x até repetir um nó e devolve o ciclo
+    (na ordem das arestas). None se a cadeia terminar sem ciclo.
+    """
+    vistos = set()
+    while x is not None and x not in vistos:
+        vistos.add(x)
+        x = pred(x)
+    if x is None:
+        return None
+    ciclo = [x]
+    y = pred(x)
+    while y != x:
+        ciclo.append(y)
+        y = pred(y)
+    ciclo.reverse()
+    return ciclo
+
+def empacotar_arestas(grafo) -> Tuple[List[str], Dict[str, int], Sequence[int], Sequence[int], Sequence[float]]:
+    """
+    Empacota as arestas ativas em arrays paralelos u/v/w (ids inteiros).
+    Rotas bidirecionais aparecem nas duas direções, como em vizinhos().
+    """
+    nomes = list(grafo.planetas)
+    ids = {nome: i for i, nome in enumerate(nomes)}
+    us, vs, ws = array("i"), array("i"), array("d")
+    for i, nome in enumerate(nomes):
+        for v, w in grafo.vizinhos(nome):
+            us.append(i); vs.append(ids[v]); ws.append(w)
+    return nomes, ids, us, vs, ws
+
+def bellman_ford_vetorizado(grafo, origem: str, registrar: bool = False, medidor=None):
+    """
+    Bellman-Ford em lote: cada rodada relaxa todas as arestas de uma vez
+    (min-scatter com np.minimum.at) sobre as distâncias da rodada anterior.
+    Para na primeira rodada sem mudanças. Se a |V|-ésima rodada ainda melhora,
+    o ciclo negativo é extraído pela cadeia de predecessores.
+    Retorna (dist, prev, ciclo, rodadas); rodadas só é preenchido com registrar=True
+    e traz, por rodada, a lista (u, v, nova_dist) das melhorias.
+    Com medidor, conta rodadas, arestas examinadas (todas, a cada rodada) e relaxamentos.
+    """
+    nomes, ids, us, vs, ws = empacotar_arestas(grafo)
+    n = len(nomes)
+    s = ids[origem]
+    rodadas: List[List[Tuple[str, str, float]]] = []
+
+    if np is not None:
+        u = np.frombuffer(us, dtype=np.int32) if len(us) else np.zeros(0, dtype=np.int32)
+        v = np.frombuffer(vs, dtype=np.int32) if len(vs) else np.zeros(0, dtype=np.int32)
+        w = np.frombuffer(ws, dtype=np.float64) if len(ws) else np.zeros(0, dtype=np.float64)
+        dist_v = np.full(n, np.inf)
+        dist_v[s] = 0.0
+        prev_v = np.full(n, -1, dtype=np.int64)
+        x_ciclo = -1
+        for rodada in range(n):
+            cand = dist_v[u] + w
+            nova = dist_v.copy()
+            np.minimum.at(nova, v, cand)
+            melhorou = nova < dist_v
+            if medidor: medidor.conta("rodadas"); medidor.conta("arestas_examinadas", len(u))
+            if not melhorou.any():
+                break
+            idx = np.nonzero(melhorou[v] & (cand == nova[v]))[0]
+            if medidor: medidor.conta("relaxamentos", int(melhorou.sum()))
+            prev_v[v[idx]] = u[idx]
+            dist_v = nova
+            if registrar:
+                alvos = np.nonzero(melhorou)[0]
+                rodadas.append([(nomes[prev_v[t]], nomes[t], float(dist_v[t])) for t in alvos])
+            if rodada == n - 1:
+                x_ciclo = int(v[idx[0]])
+        dist_l = dist_v.tolist()
+        prev_l = prev_v.tolist()
+    else:
+        dist_l = [math.inf] * n
+        dist_l[s] = 0.0
+        prev_l = [-1] * n
+        x_ciclo = -1
+        arestas = list(zip(us, vs, ws))
+        for rodada in range(n):
+            nova = list(dist_l)
+            novo_prev: Dict[int, int] = {}
+            for a, b, peso in arestas:
+                c = dist_l[a] + peso
+                if c < nova[b]:
+                    nova[b] = c
+                    novo_prev[b] = a
+            if medidor: medidor.conta("rodadas"); medidor.conta("arestas_examinadas", len(arestas))
+            if not novo_prev:
+                break
+            if medidor: medidor.conta("relaxamentos", len(novo_prev))
+            for b, a in novo_prev.items():
+                prev_l[b] = a
+            dist_l = nova
+            if registrar:
+                rodadas.append([(nomes[a], nomes[b], dist_l[b]) for b, a in sorted(novo_prev.items())])
+            if rodada == n - 1:
+                x_ciclo = next(iter(novo_prev))
+
+    ciclo = None
+    if x_ciclo >= 0:
+        ids_ciclo = _extrair_ciclo(lambda x: prev_l[x] if prev_l[x] >= 0 else None, x_ciclo)
+        ciclo = [nomes[i] for i in ids_ciclo] if ids_ciclo else None
+
+    dist = {nome: dist_l[i] for i, nome in enumerate(nomes)}
+    prev = {nome: (nomes[prev_l[i]] if prev_l[i] >= 0 else None) for i, nome in enumerate(nomes)}
+    return dist, prev, ciclo, rodadas
+
+def bellman_ford_vetorizado_generator(grafo, origem: str, destino: str, delta: bool = False, medidor=None) -> Generator[dict, None, Tuple[List[str], float]]:
+    """
+    Modo animado do motor em lote: calcula tudo com bellman_ford_vetorizado e
+    depois reproduz as melhorias de cada rodada como eventos bf_relax.
+    """
+    dist_final, prev_final, ciclo, rodadas = bellman_ford_vetorizado(grafo, origem, registrar=True, medidor=medidor)
+
+    dist: Dict[str, float] = {p: math.inf for p in grafo.planetas}
+    prev: Dict[str, Optional[str]] = {p: None for p in grafo.planetas}
+    dist[origem] = 0.0
+
+    inicio = {"tipo": "msg", "texto": f"Bellman-Ford em lote: {len(rodadas)} rodadas calculadas a partir de {origem}."}
+    if delta: inicio["mudancas"] = [("dist", origem, math.inf, 0.0)]
+    yield inicio
+
+    for i, melhorias in enumerate(rodadas):
+        yield {"tipo": "msg", "texto": f"Rodada {i+1}: {len(melhorias)} rotas relaxadas..."}
+        for u, v, nova in melhorias:
+            ev = evento_relax("bf_relax", u, v, nova, dist, prev, delta)
+            dist[v] = nova
+            prev[v] = u
+            yield ev
+
+    if ciclo:
+        yield {"tipo": "msg", "texto": f"ERRO CRÍTICO: Ciclo de peso negativo detectado ({len(ciclo)} planetas)! O sistema é instável."}
+        yield {"tipo": "ciclo_encontrado", "ciclo": list(ciclo)}
+        return ([], math.inf)
+
+    caminho = reconstruir_caminho(prev_final, dist_final, destino)
+    yield {"tipo": "djk_fim", "caminho": list(caminho), "custo": float(dist_final[destino])}
+    return (caminho, dist_final[destino])
\ No newline at end of file
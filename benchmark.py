@@ -0,0 +1,202 @@
+"""
+Benchmark headless dos algoritmos sobre galáxias sintéticas.
+
+    python benchmark.py run --tamanhos 1000 10000 --saida relatorio.json
+    python benchmark.py compare base.json relatorio.json --tolerancia 0.15
+"""
+import argparse
+import gc
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+from bellman_ford import bellman_ford_generator, bellman_ford_vetorizado, bellman_ford_vetorizado_generator
+from astar import alt_generator, astar_generator
+from bfs import bfs_bidirecional_generator, bfs_generator
+from dfs import detecting_ciclo_generator
+from dijkstra import (dijkstra_bidirecional_generator, dijkstra_distancias, dijkstra_generator,
+                      dijkstra_heap_generator)
+from instrumentacao import Medidor
+from mst import mst_kruskal_generator, mst_prim_generator, mst_prim_heap_generator
+from queries import bfs_levels
+from synthetic_maps import GERADORES
+
+
+class Algoritmo(NamedTuple):
+    nome: str
+    gerador: Callable          # (grafo, origem, destino, medidor=None) -> gerador de eventos (delta=True)
+    resultado: Optional[Callable]  # (grafo, origem, destino) -> resultado sem eventos; None = drenar sem guardar
+    limite: int                # maior n testado (variantes quadráticas ficam de fora em mapas grandes)
+    dirigido: bool = False
+
+
+ALGORITMOS: List[Algoritmo] = [
+    Algoritmo("bfs", lambda g, o, d, **kw: bfs_generator(g, o, delta=True, **kw), lambda g, o, d: bfs_levels(g, [o]), 10**6),
+    Algoritmo("dijkstra", lambda g, o, d, **kw: dijkstra_generator(g, o, d, delta=True, **kw), None, 2_000),
+    Algoritmo("dijkstra_heap", lambda g, o, d, **kw: dijkstra_heap_generator(g, o, d, delta=True, **kw),
+              lambda g, o, d: dijkstra_distancias(g, o), 10**6),
+    Algoritmo("bfs_bidirecional", lambda g, o, d, **kw: bfs_bidirecional_generator(g, o, d, delta=True, **kw), None, 10**6),
+    Algoritmo("dijkstra_bidirecional", lambda g, o, d, **kw: dijkstra_bidirecional_generator(g, o, d, delta=True, **kw),
+              None, 10**6),
+    Algoritmo("astar", lambda g, o, d, **kw: astar_generator(g, o, d, delta=True, **kw), None, 10**6),
+    Algoritmo("alt", lambda g, o, d, **kw: alt_generator(g, o, d, delta=True, **kw), None, 10**6),
+    Algoritmo("dfs_ciclos", lambda g, o, d, **kw: detecting_ciclo_generator(g, delta=True, **kw), None, 10**6, dirigido=True),
+    Algoritmo("bellman_ford", lambda g, o, d, **kw: bellman_ford_generator(g, o, d, delta=True, **kw), None, 10_000),
+    Algoritmo("bellman_ford_lote", lambda g, o, d, **kw: bellman_ford_vetorizado_generator(g, o, d, delta=True, **kw),
+              lambda g, o, d: bellman_ford_vetorizado(g, o), 100_000),
+    Algoritmo("mst_prim", lambda g, o, d, **kw: mst_prim_generator(g, o, delta=True, **kw), None, 5_000),
+    Algoritmo("mst_prim_heap", lambda g, o, d, **kw: mst_prim_heap_generator(g, o, delta=True, **kw), None, 10**6),
+    Algoritmo("mst_kruskal", lambda g, o, d, **kw: mst_kruskal_generator(g, delta=True, **kw), None, 10**6),
+]
+
+
+def _drenar(gen) -> int:
+    """Consome o gerador guardando os eventos (como a UI/linha do tempo faria)."""
+    return len(list(gen))
+
+
+def _so_resultado(gen) -> int:
+    for _ in gen:
+        pass
+    return 0
+
+
+def _medir(funcao: Callable[[], int], repeticoes: int, memoria: bool) -> Dict[str, float]:
+    tempos = []
+    eventos = 0
+    for _ in range(repeticoes):
+        gc.collect()
+        t0 = time.perf_counter()
+        eventos = funcao()
+        tempos.append(time.perf_counter() - t0)
+    medida = {"segundos": min(tempos), "eventos": eventos}
+    if memoria:
+        gc.collect()
+        tracemalloc.start()
+        funcao()
+        medida["pico_bytes"] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return medida
+
+
+def _contar(alg: Algoritmo, grafo, origem: str, destino: str) -> Dict[str, int]:
+    """Execução extra, fora da medida de tempo, só para as contagens de operações."""
+    medidor = Medidor(alg.nome)
+    _so_resultado(alg.gerador(grafo, origem, destino, medidor=medidor))
+    return dict(medidor.contagens)
+
+
+def executar(tamanhos: List[int], geradores: List[str], algoritmos: List[str], modos: List[str],
+             seed: int, repeticoes: int, memoria: bool, contadores: bool = False) -> dict:
+    resultados = []
+    for nome_gerador in geradores:
+        for n in tamanhos:
+            mapas = {}
+            for alg in ALGORITMOS:
+                if alg.nome not in algoritmos:
+                    continue
+                base = {"gerador": nome_gerador, "n": n, "algoritmo": alg.nome}
+                if n > alg.limite:
+                    for modo in modos:
+                        resultados.append({**base, "modo": modo, "pulado": True})
+                    continue
+                if alg.dirigido not in mapas:
+                    t0 = time.perf_counter()
+                    mapas[alg.dirigido] = GERADORES[nome_gerador](n, seed=seed, dirigido=alg.dirigido)
+                    print(f"[{nome_gerador} n={n}{' dirigido' if alg.dirigido else ''}] "
+                          f"construído em {time.perf_counter() - t0:.2f}s", file=sys.stderr)
+                grafo = mapas[alg.dirigido]
+                origem, destino = "P0", f"P{n - 1}"
+                num_arestas = sum(1 for _ in grafo.arestas())
+                for modo in modos:
+                    if modo == "eventos":
+                        funcao = lambda: _drenar(alg.gerador(grafo, origem, destino))
+                    elif alg.resultado is not None:
+                        funcao = lambda: (alg.resultado(grafo, origem, destino), 0)[1]
+                    else:
+                        funcao = lambda: _so_resultado(alg.gerador(grafo, origem, destino))
+                    medida = _medir(funcao, repeticoes, memoria)
+                    if contadores and modo == "eventos":
+                        medida["contagens"] = _contar(alg, grafo, origem, destino)
+                    resultados.append({**base, "modo": modo, "arestas": num_arestas, **medida})
+                    print(f"  {alg.nome:<18} {modo:<9} {medida['segundos']:.4f}s", file=sys.stderr)
+            del mapas
+    return {
+        "meta": {
+            "seed": seed, "repeticoes": repeticoes, "python": platform.python_version(),
+            "plataforma": platform.platform(), "data": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "resultados": resultados,
+    }
+
+
+def comparar(base: dict, novo: dict, tolerancia: float, minimo_segundos: float = 0.005) -> List[str]:
+    """
+    Lista as regressões de tempo (e de memória, quando medida) acima da tolerância relativa.
+    Medidas abaixo de minimo_segundos nos dois relatórios são ruído e ficam de fora.
+    """
+    chave = lambda r: (r["gerador"], r["n"], r["algoritmo"], r["modo"])
+    anteriores = {chave(r): r for r in base["resultados"] if not r.get("pulado")}
+    regressoes = []
+    for r in novo["resultados"]:
+        if r.get("pulado") or chave(r) not in anteriores:
+            continue
+        a = anteriores[chave(r)]
+        for campo in ("segundos", "pico_bytes"):
+            if campo in r and a.get(campo):
+                if campo == "segundos" and max(r[campo], a[campo]) < minimo_segundos:
+                    continue
+                razao = r[campo] / a[campo]
+                if razao > 1 + tolerancia:
+                    regressoes.append(f"{'/'.join(map(str, chave(r)))}: {campo} {a[campo]:.4g} -> {r[campo]:.4g} ({razao:.2f}x)")
+    return regressoes
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark dos algoritmos em galáxias sintéticas.")
+    sub = parser.add_subparsers(dest="comando", required=True)
+
+    run = sub.add_parser("run", help="Executa o benchmark e grava o relatório JSON.")
+    run.add_argument("--tamanhos", type=int, nargs="+", default=[1000, 10000])
+    run.add_argument("--geradores", nargs="+", default=list(GERADORES), choices=list(GERADORES))
+    run.add_argument("--algoritmos", nargs="+", default=[a.nome for a in ALGORITMOS], choices=[a.nome for a in ALGORITMOS])
+    run.add_argument("--modos", nargs="+", default=["eventos", "resultado"], choices=["eventos", "resultado"])
+    run.add_argument("--seed", type=int, default=42)
+    run.add_argument("--repeticoes", type=int, default=1)
+    run.add_argument("--sem-memoria", action="store_true", help="Não mede o pico com tracemalloc.")
+    run.add_argument("--contadores", action="store_true",
+                     help="Inclui as contagens de operações (instrumentacao.Medidor) de cada algoritmo no modo eventos.")
+    run.add_argument("--saida", default="bench_output.json")
+
+    cmp_ = sub.add_parser("compare", help="Compara um relatório com uma base salva.")
+    cmp_.add_argument("base")
+    cmp_.add_argument("novo")
+    cmp_.add_argument("--tolerancia", type=float, default=0.15)
+    cmp_.add_argument("--minimo-segundos", type=float, default=0.005)
+
+    args = parser.parse_args(argv)
+    if args.comando == "run":
+        relatorio = executar(args.tamanhos, args.geradores, args.algoritmos, args.modos,
+                             args.seed, args.repeticoes, not args.sem_memoria, args.contadores)
+        with open(args.saida, "w", encoding="utf-8") as f:
+            json.dump(relatorio, f, indent=2, ensure_ascii=False)
+        print(f"Relatório gravado em {args.saida}", file=sys.stderr)
+        return 0
+
+    with open(args.base, encoding="utf-8") as f:
+        base = json.load(f)
+    with open(args.novo, encoding="utf-8") as f:
+        novo = json.load(f)
+    regressoes = comparar(base, novo, args.tolerancia, args.minimo_segundos)
+    for linha in regressoes:
+        print("REGRESSÃO", linha)
+    if not regressoes:
+        print("Nenhuma regressão acima da tolerância.")
+    return 1 if regressoes else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,30 +1,110 @@
+import math
 from collections import deque
-from typing import Generator, Set
+from typing import Dict, Generator, List, Optional, Set, Tuple
 
-def bfs_generator(grafo, origem: str) -> Generator[dict, None, Set[str]]:
+from dijkstra import vizinhos_reversos_de
+from eventos import SUFIXO_REVERSO
+
+def bfs_generator(grafo, origem: str, delta: bool = False, medidor=None) -> Generator[dict, None, Set[str]]:
     """
     Algoritmo BFS (Busca em Largura) para a Fase 1.
     Recebe:
         grafo: Instância de MapaGalactico
         origem: Nome do planeta inicial
+        delta: Se True, eventos trazem só "mudancas" em vez de cópias de visitados
+        medidor: instrumentacao.Medidor opcional (contagens de operações)
     """
     visitados: Set[str] = set()
     fila = deque([origem])
     visitados.add(origem)
     nivel = {origem: 0}
     
-    yield {"tipo": "msg", "texto": f"Iniciando Protocolo de Disseminação Democrática a partir de {origem}!"}
+    inicio = {"tipo": "msg", "texto": f"Iniciando Protocolo de Disseminação Democrática a partir de {origem}!"}
+    if delta: inicio["mudancas"] = [("visitados", origem, False, True)]
+    yield inicio
     
     while fila:
         u = fila.popleft()
-        yield {"tipo": "bfs_visit", "u": u, "nivel": nivel[u], "visitados": set(visitados)}
+        if medidor: medidor.conta("desenfileiramentos")
+        ev = {"tipo": "bfs_visit", "u": u, "nivel": nivel[u]}
+        if not delta: ev["visitados"] = set(visitados)
+        yield ev
 
         for v, _ in grafo.vizinhos(u):
+            if medidor: medidor.conta("arestas_examinadas")
             if v not in visitados:
                 visitados.add(v)
                 nivel[v] = nivel[u] + 1
                 fila.append(v)
-                yield {"tipo": "bfs_enfileira", "de": u, "para": v, "nivel": nivel[v], "visitados": set(visitados)}
+                if medidor: medidor.conta("enfileiramentos")
+                ev = {"tipo": "bfs_enfileira", "de": u, "para": v, "nivel": nivel[v]}
+                if delta: ev["mudancas"] = [("visitados", v, False, True)]
+                else: ev["visitados"] = set(visitados)
+                yield ev
                 
     yield {"tipo": "msg", "texto": "Todos os planetas alcançáveis foram assegurados!"}
-    return visitados
\ No newline at end of file
+    return visitados
+
+def bfs_bidirecional_generator(grafo, origem: str, destino: str, delta: bool = False, medidor=None
+                               ) -> Generator[dict, None, List[str]]:
+    """
+    BFS bidirecional entre origem e destino, em camadas: a cada rodada expande
+    a camada inteira do lado com a fronteira menor (o de trás usa
+    vizinhos_reversos; mapas dirigidos sem esse índice levantam TypeError).
+    Terminada a camada em que os lados se tocam, o menor caminho entre os
+    encontros dela é o mínimo global.
+    Eventos do lado reverso têm sufixo _reversa; o caminho sai num djk_fim
+    com custo = número de saltos.
+    """
+    reverso = vizinhos_reversos_de(grafo)
+    niveis: Tuple[Dict[str, int], Dict[str, int]] = ({origem: 0}, {destino: 0})
+    pais: Tuple[Dict[str, Optional[str]], Dict[str, Optional[str]]] = ({origem: None}, {destino: None})
+    fronteiras: List[List[str]] = [[origem], [destino]]
+    sufixos = ("", SUFIXO_REVERSO)
+
+    inicio = {"tipo": "msg", "texto": f"Iniciando BFS Bidirecional entre {origem} e {destino}..."}
+    if delta: inicio["mudancas"] = [("visitados", origem, False, True), ("visitados" + SUFIXO_REVERSO, destino, False, True)]
+    yield inicio
+
+    melhor: Optional[Tuple[int, str, str]] = (0, origem, destino) if origem == destino else None  # (saltos, u, v) de u->v
+    while melhor is None and fronteiras[0] and fronteiras[1]:
+        lado = 0 if len(fronteiras[0]) <= len(fronteiras[1]) else 1
+        nivel, pai, outro, sufixo = niveis[lado], pais[lado], niveis[1 - lado], sufixos[lado]
+        vizinhos = grafo.vizinhos if lado == 0 else reverso
+        proxima: List[str] = []
+        for u in fronteiras[lado]:
+            if medidor: medidor.conta("desenfileiramentos")
+            ev = {"tipo": "bfs_visit" + sufixo, "u": u, "nivel": nivel[u]}
+            if not delta: ev["visitados" + sufixo] = set(nivel)
+            yield ev
+            for v, _ in vizinhos(u):
+                if medidor: medidor.conta("arestas_examinadas")
+                if v in outro:
+                    saltos = nivel[u] + 1 + outro[v]
+                    if melhor is None or saltos < melhor[0]:
+                        melhor = (saltos, u, v) if lado == 0 else (saltos, v, u)
+                if v not in nivel:
+                    nivel[v] = nivel[u] + 1
+                    pai[v] = u
+                    proxima.append(v)
+                    if medidor: medidor.conta("enfileiramentos")
+                    ev = {"tipo": "bfs_enfileira" + sufixo, "de": u, "para": v, "nivel": nivel[v]}
+                    if delta: ev["mudancas"] = [("visitados" + sufixo, v, False, True)]
+                    else: ev["visitados" + sufixo] = set(nivel)
+                    yield ev
+        fronteiras[lado] = proxima
+
+    caminho: List[str] = []
+    if melhor is not None:
+        _, u, v = melhor
+        while u is not None:
+            caminho.append(u)
+            u = pais[0][u]
+        caminho.reverse()
+        if v != caminho[-1]:
+            while v is not None:
+                caminho.append(v)
+                v = pais[1][v]
+    yield {"tipo": "msg", "texto": f"Bidirecional: {len(niveis[0]) + len(niveis[1])} de {len(grafo.planetas)} planetas alcançados."}
+    yield {"tipo": "djk_fim", "caminho": list(caminho), "custo": float(len(caminho) - 1) if caminho else math.inf}
+    return caminho
@@ -0,0 +1,115 @@
+import math
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from config import (ZOOM_MIN, ZOOM_MAX, ZOOM_ROTULOS, ZOOM_AGREGACAO,
+                    TAM_AGREGADO_PX, MAX_PLANETAS_DETALHADOS)
+
+# Níveis de detalhe (LOD), do mais barato ao mais completo.
+DETALHE_AGREGADO = 0   # planetas agrupados por célula de tela, rotas desbastadas
+DETALHE_SIMPLES = 1    # todos os planetas e rotas, sem nomes nem pesos
+DETALHE_COMPLETO = 2   # como antes da câmera: nomes, pesos e setas
+
+
+class Camera:
+    """
+    Pan/zoom sobre as coordenadas de mundo (Planeta.pos).
+    (x, y) é o ponto de mundo no canto superior esquerdo da tela; zoom é
+    pixels de tela por unidade de mundo. Com zoom 1 e origem (0, 0) a tela
+    coincide com o mundo, que é o enquadramento dos mapas das fases.
+    """
+    def __init__(self, largura: int, altura: int):
+        self.largura = largura
+        self.altura = altura
+        self.x = 0.0
+        self.y = 0.0
+        self.zoom = 1.0
+
+    def estado(self) -> Tuple[float, float, float]:
+        """Chave da câmera para caches de renderização."""
+        return (self.x, self.y, self.zoom)
+
+    def resetar(self) -> None:
+        self.x = self.y = 0.0
+        self.zoom = 1.0
+
+    # ---------------------------------------------------------------- transformações
+    def para_tela(self, pos: Tuple[float, float]) -> Tuple[int, int]:
+        return (int((pos[0] - self.x) * self.zoom), int((pos[1] - self.y) * self.zoom))
+
+    def para_mundo(self, pos: Tuple[float, float]) -> Tuple[float, float]:
+        return (self.x + pos[0] / self.zoom, self.y + pos[1] / self.zoom)
+
+    def retangulo_mundo(self, margem_px: float = 0) -> Tuple[float, float, float, float]:
+        """Viewport em coordenadas de mundo (x0, y0, x1, y1), com margem em pixels de tela."""
+        m = margem_px / self.zoom
+        return (self.x - m, self.y - m,
+                self.x + self.largura / self.zoom + m, self.y + self.altura / self.zoom + m)
+
+    def escala(self, px: float, minimo: int = 1) -> int:
+        """Tamanho de tela de algo que mede px no zoom 1 (raios, espessuras)."""
+        return max(minimo, int(round(px * self.zoom)))
+
+    # ---------------------------------------------------------------- controle
+    def arrastar(self, dx: float, dy: float) -> None:
+        """Move a vista acompanhando um arrasto de (dx, dy) pixels de tela."""
+        self.x -= dx / self.zoom
+        self.y -= dy / self.zoom
+
+    def zoom_em(self, fator: float, ponto_tela: Tuple[float, float]) -> None:
+        """Multiplica o zoom mantendo fixo o ponto de mundo sob ponto_tela (o cursor)."""
+        mx, my = self.para_mundo(ponto_tela)
+        self.zoom = min(ZOOM_MAX, max(ZOOM_MIN, self.zoom * fator))
+        self.x = mx - ponto_tela[0] / self.zoom
+        self.y = my - ponto_tela[1] / self.zoom
+
+    def enquadrar(self, caixa: Optional[Tuple[float, float, float, float]], margem_px: float = 40) -> None:
+        """Ajusta zoom e posição para que a caixa de mundo (x0, y0, x1, y1) caiba na tela."""
+        if caixa is None:
+            self.resetar(); return
+        x0, y0, x1, y1 = caixa
+        w, h = max(x1 - x0, 1.0), max(y1 - y0, 1.0)
+        zoom = min((self.largura - 2 * margem_px) / w, (self.altura - 2 * margem_px) / h)
+        self.zoom = min(ZOOM_MAX, max(ZOOM_MIN, zoom))
+        self.x = (x0 + x1) / 2 - self.largura / (2 * self.zoom)
+        self.y = (y0 + y1) / 2 - self.altura / (2 * self.zoom)
+
+    def nivel_detalhe(self, planetas_visiveis: int) -> int:
+        """LOD pelo zoom; muitos planetas visíveis forçam a agregação mesmo de perto."""
+        if self.zoom < ZOOM_AGREGACAO or planetas_visiveis > MAX_PLANETAS_DETALHADOS:
+            return DETALHE_AGREGADO
+        if self.zoom < ZOOM_ROTULOS:
+            return DETALHE_SIMPLES
+        return DETALHE_COMPLETO
+
+
+def agrupar_planetas(camera: Camera, nomes: Iterable[str], pos: Dict[str, Tuple[float, float]],
+                     tam_px: int = TAM_AGREGADO_PX) -> Dict[Tuple[int, int], List[str]]:
+    """Agrupa planetas pela célula de tela (tam_px x tam_px) em que caem."""
+    grupos: Dict[Tuple[int, int], List[str]] = {}
+    for nome in nomes:
+        sx, sy = camera.para_tela(pos[nome])
+        grupos.setdefault((sx // tam_px, sy // tam_px), []).append(nome)
+    return grupos
+
+
+def desbastar_rotas(camera: Camera, rotas: Iterable, pos: Dict[str, Tuple[float, float]],
+                    tam_px: int = TAM_AGREGADO_PX) -> Dict[Tuple[Tuple[int, int], Tuple[int, int]], bool]:
+    """
+    Uma linha por par de células de tela distintas (rotas internas a um agrupamento
+    somem). Valor: se ao menos uma rota do par está ativa.
+    """
+    pares: Dict[Tuple[Tuple[int, int], Tuple[int, int]], bool] = {}
+    for e in rotas:
+        ax, ay = camera.para_tela(pos[e.u])
+        bx, by = camera.para_tela(pos[e.v])
+        a, b = (ax // tam_px, ay // tam_px), (bx // tam_px, by // tam_px)
+        if a == b:
+            continue
+        par = (a, b) if a <= b else (b, a)
+        pares[par] = pares.get(par, False) or e.ativa
+    return pares
+
+
+def raio_agregado(quantidade: int, tam_px: int = TAM_AGREGADO_PX) -> int:
+    """Raio do glifo de um agrupamento: cresce com log2 da quantidade, limitado à célula."""
+    return min(tam_px // 2, 3 + int(2 * math.log2(max(quantidade, 1))))
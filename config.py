@@ -1,6 +1,16 @@
 LARGURA, ALTURA = 1280, 720
 RAIO_PLANETA = 20
 FPS = 60
+ORCAMENTO_TURBO_MS = 4  # tempo por quadro gasto avançando o algoritmo no modo turbo
+INTERVALO_CHECKPOINT = 256  # eventos entre estados completos guardados na linha do tempo
+TAM_FILA_EVENTOS = 256  # eventos em trânsito entre o Trabalhador e a UI (contrapressão acima disso)
+# Fonte TTF distribuída com o jogo; se existir, dispensa a busca de fontes do sistema (fontes.py).
+FONTE_EMBUTIDA = "assets/fonte.ttf"
+NUM_MARCOS = 4  # planetas-marco da busca ALT (astar.Marcos): 2 buscas completas por marco em mapas dirigidos
+DIR_MEDICOES = "medicoes"  # destino da exportação JSON/CSV dos contadores ([X], instrumentacao.py)
+JANELA_PERFIL_QUADROS = 300  # quadros usados nos percentis do perfil de quadros (perfil_quadros.py)
+MAX_EVENTOS_TRACE = 1_000_000  # limite de etapas gravadas num Chrome trace (~150 MB de JSON)
+TAM_CACHE_TEXTO = 512  # superfícies de texto guardadas pelo UIManager (LRU)
 
 CORES_FACCAO = {
     "Aliança": (90, 180, 255),      
@@ -22,4 +32,10 @@ COR_PAINEL = (28, 30, 36, 230)
 CYAN_NEON = (0, 255, 255)       
 MAGENTA_NEON = (255, 0, 255)    
 LARANJA_VIVO = (255, 100, 0)  
-VERDE_NEON = (50, 255, 50)      
\ No newline at end of file
+VERDE_NEON = (50, 255, 50)      
+# Câmera e nível de detalhe (camera.py)
+ZOOM_MIN, ZOOM_MAX = 0.02, 4.0
+ZOOM_ROTULOS = 0.6             # abaixo disso some o texto (nomes e pesos)
+ZOOM_AGREGACAO = 0.3           # abaixo disso planetas próximos viram um glifo agregado
+TAM_AGREGADO_PX = 24           # lado da célula de tela usada na agregação
+MAX_PLANETAS_DETALHADOS = 2000 # acima disso (visíveis) agrega mesmo com zoom alto
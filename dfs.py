@@ -1,50 +1,74 @@
-from typing import Generator, List, Dict, Optional
+from typing import Generator, Iterator, List, Dict, Optional, Tuple
 
-def detecting_ciclo_generator(grafo) -> Generator[dict, None, Optional[List[str]]]:
+def detecting_ciclo_generator(grafo, delta: bool = False, medidor=None) -> Generator[dict, None, Optional[List[str]]]:
     """
     Algoritmo DFS para detecção de ciclos (Fase 3).
+    Versão iterativa: uma pilha explícita de (planeta, iterador de vizinhos)
+    substitui a recursão, então cada evento custa O(1) e caminhos muito
+    profundos não esbarram no limite de recursão do Python.
     Recebe:
         grafo: Instância de MapaGalactico
+        delta: Se True, eventos trazem só "mudancas" em vez de cópias de cor
+               (necessário para tempo linear: a cópia de cor é O(V) por evento)
+        medidor: instrumentacao.Medidor opcional (contagens de operações)
     """
     cor: Dict[str, int] = {p: 0 for p in grafo.planetas} 
     pai: Dict[str, Optional[str]] = {p: None for p in grafo.planetas}
     achou: Optional[List[str]] = None
 
-    def dfs(u: str) -> Generator[dict, None, bool]:
-        nonlocal achou
+    def entrar(u: str) -> dict:
         cor[u] = 1
-        yield {"tipo": "dfs_enter", "u": u, "cor": dict(cor)}
-        
-        for v, _ in grafo.vizinhos(u):
-            if cor[v] == 0:
-                pai[v] = u
-                yield {"tipo": "dfs_tree", "de": u, "para": v}
-                if (yield from dfs(v)):
-                    return True
-            elif cor[v] == 1:
-                yield {"tipo": "dfs_backedge", "de": u, "para": v}
-                ciclo = [v, u]
-                x = u
-                while pai[x] is not None and pai[x] != v:
-                    x = pai[x]
-                    ciclo.append(x)
-                ciclo.reverse()
-                achou = ciclo
-                return True
-                
-        cor[u] = 2 
-        yield {"tipo": "dfs_exit", "u": u, "cor": dict(cor)}
-        return False
+        if delta: return {"tipo": "dfs_enter", "u": u, "mudancas": [("cor", u, 0, 1)]}
+        return {"tipo": "dfs_enter", "u": u, "cor": dict(cor)}
+
+    def sair(u: str) -> dict:
+        cor[u] = 2
+        if delta: return {"tipo": "dfs_exit", "u": u, "mudancas": [("cor", u, 1, 2)]}
+        return {"tipo": "dfs_exit", "u": u, "cor": dict(cor)}
 
     yield {"tipo": "msg", "texto": "Varredura psíquica iniciada. Procurando paradoxos de rota..."}
     
     for s in grafo.planetas:
-        if cor[s] == 0:
-            if (yield from dfs(s)):
+        if cor[s] != 0:
+            continue
+        yield entrar(s)
+        if medidor: medidor.conta("empilhamentos")
+        pilha: List[Tuple[str, Iterator[Tuple[str, float]]]] = [(s, iter(grafo.vizinhos(s)))]
+
+        while pilha:
+            u, it = pilha[-1]
+            for v, _ in it:
+                if medidor: medidor.conta("arestas_examinadas")
+                if cor[v] == 0:
+                    pai[v] = u
+                    yield {"tipo": "dfs_tree", "de": u, "para": v}
+                    yield entrar(v)
+                    pilha.append((v, iter(grafo.vizinhos(v))))
+                    if medidor: medidor.conta("empilhamentos")
+                    break
+                elif cor[v] == 1:
+                    if medidor: medidor.conta("arestas_de_retorno")
+                    yield {"tipo": "dfs_backedge", "de": u, "para": v}
+                    ciclo = [v, u]
+                    x = u
+                    while pai[x] is not None and pai[x] != v:
+                        x = pai[x]
+                        ciclo.append(x)
+                    ciclo.reverse()
+                    achou = ciclo
+                    break
+            else:
+                pilha.pop()
+                if medidor: medidor.conta("desempilhamentos")
+                yield sair(u)
+                continue
+            if achou:
                 break
+        if achou:
+            break
                 
     if achou:
         yield {"tipo": "ciclo_encontrado", "ciclo": list(achou)}
     else:
         yield {"tipo": "msg", "texto": "Nenhum circuito psíquico detectado."}
-    return achou
\ No newline at end of file
+    return achou
@@ -1,10 +1,15 @@
 import math
-from typing import Generator, List, Tuple, Dict, Optional, Set
+import heapq
+from typing import Generator, List, Tuple, Dict, Optional, Set, Union
 
-def dijkstra_generator(grafo, origem: str, destino: str) -> Generator[dict, None, Tuple[List[str], float]]:
+from eventos import SUFIXO_REVERSO, evento_relax, evento_visita
+
+def dijkstra_generator(grafo, origem: str, destino: str, delta: bool = False, medidor=None) -> Generator[dict, None, Tuple[List[str], float]]:
     """
     Algoritmo de Dijkstra.
     Usa busca linear para encontrar o nó de menor distância.
+    Com delta=True os eventos trazem só "mudancas" (ver eventos.EstadoAcumulado).
+    medidor: instrumentacao.Medidor opcional (contagens de operações).
     """
     dist: Dict[str, float] = {p: math.inf for p in grafo.planetas}
     prev: Dict[str, Optional[str]] = {p: None for p in grafo.planetas}
@@ -12,7 +17,9 @@ def dijkstra_generator(grafo, origem: str, destino: str) -> Generator[dict, None
     
     nao_visitados = set(grafo.planetas.keys())
     
-    yield {"tipo": "msg", "texto": f"Iniciando Dijkstra (Modo Manual). Calculando rotas de {origem}..."}
+    inicio = {"tipo": "msg", "texto": f"Iniciando Dijkstra (Modo Manual). Calculando rotas de {origem}..."}
+    if delta: inicio["mudancas"] = [("dist", origem, math.inf, 0.0)]
+    yield inicio
     
     while nao_visitados:
         u = None
@@ -22,25 +29,229 @@ def dijkstra_generator(grafo, origem: str, destino: str) -> Generator[dict, None
             if dist[node] < menor_dist:
                 menor_dist = dist[node]
                 u = node
+        if medidor: medidor.conta("varredura_minimo", len(nao_visitados))
         
         if u is None or dist[u] == math.inf:
             break
             
         nao_visitados.remove(u)
-        yield {"tipo": "djk_visita", "u": u, "dist": dict(dist), "prev": dict(prev)}
+        yield evento_visita(u, dist, prev, delta)
         
         if u == destino:
             break
             
         for v, w in grafo.vizinhos(u):
+            if medidor: medidor.conta("arestas_examinadas")
             if v in nao_visitados:
                 alt = dist[u] + w
                 if alt < dist[v]:
+                    if medidor: medidor.conta("relaxamentos")
+                    ev = evento_relax("djk_relax", u, v, alt, dist, prev, delta)
                     dist[v] = alt
                     prev[v] = u
                     
-                    yield {"tipo": "djk_relax", "de": u, "para": v, "nova_dist": dist[v], "prev": dict(prev)}
+                    yield ev
     
+    caminho = reconstruir_caminho(prev, dist, destino)
+        
+    yield {"tipo": "djk_fim", "caminho": list(caminho), "custo": float(dist[destino])}
+    return (caminho, dist[destino])
+
+def dijkstra_heap_generator(grafo, origem: str, destino: Optional[str] = None, delta: bool = False, medidor=None
+                            ) -> Generator[dict, None, Union[Tuple[List[str], float], Tuple[Dict[str, float], Dict[str, Optional[str]]]]]:
+    """
+    Algoritmo de Dijkstra com fila de prioridade (heapq com remoção preguiçosa).
+    Entradas obsoletas do heap são descartadas ao serem retiradas: O((V + E) log V).
+    Com destino, para assim que ele é fixado e retorna (caminho, custo).
+    Sem destino, percorre tudo e retorna os mapas completos (dist, prev).
+    medidor: instrumentacao.Medidor opcional (contagens de operações).
+    """
+    dist: Dict[str, float] = {p: math.inf for p in grafo.planetas}
+    prev: Dict[str, Optional[str]] = {p: None for p in grafo.planetas}
+    dist[origem] = 0.0
+
+    fixados: Set[str] = set()
+    heap: List[Tuple[float, str]] = [(0.0, origem)]
+
+    inicio = {"tipo": "msg", "texto": f"Iniciando Dijkstra (Fila de Prioridade). Calculando rotas de {origem}..."}
+    if delta: inicio["mudancas"] = [("dist", origem, math.inf, 0.0)]
+    yield inicio
+
+    while heap:
+        d, u = heapq.heappop(heap)
+        if medidor: medidor.conta("heap_pop")
+        if u in fixados or d > dist[u]:
+            if medidor: medidor.conta("heap_obsoletos")
+            continue
+
+        fixados.add(u)
+        yield evento_visita(u, dist, prev, delta)
+
+        if u == destino:
+            break
+
+        for v, w in grafo.vizinhos(u):
+            if medidor: medidor.conta("arestas_examinadas")
+            if v in fixados:
+                continue
+            alt = d + w
+            if alt < dist[v]:
+                ev = evento_relax("djk_relax", u, v, alt, dist, prev, delta)
+                dist[v] = alt
+                prev[v] = u
+                heapq.heappush(heap, (alt, v))
+                if medidor: medidor.conta("relaxamentos"); medidor.conta("heap_push")
+
+                yield ev
+
+    if destino is None:
+        fim = {"tipo": "djk_fim", "caminho": []}
+        if not delta: fim.update(dist=dict(dist), prev=dict(prev))
+        yield fim
+        return (dist, prev)
+
+    caminho = reconstruir_caminho(prev, dist, destino)
+    yield {"tipo": "djk_fim", "caminho": list(caminho), "custo": float(dist[destino])}
+    return (caminho, dist[destino])
+
+def dijkstra_bidirecional_generator(grafo, origem: str, destino: str, delta: bool = False, medidor=None
+                                    ) -> Generator[dict, None, Tuple[List[str], float]]:
+    """
+    Dijkstra bidirecional: uma busca parte de origem e outra de destino pelas
+    arestas invertidas (vizinhos_reversos; mapas dirigidos sem esse índice
+    levantam TypeError). A cada passo avança o lado com menos entradas no heap.
+    mu guarda o melhor caminho visto ao cruzar uma aresta entre os dois lados;
+    a busca para quando topo_frente + topo_tras >= mu, pois nenhum caminho
+    ainda não visto pode ser mais curto. Eventos do lado reverso têm sufixo
+    _reversa e mudanças em dist_reversa/prev_reversa (prev_reversa[v] = próximo passo).
+    """
+    reverso = vizinhos_reversos_de(grafo)
+    lados = []
+    for raiz, vizinhos, sufixo in ((origem, grafo.vizinhos, ""), (destino, reverso, SUFIXO_REVERSO)):
+        dist: Dict[str, float] = {p: math.inf for p in grafo.planetas}
+        prev: Dict[str, Optional[str]] = {p: None for p in grafo.planetas}
+        dist[raiz] = 0.0
+        lados.append((dist, prev, set(), [(0.0, raiz)], vizinhos, sufixo))
+
+    mu = 0.0 if origem == destino else math.inf
+    encontro: Optional[Tuple[str, str]] = (origem, destino) if origem == destino else None  # aresta (u, v) do melhor caminho
+
+    inicio = {"tipo": "msg", "texto": f"Iniciando Dijkstra Bidirecional entre {origem} e {destino}..."}
+    if delta: inicio["mudancas"] = [("dist", origem, math.inf, 0.0), ("dist" + SUFIXO_REVERSO, destino, math.inf, 0.0)]
+    yield inicio
+
+    while True:
+        topos = [_topo(heap, dist, fixados) for dist, _, fixados, heap, _, _ in lados]
+        if topos[0] == math.inf or topos[1] == math.inf or topos[0] + topos[1] >= mu:
+            break
+        lado = 0 if len(lados[0][3]) <= len(lados[1][3]) else 1
+        dist, prev, fixados, heap, vizinhos, sufixo = lados[lado]
+        dist_outro = lados[1 - lado][0]
+
+        d, u = heapq.heappop(heap)
+        if medidor: medidor.conta("heap_pop")
+        fixados.add(u)
+        yield evento_visita(u, dist, prev, delta, sufixo)
+
+        for v, w in vizinhos(u):
+            if medidor: medidor.conta("arestas_examinadas")
+            if v in fixados:
+                continue
+            alt = d + w
+            if alt < dist[v]:
+                ev = evento_relax("djk_relax" + sufixo, u, v, alt, dist, prev, delta, sufixo)
+                dist[v] = alt
+                prev[v] = u
+                heapq.heappush(heap, (alt, v))
+                if medidor: medidor.conta("relaxamentos"); medidor.conta("heap_push")
+                yield ev
+            if alt + dist_outro[v] < mu:
+                mu = alt + dist_outro[v]
+                encontro = (u, v) if lado == 0 else (v, u)
+
+    fixados_total = len(lados[0][2]) + len(lados[1][2])
+    caminho: List[str] = []
+    if encontro is not None:
+        (_, prev_f, *_), (_, prev_b, *_) = lados
+        u, v = encontro
+        caminho = reconstruir_caminho(prev_f, lados[0][0], u)
+        while v is not None and (not caminho or caminho[-1] != v):
+            caminho.append(v)
+            v = prev_b[v]
+    yield {"tipo": "msg", "texto": f"Bidirecional: {fixados_total} de {len(grafo.planetas)} planetas fixados."}
+    yield {"tipo": "djk_fim", "caminho": list(caminho), "custo": float(mu)}
+    return (caminho, mu)
+
+def vizinhos_reversos_de(grafo):
+    """
+    vizinhos() do grafo transposto: grafo.vizinhos_reversos, ou o próprio
+    grafo.vizinhos num mapa sem rotas dirigidas. Mapas dirigidos sem índice
+    reverso levantam TypeError (o lado de trás andaria pelas arestas erradas).
+    """
+    if hasattr(grafo, "vizinhos_reversos"):
+        return grafo.vizinhos_reversos
+    if any(e.dirigida for e in grafo.rotas()):
+        raise TypeError("Mapa com rotas dirigidas sem vizinhos_reversos: a busca reversa seguiria as arestas erradas.")
+    return grafo.vizinhos
+
+def _topo(heap: List[Tuple[float, str]], dist: Dict[str, float], fixados: Set[str]) -> float:
+    """Menor distância ainda válida no heap (descarta entradas obsoletas); inf se vazio."""
+    while heap and (heap[0][1] in fixados or heap[0][0] > dist[heap[0][1]]):
+        heapq.heappop(heap)
+    return heap[0][0] if heap else math.inf
+
+def dijkstra_distancias(grafo, origem: str) -> Tuple[Dict[str, float], Dict[str, Optional[str]]]:
+    """
+    Dijkstra sem eventos (heapq): devolve só os mapas (dist, prev) a partir de origem.
+    Planetas inalcançáveis ficam fora dos mapas.
+    """
+    if hasattr(grafo, "vizinhos_ids"):
+        return _dijkstra_distancias_ids(grafo, origem)
+    dist: Dict[str, float] = {origem: 0.0}
+    prev: Dict[str, Optional[str]] = {origem: None}
+    fixados: Set[str] = set()
+    heap: List[Tuple[float, str]] = [(0.0, origem)]
+    while heap:
+        d, u = heapq.heappop(heap)
+        if u in fixados:
+            continue
+        fixados.add(u)
+        for v, w in grafo.vizinhos(u):
+            alt = d + w
+            if v not in fixados and alt < dist.get(v, math.inf):
+                dist[v] = alt
+                prev[v] = u
+                heapq.heappush(heap, (alt, v))
+    return dist, prev
+
+def _dijkstra_distancias_ids(grafo, origem: str) -> Tuple[Dict[str, float], Dict[str, Optional[str]]]:
+    """dijkstra_distancias sobre os ids inteiros de um MapaCompacto; só os alcançados voltam a ser nomes."""
+    n = len(grafo.nomes)
+    s = grafo.ids[origem]
+    dist = [math.inf] * n
+    prev = [-1] * n
+    fixado = bytearray(n)
+    ordem: List[int] = []
+    dist[s] = 0.0
+    heap: List[Tuple[float, int]] = [(0.0, s)]
+    vizinhos = grafo.vizinhos_ids
+    while heap:
+        d, u = heapq.heappop(heap)
+        if fixado[u]:
+            continue
+        fixado[u] = 1
+        ordem.append(u)
+        for v, w in vizinhos(u):
+            alt = d + w
+            if alt < dist[v] and not fixado[v]:
+                dist[v] = alt
+                prev[v] = u
+                heapq.heappush(heap, (alt, v))
+    nomes = grafo.nomes
+    return ({nomes[i]: dist[i] for i in ordem},
+            {nomes[i]: (nomes[prev[i]] if prev[i] >= 0 else None) for i in ordem})
+
+def reconstruir_caminho(prev: Dict[str, Optional[str]], dist: Dict[str, float], destino: str) -> List[str]:
     caminho: List[str] = []
     if dist[destino] < math.inf:
         cur: Optional[str] = destino
@@ -48,6 +259,4 @@ def dijkstra_generator(grafo, origem: str, destino: str) -> Generator[dict, None
             caminho.append(cur)
             cur = prev[cur]
         caminho.reverse()
-        
-    yield {"tipo": "djk_fim", "caminho": list(caminho), "custo": float(dist[destino])}
-    return (caminho, dist[destino])
\ No newline at end of file
+    return caminho
\ No newline at end of file
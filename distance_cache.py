@@ -0,0 +1,170 @@
+import math
+import os
+import shutil
+import tempfile
+import weakref
+from typing import Dict, List, Optional, Tuple
+
+from bellman_ford import bellman_ford_vetorizado
+from dijkstra import dijkstra_distancias
+
+try:
+    import numpy as np
+except ImportError:  # Sem NumPy: linhas em listas Python, sem Floyd–Warshall nem memmap.
+    np = None
+
+LIMITE_FLOYD = 400      # até aqui (planetas), preencher() usa Floyd–Warshall vetorizado
+LIMITE_MEMMAP = 4096    # acima disso, as linhas vão para arquivos memory-mapped
+
+
+class CacheDistancias:
+    """
+    Distâncias/predecessores entre todos os pares de um mapa.
+    Cada linha (uma origem) é calculada sob demanda com Dijkstra, ou Bellman-Ford
+    se houver pesos negativos. Mapas pequenos podem ser preenchidos de uma vez
+    com Floyd–Warshall; mapas grandes guardam as linhas em disco (np.memmap).
+    A cache se invalida sozinha quando mapa.versao muda (rota removida/adicionada).
+    Consultas a partir de uma origem que alcança um ciclo negativo levantam
+    ValueError, qualquer que seja o caminho de preenchimento.
+    """
+    def __init__(self, mapa, diretorio: Optional[str] = None):
+        self.mapa = mapa
+        self.diretorio = diretorio
+        self._versao = -1
+        self._tmp: Optional[str] = None
+        self._finalizador = None
+        self.consultas = 0
+        self.linhas_calculadas = 0
+
+    # ---------------------------------------------------------------- estado
+    def invalidar(self) -> None:
+        self._liberar_disco()
+        self.nomes: List[str] = list(self.mapa.planetas)
+        self.ids: Dict[str, int] = {nome: i for i, nome in enumerate(self.nomes)}
+        self._negativos = any(e.peso < 0 for e in self.mapa.arestas() if e.ativa)
+        n = len(self.nomes)
+        self._pronta = bytearray(n)
+        self._dist = None
+        self._prev = None
+        self._linhas: Dict[int, Tuple[List[float], List[int]]] = {}
+        if np is not None and n > LIMITE_MEMMAP:
+            self._tmp = tempfile.mkdtemp(prefix="dist_cache_", dir=self.diretorio)
+            self._finalizador = weakref.finalize(self, shutil.rmtree, self._tmp, True)
+            self._dist = np.memmap(os.path.join(self._tmp, "dist.f64"), dtype=np.float64, mode="w+", shape=(n, n))
+            self._prev = np.memmap(os.path.join(self._tmp, "prev.i32"), dtype=np.int32, mode="w+", shape=(n, n))
+        self._versao = self.mapa.versao
+
+    def _liberar_disco(self) -> None:
+        self._dist = self._prev = None
+        if self._finalizador is not None:
+            self._finalizador()
+            self._finalizador = None
+            self._tmp = None
+
+    def _em_dia(self) -> None:
+        if self._versao != self.mapa.versao:
+            self.invalidar()
+
+    # ---------------------------------------------------------------- linhas
+    def _calcular_linha(self, s: int) -> Tuple[List[float], List[int]]:
+        origem = self.nomes[s]
+        if self._negativos:
+            dist, prev, ciclo, _ = bellman_ford_vetorizado(self.mapa, origem)
+            if ciclo:
+                raise ValueError(f"Ciclo de peso negativo alcançável a partir de {origem}: {ciclo}")
+        else:
+            dist, prev = dijkstra_distancias(self.mapa, origem)
+        n = len(self.nomes)
+        linha_d = [math.inf] * n
+        linha_p = [-1] * n
+        for nome, d in dist.items():
+            i = self.ids[nome]
+            linha_d[i] = d
+            p = prev.get(nome)
+            linha_p[i] = self.ids[p] if p is not None else -1
+        self.linhas_calculadas += 1
+        return linha_d, linha_p
+
+    def _linha(self, s: int):
+        if not self._pronta[s]:
+            linha_d, linha_p = self._calcular_linha(s)
+            if self._dist is not None:
+                self._dist[s] = linha_d
+                self._prev[s] = linha_p
+            else:
+                self._linhas[s] = (linha_d, linha_p)
+            self._pronta[s] = 1
+        if self._dist is not None:
+            return self._dist[s], self._prev[s]
+        return self._linhas[s]
+
+    def preencher(self) -> None:
+        """
+        Calcula todas as linhas de uma vez (Floyd–Warshall em mapas pequenos com NumPy).
+        Origens que alcançam um ciclo negativo ficam sem linha e levantam na consulta.
+        """
+        self._em_dia()
+        n = len(self.nomes)
+        if np is not None and n <= LIMITE_FLOYD:
+            self._floyd_warshall()
+        else:
+            for s in range(n):
+                try:
+                    self._linha(s)
+                except ValueError:
+                    pass  # ciclo negativo alcançável a partir de s
+
+    def _floyd_warshall(self) -> None:
+        n = len(self.nomes)
+        dist = np.full((n, n), np.inf)
+        prev = np.full((n, n), -1, dtype=np.int32)
+        for e in self.mapa.arestas():
+            if not e.ativa: continue
+            i, j = self.ids[e.u], self.ids[e.v]
+            if e.peso < dist[i, j]:
+                dist[i, j] = e.peso
+                prev[i, j] = i
+        np.fill_diagonal(dist, np.minimum(np.diagonal(dist), 0.0))
+        np.fill_diagonal(prev, -1)
+        for k in range(n):
+            via = dist[:, k, None] + dist[None, k, :]
+            melhor = via < dist
+            dist = np.where(melhor, via, dist)
+            prev = np.where(melhor, prev[k][None, :], prev)
+        # Mesma regra das linhas sob demanda: só as origens que alcançam um planeta
+        # de ciclo negativo ficam indefinidas (_linha as recalcula e levanta ValueError).
+        em_ciclo = np.diagonal(dist) < 0
+        indefinidas = (dist[:, em_ciclo] < np.inf).any(axis=1)
+        for s in range(n):
+            if indefinidas[s]:
+                continue
+            self._linhas[s] = (dist[s].tolist(), prev[s].tolist())
+            self._pronta[s] = 1
+
+    # ---------------------------------------------------------------- consultas
+    def distancia(self, origem: str, destino: str) -> float:
+        self._em_dia()
+        self.consultas += 1
+        dist, _ = self._linha(self.ids[origem])
+        return float(dist[self.ids[destino]])
+
+    def caminho(self, origem: str, destino: str) -> List[str]:
+        """Caminho mínimo origem -> destino ([] se inalcançável), em O(tamanho do caminho)."""
+        self._em_dia()
+        self.consultas += 1
+        s, t = self.ids[origem], self.ids[destino]
+        dist, prev = self._linha(s)
+        if dist[t] == math.inf:
+            return []
+        caminho = [t]
+        while caminho[-1] != s:
+            caminho.append(int(prev[caminho[-1]]))
+        return [self.nomes[i] for i in reversed(caminho)]
+
+    def linha(self, origem: str) -> Tuple[Dict[str, float], Dict[str, Optional[str]]]:
+        """Mapas (dist, prev) completos a partir de origem, no formato dos geradores."""
+        self._em_dia()
+        dist, prev = self._linha(self.ids[origem])
+        nomes = self.nomes
+        return ({nome: float(dist[i]) for i, nome in enumerate(nomes)},
+                {nome: (nomes[prev[i]] if prev[i] >= 0 else None) for i, nome in enumerate(nomes)})
@@ -0,0 +1,87 @@
+import math
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# Cada mudança é (campo, chave, valor_antigo, valor_novo).
+Mudanca = Tuple[str, Any, Any, Any]
+
+# Campos "mapa": todo planeta tem valor (padrão abaixo). Os demais são conjuntos
+# (visitados, mst) em que a chave está presente quando o valor é True.
+PADROES_MAPA: Dict[str, Any] = {"dist": math.inf, "prev": None, "cor": 0,
+                                "dist_reversa": math.inf, "prev_reversa": None}
+# Buscas bidirecionais: o lado reverso usa campos próprios (prev_reversa[v] = próximo passo até o destino).
+SUFIXO_REVERSO = "_reversa"
+
+
+class EstadoAcumulado:
+    """
+    Acumulador para eventos em modo delta (geradores com delta=True).
+    Aplica as mudanças de cada evento e reconstrói o snapshot completo
+    (visitados, dist, prev, cor, mst) somente quando solicitado.
+    """
+    def __init__(self, grafo=None):
+        self.planetas: List[str] = list(grafo.planetas) if grafo is not None else []
+        self.campos: Dict[str, Dict[Any, Any]] = {}
+
+    def aplicar(self, evento: dict) -> None:
+        for campo, chave, _, novo in evento.get("mudancas", ()):
+            self._atribuir(campo, chave, novo)
+
+    def desfazer(self, evento: dict) -> None:
+        for campo, chave, antigo, _ in reversed(evento.get("mudancas", ())):
+            self._atribuir(campo, chave, antigo)
+
+    def _atribuir(self, campo: str, chave: Any, valor: Any) -> None:
+        valores = self.campos.setdefault(campo, {})
+        if valor == PADROES_MAPA.get(campo, False):
+            valores.pop(chave, None)
+        else:
+            valores[chave] = valor
+
+    def valor(self, campo: str, chave: Any) -> Any:
+        return self.campos.get(campo, {}).get(chave, PADROES_MAPA.get(campo, False))
+
+    def snapshot(self, campo: Optional[str] = None) -> Any:
+        """Snapshot no mesmo formato dos eventos sem delta (set/dict/list)."""
+        if campo is None:
+            return {c: self.snapshot(c) for c in self.campos}
+        valores = self.campos.get(campo, {})
+        if campo in PADROES_MAPA:
+            completo = {p: PADROES_MAPA[campo] for p in self.planetas}
+            completo.update(valores)
+            return completo
+        if campo == "mst":
+            return list(valores)
+        return set(valores)
+
+    def limpar(self) -> None:
+        self.campos.clear()
+
+
+def acumular(eventos: Iterable[dict], grafo=None) -> EstadoAcumulado:
+    """Consome um gerador em modo delta e devolve o estado final."""
+    estado = EstadoAcumulado(grafo)
+    for ev in eventos:
+        estado.aplicar(ev)
+    return estado
+
+
+def evento_visita(u: str, dist: Dict[str, float], prev: Dict[str, Optional[str]], delta: bool, sufixo: str = "") -> dict:
+    """djk_visita (ou djk_visita_reversa, com sufixo=SUFIXO_REVERSO)."""
+    if delta:
+        return {"tipo": "djk_visita" + sufixo, "u": u}
+    return {"tipo": "djk_visita" + sufixo, "u": u, "dist" + sufixo: dict(dist), "prev" + sufixo: dict(prev)}
+
+
+def evento_relax(tipo: str, u: str, v: str, alt: float, dist: Dict[str, float], prev: Dict[str, Optional[str]], delta: bool,
+                 sufixo: str = "") -> dict:
+    """
+    Monta djk_relax/bf_relax; chamado ANTES de atualizar dist/prev (para registrar o valor antigo).
+    Com sufixo, as mudanças vão para dist/prev + sufixo (lado reverso de uma busca bidirecional).
+    """
+    ev = {"tipo": tipo, "de": u, "para": v, "nova_dist": alt}
+    if delta:
+        ev["mudancas"] = [("dist" + sufixo, v, dist[v], alt), ("prev" + sufixo, v, prev[v], u)]
+    else:
+        ev["prev" + sufixo] = dict(prev)
+        ev["prev" + sufixo][v] = u
+    return ev
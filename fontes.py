@@ -0,0 +1,70 @@
+"""
+Fontes sem a varredura de SysFont.
+
+pygame.font.SysFont monta, na primeira chamada, a lista de fontes do sistema
+(fc-list no Linux), o que custa centenas de milissegundos a cada partida.
+Aqui o caminho resolvido de cada (nome, negrito) fica num JSON no diretório
+de cache do usuário e as partidas seguintes abrem o arquivo direto.
+"""
+import json
+import os
+from typing import Dict, Optional
+
+import pygame
+
+from config import FONTE_EMBUTIDA
+
+
+def _caminho_cache() -> str:
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "helldivers-grafos", "fontes.json")
+
+
+class CacheFontes:
+    def __init__(self, caminho: Optional[str] = None):
+        self.caminho = caminho or _caminho_cache()
+        self._resolvidas: Dict[str, dict] = {}
+        self.acertos = 0
+        self.falhas = 0
+        try:
+            with open(self.caminho, encoding="utf-8") as f:
+                self._resolvidas = json.load(f)
+        except (OSError, ValueError):
+            self._resolvidas = {}
+
+    def fonte(self, nome: str, tamanho: int, negrito: bool = False) -> pygame.font.Font:
+        """Como pygame.font.SysFont(nome, tamanho, bold=negrito), mas resolvendo o arquivo uma vez só."""
+        if FONTE_EMBUTIDA and os.path.exists(FONTE_EMBUTIDA):
+            f = pygame.font.Font(FONTE_EMBUTIDA, tamanho)
+            f.set_bold(negrito)
+            return f
+
+        chave = f"{nome}|{int(negrito)}"
+        entrada = self._resolvidas.get(chave)
+        if entrada is not None and (entrada["arquivo"] is None or os.path.exists(entrada["arquivo"])):
+            self.acertos += 1
+        else:
+            self.falhas += 1
+            entrada = self._resolver(nome, negrito)
+            self._resolvidas[chave] = entrada
+            self._salvar()
+
+        f = pygame.font.Font(entrada["arquivo"], tamanho)  # None = fonte padrão do pygame
+        if entrada["negrito_sintetico"]:
+            f.set_bold(True)
+        return f
+
+    @staticmethod
+    def _resolver(nome: str, negrito: bool) -> dict:
+        arquivo = pygame.font.match_font(nome, bold=negrito)
+        # Sem variante negrita instalada, SysFont engrossa a regular; idem aqui.
+        sintetico = negrito and (arquivo is None or arquivo == pygame.font.match_font(nome))
+        return {"arquivo": arquivo, "negrito_sintetico": bool(sintetico)}
+
+    def _salvar(self) -> None:
+        try:
+            os.makedirs(os.path.dirname(self.caminho), exist_ok=True)
+            with open(self.caminho, "w", encoding="utf-8") as f:
+                json.dump(self._resolvidas, f, indent=1)
+        except OSError:
+            pass  # sem cache em disco: a próxima partida apenas resolve de novo
@@ -0,0 +1,320 @@
+"""
+Formato binário versionado de mapas (.hdmapa), aberto por memory-map.
+
+    python formato_mapa.py exportar --dir mapas/                       # as 5 fases
+    python formato_mapa.py exportar --gerador geometrico --n 500000 --saida grande.hdmapa
+    python formato_mapa.py info grande.hdmapa
+
+Layout (little-endian): cabeçalho fixo, tabela de seções (offset, tamanho) e as
+seções alinhadas em 8 bytes. Planetas são ids 0..n-1; as meias-arestas do
+planeta i ficam em [csr_ini[i], csr_ini[i+1]), no mesmo layout CSR do MapaCompacto.
+A seção "rotas" guarda a meia-aresta principal de cada rota na ordem de criação,
+para mapa() recriar as rotas com a mesma ordem, orientação e índices.
+"""
+import argparse
+import mmap
+import struct
+import sys
+import time
+from array import array
+from collections.abc import Mapping, Sequence
+from typing import Dict, List, Optional
+
+from graph_system import MapaCompacto, MapaGalactico
+from models import Planeta
+
+MAGICO = b"HDMAPA\x00\x00"
+VERSAO = 2
+EXTENSAO = ".hdmapa"
+
+# Flags do cabeçalho.
+PESOS_INTEIROS = 1  # seção "pesos" em int64 em vez de f64
+
+# Seções da versão 2, na ordem do arquivo: (nome, formato de memoryview.cast ou None para bytes).
+SECOES = [
+    ("nomes_ini", "Q"),    # n + 1 offsets em "nomes"
+    ("nomes", None),       # nomes UTF-8 concatenados
+    ("faccoes_ini", "Q"),  # f + 1 offsets em "faccoes"
+    ("faccoes", None),     # nomes de facção UTF-8 concatenados
+    ("faccao", "H"),       # índice da facção de cada planeta
+    ("coords", "d"),       # x0, y0, x1, y1, ...
+    ("csr_ini", "q"),      # n + 1 offsets em destinos/pesos
+    ("destinos", "i"),
+    ("pesos", "d"),        # "q" com a flag PESOS_INTEIROS
+    ("dirigidas", None),   # bits por meia-aresta
+    ("ativas", None),      # bits por meia-aresta
+    ("gemeas", "i"),       # meia-aresta reversa da mesma rota, ou -1
+    ("rotas", "i"),        # meia-aresta principal de cada rota, em ordem de criação
+]
+_CABECALHO = struct.Struct("<8sIIQQQQ")  # mágico, versão, nº de seções, planetas, meias-arestas, facções, flags
+_ENTRADA = struct.Struct("<QQ")          # offset, tamanho (bytes)
+
+
+def _alinhar(n: int) -> int:
+    return (n + 7) & ~7
+
+
+def exportar(mg: MapaGalactico, caminho: str) -> None:
+    """Grava o mapa (planetas, coordenadas, facções e CSR com estado das rotas) em caminho."""
+    c = MapaCompacto.de_mapa(mg)
+    nomes_ini, nomes_blob = _empacotar_textos(c.nomes)
+    faccoes = list(dict.fromkeys(mg.planetas[n].faccao_inimiga for n in c.nomes))
+    faccoes_ini, faccoes_blob = _empacotar_textos(faccoes)
+    indice_faccao = {f: i for i, f in enumerate(faccoes)}
+    faccao = array("H", (indice_faccao[mg.planetas[n].faccao_inimiga] for n in c.nomes))
+    coords = array("d")
+    for n in c.nomes:
+        coords.extend(mg.planetas[n].pos)
+
+    dados = {
+        "nomes_ini": nomes_ini, "nomes": nomes_blob,
+        "faccoes_ini": faccoes_ini, "faccoes": faccoes_blob,
+        "faccao": faccao, "coords": coords,
+        "csr_ini": array("q", c.offsets), "destinos": array("i", c.destinos), "pesos": c.pesos,
+        "dirigidas": bytes(c.dirigidas), "ativas": bytes(c.ativas), "gemeas": array("i", c.gemeas),
+        "rotas": array("i", c.indices_rotas),
+    }
+    flags = PESOS_INTEIROS if c.pesos.typecode == "q" else 0
+    blocos = [_em_bytes(dados[nome]) for nome, _ in SECOES]
+
+    pos = _alinhar(_CABECALHO.size + _ENTRADA.size * len(SECOES))
+    tabela = []
+    for b in blocos:
+        tabela.append((pos, len(b)))
+        pos = _alinhar(pos + len(b))
+
+    with open(caminho, "wb") as f:
+        f.write(_CABECALHO.pack(MAGICO, VERSAO, len(SECOES), len(c.nomes), len(c.destinos), len(faccoes), flags))
+        for entrada in tabela:
+            f.write(_ENTRADA.pack(*entrada))
+        for (offset, _), b in zip(tabela, blocos):
+            f.write(b"\x00" * (offset - f.tell()))
+            f.write(b)
+
+
+def _empacotar_textos(textos: List[str]):
+    ini = array("Q", [0])
+    partes = []
+    total = 0
+    for t in textos:
+        b = t.encode("utf-8")
+        partes.append(b)
+        total += len(b)
+        ini.append(total)
+    return ini, b"".join(partes)
+
+
+def _em_bytes(dados) -> bytes:
+    if isinstance(dados, array):
+        if sys.byteorder != "little":
+            dados = array(dados.typecode, dados)
+            dados.byteswap()
+        return dados.tobytes()
+    return bytes(dados)
+
+
+class _Textos(Sequence):
+    """Sequência de strings decodificadas sob demanda a partir de (offsets, blob)."""
+    def __init__(self, ini, blob):
+        self._ini = ini
+        self._blob = blob
+
+    def __len__(self) -> int:
+        return len(self._ini) - 1
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        if i < 0: i += len(self)
+        return str(self._blob[self._ini[i]:self._ini[i + 1]], "utf-8")
+
+
+class _Ids(Mapping):
+    """nome -> id; o dicionário só é montado (O(n)) na primeira consulta."""
+    def __init__(self, nomes: _Textos):
+        self._nomes = nomes
+        self._dic: Optional[Dict[str, int]] = None
+
+    def _d(self) -> Dict[str, int]:
+        if self._dic is None:
+            self._dic = {nome: i for i, nome in enumerate(self._nomes)}
+        return self._dic
+
+    def __getitem__(self, nome: str) -> int: return self._d()[nome]
+    def __iter__(self): return iter(self._nomes)
+    def __len__(self) -> int: return len(self._nomes)
+
+
+class _Planetas(Mapping):
+    """nome -> Planeta criado na primeira leitura; iteração em ordem de id sem criar objetos."""
+    def __init__(self, arq: "MapaArquivo"):
+        self._arq = arq
+        self._criados: Dict[str, Planeta] = {}
+
+    def __getitem__(self, nome: str) -> Planeta:
+        p = self._criados.get(nome)
+        if p is None:
+            p = self._criados[nome] = self._arq.planeta(self._arq.ids[nome])
+        return p
+
+    def __contains__(self, nome) -> bool: return nome in self._arq.ids
+    def __iter__(self): return iter(self._arq.nomes)
+    def __len__(self) -> int: return self._arq.num_planetas
+
+
+class MapaArquivo:
+    """
+    Mapa .hdmapa aberto por mmap. Abrir só lê o cabeçalho; as seções são
+    memoryviews sobre o arquivo e os objetos (nomes, Planeta, MapaCompacto,
+    MapaGalactico) são criados sob demanda.
+    """
+    def __init__(self, caminho: str):
+        self.caminho = caminho
+        with open(caminho, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._mv = mv = memoryview(self._mm)
+        if len(mv) < _CABECALHO.size:
+            raise ValueError(f"{caminho}: arquivo truncado")
+        magico, versao, num_secoes, n, num_e, num_f, flags = _CABECALHO.unpack_from(mv, 0)
+        if magico != MAGICO:
+            raise ValueError(f"{caminho}: não é um arquivo {EXTENSAO}")
+        if versao != VERSAO or num_secoes != len(SECOES):
+            raise ValueError(f"{caminho}: versão {versao} do formato não suportada (esperada {VERSAO})")
+        if sys.byteorder != "little":
+            raise ValueError("Leitura por mmap exige máquina little-endian.")
+        self.versao = versao
+        self.num_planetas = n
+        self.num_meias_arestas = num_e
+        self.num_faccoes = num_f
+
+        self.secoes = {}
+        for i, (nome, formato) in enumerate(SECOES):
+            offset, tamanho = _ENTRADA.unpack_from(mv, _CABECALHO.size + i * _ENTRADA.size)
+            if offset + tamanho > len(mv):
+                raise ValueError(f"{caminho}: seção {nome} fora do arquivo")
+            secao = mv[offset:offset + tamanho]
+            if nome == "pesos" and flags & PESOS_INTEIROS:
+                formato = "q"
+            self.secoes[nome] = secao.cast(formato) if formato else secao
+
+        self.nomes = _Textos(self.secoes["nomes_ini"], self.secoes["nomes"])
+        self.faccoes = list(_Textos(self.secoes["faccoes_ini"], self.secoes["faccoes"]))
+        self.ids = _Ids(self.nomes)
+        self._compacto: Optional[MapaCompacto] = None
+        self._mapa: Optional[MapaGalactico] = None
+
+    def planeta(self, i: int) -> Planeta:
+        coords = self.secoes["coords"]
+        pos = (_inteiro_se_exato(coords[2 * i]), _inteiro_se_exato(coords[2 * i + 1]))
+        return Planeta(self.nomes[i], self.faccoes[self.secoes["faccao"][i]], pos)
+
+    def compacto(self) -> MapaCompacto:
+        """MapaCompacto sobre as seções mapeadas (sem cópia, fora os bits de ativas, que são mutáveis)."""
+        if self._compacto is None:
+            s = self.secoes
+            self._compacto = MapaCompacto(_Planetas(self), self.nomes, s["csr_ini"], s["destinos"], s["pesos"],
+                                          s["dirigidas"], s["gemeas"], bytearray(s["ativas"]), ids=self.ids,
+                                          rotas=s["rotas"])
+        return self._compacto
+
+    def mapa(self) -> MapaGalactico:
+        """
+        MapaGalactico completo (mutável), materializado na primeira chamada.
+        As rotas são recriadas na ordem da seção "rotas", com a direção dos bits
+        de "dirigidas"; as desativadas são desligadas pela própria Aresta criada.
+        """
+        if self._mapa is None:
+            s = self.secoes
+            ini, destinos, pesos = s["csr_ini"], s["destinos"], s["pesos"]
+            dirigidas, ativas = s["dirigidas"], s["ativas"]
+            mg = MapaGalactico()
+            nomes = [self.nomes[i] for i in range(self.num_planetas)]
+            for i in range(self.num_planetas):
+                mg.adicionar_planeta(self.planeta(i))
+            origens = array("i", bytes(4 * self.num_meias_arestas))
+            for i in range(self.num_planetas):
+                for k in range(ini[i], ini[i + 1]):
+                    origens[k] = i
+            for k in s["rotas"]:
+                u, v = nomes[origens[k]], nomes[destinos[k]]
+                if dirigidas[k >> 3] & (1 << (k & 7)): e = mg.adicionar_rota_dirigida(u, v, pesos[k])
+                else: e = mg.adicionar_rota(u, v, pesos[k])
+                if not ativas[k >> 3] & (1 << (k & 7)):
+                    mg.desativar_aresta(e)
+            self._mapa = mg
+        return self._mapa
+
+    def fechar(self) -> None:
+        """Libera as seções e o mmap (se ainda houver views em uso, o fechamento fica para o GC)."""
+        self._compacto = self._mapa = None
+        self.nomes = self.ids = None
+        self.secoes.clear()
+        try:
+            self._mv.release()
+            self._mm.close()
+        except BufferError:
+            pass
+
+
+def _inteiro_se_exato(x: float):
+    return int(x) if x.is_integer() else x
+
+
+def abrir(caminho: str) -> MapaArquivo:
+    return MapaArquivo(caminho)
+
+
+def exportar_fases(diretorio: str) -> List[str]:
+    """Exporta os mapas das 5 fases (levels.construir_mapa_faseN) como faseN.hdmapa."""
+    import os
+    import levels
+    os.makedirs(diretorio, exist_ok=True)
+    caminhos = []
+    for f in range(1, 6):
+        caminho = os.path.join(diretorio, f"fase{f}{EXTENSAO}")
+        exportar(getattr(levels, f"construir_mapa_fase{f}")(), caminho)
+        caminhos.append(caminho)
+    return caminhos
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=f"Exporta e inspeciona mapas {EXTENSAO}.")
+    sub = parser.add_subparsers(dest="comando", required=True)
+
+    exp = sub.add_parser("exportar", help="Grava as fases ou uma galáxia sintética.")
+    exp.add_argument("--dir", default="mapas", help="Destino dos mapas das fases.")
+    exp.add_argument("--gerador", help="Gerador de synthetic_maps em vez das fases.")
+    exp.add_argument("--n", type=int, default=10000)
+    exp.add_argument("--seed", type=int, default=42)
+    exp.add_argument("--saida", help=f"Arquivo {EXTENSAO} (com --gerador).")
+
+    inf = sub.add_parser("info", help="Mostra o cabeçalho e o tempo de abertura.")
+    inf.add_argument("arquivo")
+
+    args = parser.parse_args(argv)
+    if args.comando == "exportar":
+        if args.gerador:
+            from synthetic_maps import GERADORES
+            saida = args.saida or f"{args.gerador}_{args.n}{EXTENSAO}"
+            exportar(GERADORES[args.gerador](args.n, seed=args.seed), saida)
+            print(saida)
+        else:
+            for caminho in exportar_fases(args.dir):
+                print(caminho)
+        return 0
+
+    t0 = time.perf_counter()
+    arq = abrir(args.arquivo)
+    t_abrir = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    arq.compacto()
+    t_compacto = time.perf_counter() - t0
+    print(f"{args.arquivo}: versão {arq.versao}, {arq.num_planetas} planetas, "
+          f"{arq.num_meias_arestas} meias-arestas, facções {arq.faccoes}")
+    print(f"abrir: {t_abrir * 1000:.2f} ms | MapaCompacto: {t_compacto * 1000:.2f} ms")
+    arq.fechar()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
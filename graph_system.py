@@ -1,74 +1,579 @@
 from __future__ import annotations
 import random
-from typing import Dict, List, Tuple, Optional, Iterable, Set
+from array import array
+from collections import deque
+from contextlib import contextmanager
+from itertools import chain
+from typing import Dict, FrozenSet, List, NamedTuple, Tuple, Optional, Iterable, Iterator, Set
 from models import Planeta, Aresta
 
+
+class VersaoMapa(NamedTuple):
+    """
+    Estado das rotas de um MapaGalactico: rotas desativadas em relação à
+    topologia base (todas ativas) e quantas rotas existiam no snapshot.
+    """
+    desativadas: FrozenSet[int]
+    num_rotas: int
+
+
 class MapaGalactico:
     """Representação por Lista de Adjacência (Dados apenas)."""
     def __init__(self):
         self.planetas: Dict[str, Planeta] = {}
         self.adj: Dict[str, List[Aresta]] = {}
+        self.adj_reversa: Dict[str, List[Aresta]] = {}
+        # Incrementado a cada mudança de topologia/estado das rotas (invalida caches).
+        self.versao = 0
+        self._cache_distancias = None
+
+        # Índice (u, v) -> meia-aresta e tabela de rotas (uma entrada por rota, gêmeas juntas).
+        self._indice: Dict[Tuple[str, str], Aresta] = {}
+        self._rotas: List[Aresta] = []
+        # Pool de rotas ativas para amostragem O(1); _pos_ativa[r] = posição no pool ou -1.
+        self._ativas: List[int] = []
+        self._pos_ativa: List[int] = []
+
+        # Componentes conexos (fracos) mantidos incrementalmente; criados sob demanda.
+        self._componente: Optional[Dict[str, int]] = None
+        self._membros: Dict[int, Set[str]] = {}
+        self._proximo_componente = 0
+
+        # Grade espacial sobre Planeta.pos (spatial_index.IndiceEspacial), criada sob demanda.
+        self._espacial = None
+
+        # Sobreposição de versão: a topologia é só acrescida e fica compartilhada;
+        # o que muda entre versões é o conjunto de rotas desativadas. _historico
+        # guarda (rota, ativada?) de cada mudança, para desfazer em O(1).
+        self._desativadas: Set[int] = set()
+        self._historico: List[Tuple[int, bool]] = []
+
+    def __getstate__(self):
+        """Caches derivados ficam fora do pickle (ex.: envio a um Trabalhador em processo)."""
+        estado = self.__dict__.copy()
+        estado["_cache_distancias"] = None
+        estado["_espacial"] = None
+        return estado
 
     def adicionar_planeta(self, p: Planeta) -> None:
         if p.nome not in self.planetas:
             self.planetas[p.nome] = p
             self.adj[p.nome] = []
+            self.adj_reversa[p.nome] = []
+            self.versao += 1
+            if self._componente is not None:
+                self._criar_componente({p.nome})
+            if self._espacial is not None:
+                self._espacial.inserir_planeta(p.nome, p.pos)
 
-    def adicionar_rota(self, a: str, b: str, peso: float = 1.0, bidirecional: bool = True) -> None:
-        self._add_aresta(a, b, peso, ativa=True, dirigida=not bidirecional)
+    def adicionar_rota(self, a: str, b: str, peso: float = 1.0, bidirecional: bool = True) -> Optional[Aresta]:
+        """Cria a rota a->b (e a gêmea b->a, se bidirecional); retorna a meia-aresta a->b ou None."""
+        if a not in self.planetas or b not in self.planetas:
+            return None
+        e = self._add_aresta(a, b, peso, ativa=True, dirigida=not bidirecional)
         if bidirecional:
-            self._add_aresta(b, a, peso, ativa=True, dirigida=False)
+            g = self._add_aresta(b, a, peso, ativa=True, dirigida=False)
+            e.gemea, g.gemea = g, e
+        self._registrar_rota(e)
+        return e
+
+    def adicionar_rota_dirigida(self, a: str, b: str, peso: float = 1.0) -> Optional[Aresta]:
+        if a not in self.planetas or b not in self.planetas:
+            return None
+        e = self._add_aresta(a, b, peso, ativa=True, dirigida=True)
+        self._registrar_rota(e)
+        return e
+
+    def _add_aresta(self, u: str, v: str, peso: float, ativa: bool, dirigida: bool) -> Aresta:
+        e = Aresta(u, v, peso, ativa, dirigida)
+        self.adj[u].append(e)
+        self.adj_reversa[v].append(e)
+        self._indice[(u, v)] = e
+        return e
+
+    def _registrar_rota(self, e: Aresta) -> None:
+        r = len(self._rotas)
+        e.rota = r
+        if e.gemea: e.gemea.rota = r
+        self._rotas.append(e)
+        self._pos_ativa.append(-1)
+        self.versao += 1
+        if self._espacial is not None:
+            self._espacial.inserir_rota(e)
+        if e.ativa:
+            self._entrar_pool(r)
+            self._ao_ligar(e.u, e.v)
+
+    def _entrar_pool(self, r: int) -> None:
+        self._pos_ativa[r] = len(self._ativas)
+        self._ativas.append(r)
+
+    def _sair_pool(self, r: int) -> None:
+        """Swap-remove: o último do pool ocupa a posição liberada."""
+        i = self._pos_ativa[r]
+        ultimo = self._ativas.pop()
+        if ultimo != r:
+            self._ativas[i] = ultimo
+            self._pos_ativa[ultimo] = i
+        self._pos_ativa[r] = -1
+
+    def aresta(self, u: str, v: str) -> Optional[Aresta]:
+        """Meia-aresta u->v (ativa ou não). Em rotas repetidas, vale a última adicionada."""
+        return self._indice.get((u, v))
+
+    def desativar_rota(self, u: str, v: str) -> bool:
+        """Desativa a rota u->v; com rotas repetidas entre u e v, a última adicionada."""
+        e = self._indice.get((u, v))
+        return e is not None and self.desativar_aresta(e)
 
-    def adicionar_rota_dirigida(self, a: str, b: str, peso: float = 1.0) -> None:
-        self._add_aresta(a, b, peso, ativa=True, dirigida=True)
+    def desativar_aresta(self, e: Aresta) -> bool:
+        """Desativa a rota de e (retornada por adicionar_rota*), mesmo entre rotas repetidas."""
+        if not e.ativa:
+            return False
+        self._desativar(e)
+        return True
 
-    def _add_aresta(self, u: str, v: str, peso: float, ativa: bool, dirigida: bool) -> None:
-        if u in self.planetas and v in self.planetas:
-            self.adj[u].append(Aresta(u, v, peso, ativa, dirigida))
+    def reativar_rota(self, u: str, v: str) -> bool:
+        e = self._indice.get((u, v))
+        if e is None or e.ativa:
+            return False
+        self._reativar(e)
+        return True
+
+    def _desativar(self, e: Aresta, registrar: bool = True) -> None:
+        e.ativa = False
+        if e.gemea: e.gemea.ativa = False
+        self.versao += 1
+        self._sair_pool(e.rota)
+        self._desativadas.add(e.rota)
+        if registrar: self._historico.append((e.rota, False))
+        self._ao_desligar(e.u, e.v)
+
+    def _reativar(self, e: Aresta, registrar: bool = True) -> None:
+        e.ativa = True
+        if e.gemea: e.gemea.ativa = True
+        self.versao += 1
+        self._entrar_pool(e.rota)
+        self._desativadas.discard(e.rota)
+        if registrar: self._historico.append((e.rota, True))
+        self._ao_ligar(e.u, e.v)
+
+    # ---------------------------------------------------------------- versões
+    def snapshot(self) -> VersaoMapa:
+        """Versão atual das rotas, em O(rotas desativadas)."""
+        return VersaoMapa(frozenset(self._desativadas), len(self._rotas))
+
+    def restaurar(self, versao: VersaoMapa) -> int:
+        """
+        Volta as rotas ao estado de um snapshot, alternando só as que diferem
+        (O(mudanças)). Rotas criadas depois do snapshot ficam desativadas.
+        O histórico de desfazer recomeça a partir daqui. Retorna quantas rotas mudaram.
+        """
+        alvo = set(versao.desativadas)
+        alvo.update(range(versao.num_rotas, len(self._rotas)))
+        mudancas = 0
+        for r in self._desativadas - alvo:
+            self._reativar(self._rotas[r], registrar=False); mudancas += 1
+        for r in alvo - self._desativadas:
+            self._desativar(self._rotas[r], registrar=False); mudancas += 1
+        self._historico.clear()
+        return mudancas
+
+    def resetar(self) -> int:
+        """Reativa todas as rotas destruídas (mapa como construído), em O(mudanças)."""
+        return self.restaurar(VersaoMapa(frozenset(), len(self._rotas)))
+
+    def desfazer(self) -> Optional[Tuple[str, str, bool]]:
+        """Desfaz a última ativação/desativação de rota; retorna (u, v, ativa agora) ou None."""
+        if not self._historico:
+            return None
+        r, ativou = self._historico.pop()
+        e = self._rotas[r]
+        if ativou: self._desativar(e, registrar=False)
+        else: self._reativar(e, registrar=False)
+        return (e.u, e.v, e.ativa)
+
+    @contextmanager
+    def cenario(self) -> Iterator["MapaGalactico"]:
+        """Bifurcação "e se": mudanças de rotas dentro do bloco são revertidas na saída."""
+        base = self.snapshot()
+        historico = list(self._historico)
+        try:
+            yield self
+        finally:
+            self.restaurar(base)
+            self._historico = historico
 
     def remover_rota_aleatoria(self) -> Optional[Tuple[str, str]]:
-        candidatas = [(u, e) for u, lst in self.adj.items() for e in lst if e.ativa]
-        if not candidatas:
+        """Desativa uma rota ativa sorteada uniformemente, em O(1) (fora a atualização de componentes)."""
+        if not self._ativas:
             return None
-        u, e = random.choice(candidatas)
-        e.ativa = False
-        if not e.dirigida:
-            for ex in self.adj.get(e.v, []):
-                if (not ex.dirigida) and ex.v == u and ex.ativa:
-                    ex.ativa = False
-                    break
+        e = self._rotas[random.choice(self._ativas)]
+        self._desativar(e)
         return (e.u, e.v)
 
+    def num_rotas_ativas(self) -> int:
+        return len(self._ativas)
+
     def vizinhos(self, u: str) -> Iterable[Tuple[str, float]]:
         """Retorna iterador de (vizinho, peso) para arestas ativas."""
         for e in self.adj.get(u, []):
             if e.ativa:
                 yield (e.v, e.peso)
 
+    def vizinhos_reversos(self, v: str) -> Iterable[Tuple[str, float]]:
+        """(antecessor, peso) das arestas ativas que chegam em v: vizinhos() do grafo transposto."""
+        for e in self.adj_reversa.get(v, []):
+            if e.ativa:
+                yield (e.u, e.peso)
+
+    def cache_distancias(self):
+        """Cache de distâncias entre todos os pares (criado na primeira chamada)."""
+        if self._cache_distancias is None:
+            from distance_cache import CacheDistancias
+            self._cache_distancias = CacheDistancias(self)
+        return self._cache_distancias
+
+    def indice_espacial(self):
+        """Índice espacial de planetas e rotas; mantido em dia pelas inserções seguintes."""
+        if self._espacial is None:
+            from spatial_index import IndiceEspacial
+            self._espacial = IndiceEspacial()
+            for nome, p in self.planetas.items():
+                self._espacial.inserir_planeta(nome, p.pos)
+            for e in self._rotas:
+                self._espacial.inserir_rota(e)
+        return self._espacial
+
+    def compactar(self) -> "MapaCompacto":
+        """Gera uma cópia CSR (somente leitura de topologia) deste mapa."""
+        return MapaCompacto.de_mapa(self)
+
     def arestas(self) -> Iterable[Aresta]:
-        for u, lst in self.adj.items():
-            for e in lst:
-                yield e
+        """Todas as meias-arestas (ativas ou não), agrupadas por planeta de origem."""
+        return chain.from_iterable(self.adj.values())
+
+    def rotas(self) -> List[Aresta]:
+        """Uma meia-aresta por rota (a gêmea de rotas bidirecionais fica de fora)."""
+        return self._rotas
 
     def encontrar_componentes_conexos(self) -> List[Set[str]]:
-        """Encontra todos os subgrafos desconectados (usado no evento de dano)."""
-        componentes = []
-        visitados_globais = set()
-        for nome_planeta in self.planetas:
-            if nome_planeta not in visitados_globais:
-                componente_atual = set()
-                fila = [nome_planeta]
-                visitados_locais = {nome_planeta}
-                
-                while fila:
-                    u = fila.pop(0)
-                    componente_atual.add(u)
-                    vizinhos_u = {v for v, _ in self.vizinhos(u)}
-                    for v in vizinhos_u:
-                        if v not in visitados_locais:
-                            visitados_locais.add(v)
-                            fila.append(v)
-                
-                componentes.append(componente_atual)
-                visitados_globais.update(componente_atual)
-        return componentes
\ No newline at end of file
+        """
+        Encontra todos os subgrafos desconectados (usado no evento de dano).
+        Conectividade fraca: a direção das rotas é ignorada.
+        """
+        self._garantir_componentes()
+        return [set(m) for m in self._membros.values()]
+
+    def num_componentes(self) -> int:
+        """Quantidade de setores isolados, em O(1) após a primeira consulta."""
+        self._garantir_componentes()
+        return len(self._membros)
+
+    def componente_de(self, nome: str) -> int:
+        self._garantir_componentes()
+        return self._componente[nome]
+
+    def _vizinhos_nao_dirigidos(self, u: str) -> Iterable[str]:
+        for e in self.adj[u]:
+            if e.ativa: yield e.v
+        for e in self.adj_reversa[u]:
+            if e.ativa: yield e.u
+
+    def _garantir_componentes(self) -> None:
+        if self._componente is not None:
+            return
+        self._componente = {}
+        self._membros = {}
+        for s in self.planetas:
+            if s in self._componente: continue
+            membros = {s}
+            fila = deque([s])
+            while fila:
+                u = fila.popleft()
+                for v in self._vizinhos_nao_dirigidos(u):
+                    if v not in membros:
+                        membros.add(v)
+                        fila.append(v)
+            self._criar_componente(membros)
+
+    def _criar_componente(self, membros: Set[str]) -> None:
+        cid = self._proximo_componente
+        self._proximo_componente += 1
+        self._membros[cid] = membros
+        for nome in membros:
+            self._componente[nome] = cid
+
+    def _ao_ligar(self, u: str, v: str) -> None:
+        """Rota u-v ativada: une os componentes, movendo o menor (O(menor lado))."""
+        if self._componente is None: return
+        cu, cv = self._componente[u], self._componente[v]
+        if cu == cv: return
+        if len(self._membros[cu]) < len(self._membros[cv]):
+            cu, cv = cv, cu
+        menor = self._membros.pop(cv)
+        for nome in menor:
+            self._componente[nome] = cu
+        self._membros[cu] |= menor
+
+    def _ao_desligar(self, u: str, v: str) -> None:
+        """
+        Rota u-v desativada: busca em largura alternada a partir das duas pontas.
+        Se as buscas se encontram, nada muda; senão o lado que esgota primeiro
+        (o menor fragmento) ganha um novo id. Custo proporcional ao menor lado.
+        """
+        if self._componente is None or u == v: return
+        lados = ((deque([u]), {u}), (deque([v]), {v}))
+        while True:
+            for i in (0, 1):
+                fila, vistos = lados[i]
+                outros = lados[1 - i][1]
+                if not fila:
+                    cid = self._componente[u]
+                    self._membros[cid] -= vistos
+                    self._criar_componente(vistos)
+                    return
+                x = fila.popleft()
+                for y in self._vizinhos_nao_dirigidos(x):
+                    if y in outros:
+                        return
+                    if y not in vistos:
+                        vistos.add(y)
+                        fila.append(y)
+
+
+class MapaCompacto:
+    """
+    Backend compacto (CSR) com a mesma interface de leitura do MapaGalactico.
+    Os planetas são internados como ids inteiros; as meias-arestas do nó i ficam
+    em destinos/pesos[offsets[i]:offsets[i+1]]. Ativa/dirigida são bits empacotados.
+    A topologia é imutável: construa com MapaGalactico e chame compactar().
+    """
+    def __init__(self, planetas: Dict[str, Planeta], nomes: List[str], offsets, destinos, pesos,
+                 dirigidas: bytearray, gemeas, ativas: Optional[bytearray] = None, ids=None, rotas=None):
+        self.planetas = planetas
+        self.nomes = nomes
+        # ids pode vir pronto (ex.: mapeamento preguiçoso de um arquivo .hdmapa).
+        self.ids: Dict[str, int] = ids if ids is not None else {nome: i for i, nome in enumerate(nomes)}
+        self.offsets = offsets
+        self.destinos = destinos
+        self.pesos = pesos
+        self.dirigidas = dirigidas
+        self.gemeas = gemeas
+        # rotas[r] = meia-aresta principal da r-ésima rota (ordem de inserção no MapaGalactico);
+        # None = ordem do CSR, com a meia-aresta de menor índice de cada rota.
+        self.indices_rotas = rotas
+        # Posições (em indices_rotas) das rotas ativas; criado quando a amostragem por rejeição deixa de compensar.
+        self._pool_ativas: Optional[List[int]] = None
+        if ativas is None:
+            ativas = bytearray(b"\xff" * (len(destinos) >> 3))
+            if len(destinos) & 7: ativas.append((1 << (len(destinos) & 7)) - 1)
+        self.ativas = ativas
+        self.num_ativas = int.from_bytes(ativas, "little").bit_count()
+        self.versao = 0
+        # Meias-arestas inativas por planeta de origem/destino: só esses planetas filtram bits.
+        self._inativas_saida = array("i", bytes(4 * len(nomes)))
+        self._inativas_entrada = array("i", bytes(4 * len(nomes)))
+        if self.num_ativas < len(destinos):
+            for k in self._indices_inativos():
+                self._inativas_saida[self._origem(k)] += 1
+                self._inativas_entrada[destinos[k]] += 1
+        # Nomes dos destinos e índice reverso (CSR por destino), montados no primeiro uso.
+        self._destinos_nomes: Optional[List[str]] = None
+        self._rev_offsets = None
+        self._rev_origens: Optional[List[str]] = None
+        self._rev_pesos = None
+        self._rev_arestas = None
+
+    @classmethod
+    def de_mapa(cls, mg: MapaGalactico) -> "MapaCompacto":
+        nomes = list(mg.planetas)
+        ids = {nome: i for i, nome in enumerate(nomes)}
+        lista = [e for nome in nomes for e in mg.adj[nome]]
+        offsets = array("i", [0])
+        destinos = array("i")
+        # Pesos inteiros (os dos mapas das fases) continuam int, como no MapaGalactico.
+        pesos = array("q" if all(type(e.peso) is int for e in lista) else "d")
+        num_e = len(lista)
+        dirigidas = bytearray((num_e + 7) >> 3)
+        ativas = bytearray((num_e + 7) >> 3)
+        for nome in nomes:
+            for e in mg.adj[nome]:
+                k = len(destinos)
+                destinos.append(ids[e.v])
+                pesos.append(e.peso)
+                if e.dirigida: dirigidas[k >> 3] |= 1 << (k & 7)
+                if e.ativa: ativas[k >> 3] |= 1 << (k & 7)
+            offsets.append(len(destinos))
+
+        # Gêmea = meia-aresta reversa da mesma rota bidirecional (-1 se não houver).
+        posicao = {id(e): k for k, e in enumerate(lista)}
+        gemeas = array("i", [posicao[id(e.gemea)] if e.gemea else -1 for e in lista])
+        rotas = array("i", [posicao[id(e)] for e in mg.rotas()])
+        return cls(mg.planetas, nomes, offsets, destinos, pesos, dirigidas, gemeas, ativas, rotas=rotas)
+
+    @staticmethod
+    def _bit(bits: bytearray, k: int) -> bool:
+        return bool(bits[k >> 3] & (1 << (k & 7)))
+
+    def _indices_inativos(self) -> Iterator[int]:
+        ativas, num_e = self.ativas, len(self.destinos)
+        for b, byte in enumerate(ativas):
+            if byte != 0xFF:
+                for k in range(b << 3, min((b + 1) << 3, num_e)):
+                    if not byte & (1 << (k & 7)):
+                        yield k
+
+    def _desativar(self, k: int) -> None:
+        if self._bit(self.ativas, k):
+            self.ativas[k >> 3] &= ~(1 << (k & 7)) & 0xFF
+            self.num_ativas -= 1
+            self._inativas_saida[self._origem(k)] += 1
+            self._inativas_entrada[self.destinos[k]] += 1
+            self.versao += 1
+
+    def vizinhos_ids(self, i: int) -> Iterable[Tuple[int, float]]:
+        """Versão inteira de vizinhos(): (id_vizinho, peso) para arestas ativas."""
+        ini, fim = self.offsets[i], self.offsets[i + 1]
+        if not self._inativas_saida[i]:
+            return zip(self.destinos[ini:fim], self.pesos[ini:fim])
+        return self._filtrar_ids(ini, fim)
+
+    def _filtrar_ids(self, ini: int, fim: int) -> Iterator[Tuple[int, float]]:
+        ativas, destinos, pesos = self.ativas, self.destinos, self.pesos
+        for k in range(ini, fim):
+            if ativas[k >> 3] & (1 << (k & 7)):
+                yield (destinos[k], pesos[k])
+
+    def vizinhos(self, u: str) -> Iterable[Tuple[str, float]]:
+        """Iterador preguiçoso de (vizinho, peso) das arestas ativas, como MapaGalactico.vizinhos."""
+        i = self.ids.get(u)
+        if i is None:
+            return ()
+        if self._destinos_nomes is None:
+            self._indexar_nomes()
+        ini, fim = self.offsets[i], self.offsets[i + 1]
+        if not self._inativas_saida[i]:
+            return zip(self._destinos_nomes[ini:fim], self.pesos[ini:fim])
+        ativas, destinos_nomes, pesos = self.ativas, self._destinos_nomes, self.pesos
+        return ((destinos_nomes[k], pesos[k]) for k in range(ini, fim) if ativas[k >> 3] & (1 << (k & 7)))
+
+    def vizinhos_reversos(self, v: str) -> Iterable[Tuple[str, float]]:
+        """(antecessor, peso) das arestas ativas que chegam em v: vizinhos() do grafo transposto."""
+        j = self.ids.get(v)
+        if j is None:
+            return ()
+        if self._rev_offsets is None:
+            self._indexar_reverso()
+        ini, fim = self._rev_offsets[j], self._rev_offsets[j + 1]
+        if not self._inativas_entrada[j]:
+            return zip(self._rev_origens[ini:fim], self._rev_pesos[ini:fim])
+        ativas, origens, pesos, arestas = self.ativas, self._rev_origens, self._rev_pesos, self._rev_arestas
+        return ((origens[r], pesos[r]) for r in range(ini, fim) if ativas[arestas[r] >> 3] & (1 << (arestas[r] & 7)))
+
+    def _indexar_nomes(self) -> None:
+        """Nome do destino de cada meia-aresta (referências às mesmas strings: 8 bytes por aresta)."""
+        nomes = list(self.nomes)
+        self._destinos_nomes = [nomes[j] for j in self.destinos]
+
+    def _indexar_reverso(self) -> None:
+        """CSR transposto por ordenação por contagem: origem, peso e índice de cada meia-aresta, por destino."""
+        nomes, destinos, offsets, pesos = list(self.nomes), self.destinos, self.offsets, self.pesos
+        n, num_e = len(nomes), len(destinos)
+        rev_offsets = array("i", bytes(4 * (n + 1)))
+        for j in destinos:
+            rev_offsets[j + 1] += 1
+        for j in range(n):
+            rev_offsets[j + 1] += rev_offsets[j]
+        proximo = array("i", rev_offsets)
+        origens: List[str] = [""] * num_e
+        rev_pesos = array(pesos.format if isinstance(pesos, memoryview) else pesos.typecode, bytes(8 * num_e))
+        arestas = array("i", bytes(4 * num_e))
+        for i in range(n):
+            u = nomes[i]
+            for k in range(offsets[i], offsets[i + 1]):
+                r = proximo[destinos[k]]
+                proximo[destinos[k]] = r + 1
+                origens[r] = u
+                rev_pesos[r] = pesos[k]
+                arestas[r] = k
+        self._rev_offsets, self._rev_origens, self._rev_pesos, self._rev_arestas = rev_offsets, origens, rev_pesos, arestas
+
+    def arestas(self) -> Iterable[Aresta]:
+        """Materializa cada meia-aresta como Aresta (cópia; alterar .ativa não afeta o mapa)."""
+        nomes, destinos, pesos = self.nomes, self.destinos, self.pesos
+        for i, u in enumerate(nomes):
+            for k in range(self.offsets[i], self.offsets[i + 1]):
+                yield Aresta(u, nomes[destinos[k]], pesos[k],
+                             self._bit(self.ativas, k), self._bit(self.dirigidas, k))
+
+    def rotas(self) -> Iterable[Aresta]:
+        """Uma Aresta por rota, na ordem e orientação de MapaGalactico.rotas (cópias)."""
+        nomes, destinos, pesos = self.nomes, self.destinos, self.pesos
+        return (Aresta(nomes[self._origem(k)], nomes[destinos[k]], pesos[k],
+                       self._bit(self.ativas, k), self._bit(self.dirigidas, k)) for k in self._rotas_indices())
+
+    def remover_rota_aleatoria(self) -> Optional[Tuple[str, str]]:
+        """
+        Desativa uma rota ativa sorteada uniformemente entre as rotas (não entre
+        meias-arestas), como MapaGalactico; retorna (u, v) na orientação da rota.
+        Sorteia por rejeição enquanto muitas rotas seguem ativas; depois passa a
+        um pool das ativas, montado uma vez e mantido em O(1) por remoção.
+        """
+        if self.num_ativas == 0:
+            return None
+        rotas = self._rotas_indices()
+        k = -1
+        if self._pool_ativas is None:
+            for _ in range(32):
+                c = rotas[random.randrange(len(rotas))]
+                if self._bit(self.ativas, c):
+                    k = c; break
+            if k < 0:
+                self._pool_ativas = [r for r, c in enumerate(rotas) if self._bit(self.ativas, c)]
+        if k < 0:
+            pool = self._pool_ativas
+            i = random.randrange(len(pool))
+            r = pool[i]
+            pool[i] = pool[-1]
+            pool.pop()
+            k = rotas[r]
+        self._desativar(k)
+        if self.gemeas[k] >= 0:
+            self._desativar(self.gemeas[k])
+        i = self._origem(k)
+        return (self.nomes[i], self.nomes[self.destinos[k]])
+
+    def _rotas_indices(self):
+        """indices_rotas, ou (sem a ordem de criação) a meia-aresta de menor índice de cada rota."""
+        if self.indices_rotas is None:
+            gemeas = self.gemeas
+            self.indices_rotas = array("i", [k for k in range(len(self.destinos)) if gemeas[k] < 0 or gemeas[k] > k])
+        return self.indices_rotas
+
+    def _origem(self, k: int) -> int:
+        lo, hi = 0, len(self.nomes) - 1
+        while lo < hi:
+            meio = (lo + hi + 1) >> 1
+            if self.offsets[meio] <= k: lo = meio
+            else: hi = meio - 1
+        return lo
+
+    def encontrar_componentes_conexos(self) -> List[Set[str]]:
+        """Componentes fracos (direção ignorada), via união-busca sobre as arestas ativas."""
+        pai = array("i", range(len(self.nomes)))
+
+        def raiz(x: int) -> int:
+            while pai[x] != x:
+                pai[x] = pai[pai[x]]
+                x = pai[x]
+            return x
+
+        for i in range(len(self.nomes)):
+            for j, _ in self.vizinhos_ids(i):
+                ri, rj = raiz(i), raiz(j)
+                if ri != rj: pai[ri] = rj
+        grupos: Dict[int, Set[str]] = {}
+        for i, nome in enumerate(self.nomes):
+            grupos.setdefault(raiz(i), set()).add(nome)
+        return list(grupos.values())
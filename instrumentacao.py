@@ -0,0 +1,109 @@
+"""
+Contadores de operações e tempo por tipo de evento dos geradores de algoritmo.
+
+Opcional: os geradores recebem `medidor=None` e só contam quando um Medidor é
+passado (o custo desligado é um teste de None por operação). `instrumentado`
+envolve o gerador e soma, por tipo de evento, quantos foram emitidos, o tempo
+gasto até produzi-los e os bytes das cópias/deltas que carregam.
+"""
+import csv
+import json
+import sys
+import time
+from collections import Counter
+from typing import Callable, Dict, Generator, Iterable, List
+
+# Campos de evento que são cópias do estado (modo sem delta) ou deltas; os
+# *_reversa são as cópias do lado reverso das buscas bidirecionais.
+CAMPOS_COPIADOS = ("visitados", "dist", "prev", "cor", "mst", "mudancas",
+                   "visitados_reversa", "dist_reversa", "prev_reversa")
+
+
+class Medidor:
+    """Totais de uma execução: contagens do algoritmo e, por tipo de evento, quantidade e tempo."""
+    def __init__(self, algoritmo: str = ""):
+        self.algoritmo = algoritmo
+        self.contagens: Counter = Counter()
+        self.eventos: Counter = Counter()
+        self.tempo_s: Dict[str, float] = {}
+        self.bytes_copiados = 0
+        self.tempo_total_s = 0.0
+        self.concluido = False
+
+    def conta(self, nome: str, n: int = 1) -> None:
+        self.contagens[nome] += n
+
+    def registrar_evento(self, ev: dict, segundos: float) -> None:
+        tipo = ev.get("tipo", "?")
+        self.eventos[tipo] += 1
+        self.tempo_s[tipo] = self.tempo_s.get(tipo, 0.0) + segundos
+        self.tempo_total_s += segundos
+        for campo in CAMPOS_COPIADOS:
+            if campo in ev:
+                self.bytes_copiados += sys.getsizeof(ev[campo])
+
+    def totais(self) -> dict:
+        # Cópias primeiro: com Trabalhador em thread o gerador segue contando enquanto o HUD lê.
+        eventos, tempo_s = Counter(dict(self.eventos)), dict(self.tempo_s)
+        return {
+            "algoritmo": self.algoritmo,
+            "concluido": self.concluido,
+            "eventos_total": sum(eventos.values()),
+            "tempo_total_ms": self.tempo_total_s * 1000,
+            "bytes_copiados": self.bytes_copiados,
+            "contagens": dict(self.contagens),
+            "eventos": {t: {"quantidade": n, "tempo_ms": tempo_s.get(t, 0.0) * 1000}
+                        for t, n in eventos.most_common()},
+        }
+
+    def linhas(self) -> List[str]:
+        """Resumo curto para o painel do HUD."""
+        t = self.totais()
+        linhas = [f"{self.algoritmo}{'' if self.concluido else ' (em curso)'}",
+                  f"eventos {t['eventos_total']}  {t['tempo_total_ms']:.1f} ms  cópias {t['bytes_copiados'] / 1024:.1f} KiB"]
+        linhas += [f"{nome}: {n}" for nome, n in sorted(t["contagens"].items())]
+        linhas += [f"{tipo}: {e['quantidade']} / {e['tempo_ms']:.2f} ms" for tipo, e in t["eventos"].items()]
+        return linhas
+
+
+def instrumentado(funcao: Callable, medidor: Medidor, *args, **kwargs) -> Generator[dict, None, object]:
+    """
+    Roda funcao(*args, medidor=medidor, **kwargs) repassando seus eventos; o tempo
+    até cada evento é atribuído ao tipo dele. Função de módulo para servir ao Trabalhador.
+    """
+    gen = funcao(*args, medidor=medidor, **kwargs)
+    relogio = time.perf_counter
+    try:
+        while True:
+            t0 = relogio()
+            try:
+                ev = next(gen)
+            except StopIteration as fim:
+                medidor.tempo_total_s += relogio() - t0
+                medidor.concluido = True
+                return fim.value
+            medidor.registrar_evento(ev, relogio() - t0)
+            yield ev
+    finally:
+        gen.close()
+
+
+def exportar_json(medidores: Iterable[Medidor], caminho: str) -> None:
+    with open(caminho, "w", encoding="utf-8") as f:
+        json.dump([m.totais() for m in medidores], f, indent=2, ensure_ascii=False)
+
+
+def exportar_csv(medidores: Iterable[Medidor], caminho: str) -> None:
+    """Formato longo (algoritmo, categoria, nome, valor): execuções de variantes se comparam por junção."""
+    with open(caminho, "w", encoding="utf-8", newline="") as f:
+        saida = csv.writer(f)
+        saida.writerow(["execucao", "algoritmo", "categoria", "nome", "valor"])
+        for i, m in enumerate(medidores):
+            t = m.totais()
+            for nome in ("eventos_total", "tempo_total_ms", "bytes_copiados"):
+                saida.writerow([i, m.algoritmo, "total", nome, t[nome]])
+            for nome, n in sorted(t["contagens"].items()):
+                saida.writerow([i, m.algoritmo, "contagem", nome, n])
+            for tipo, e in t["eventos"].items():
+                saida.writerow([i, m.algoritmo, "eventos", tipo, e["quantidade"]])
+                saida.writerow([i, m.algoritmo, "tempo_ms", tipo, round(e["tempo_ms"], 4)])
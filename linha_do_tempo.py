@@ -0,0 +1,213 @@
+"""
+Linha do tempo de uma execução: grava os eventos (modo delta) em registros
+tipados dentro de arrays e guarda o estado completo a cada `intervalo` eventos.
+Ir a qualquer passo custa no máximo `intervalo` aplicações de eventos.
+"""
+from array import array
+from bisect import bisect_right
+from typing import Any, Dict, List, Optional, Tuple
+
+from config import INTERVALO_CHECKPOINT
+from eventos import EstadoAcumulado
+
+# Chave do planeta principal e chaves extras de cada tipo compacto, na ordem (a, b, valor).
+ESQUEMAS: Dict[str, Tuple[str, Optional[str], Optional[str]]] = {
+    "bfs_visit": ("u", None, "nivel"),
+    "bfs_enfileira": ("de", "para", "nivel"),
+    "djk_visita": ("u", None, None),
+    "djk_relax": ("de", "para", "nova_dist"),
+    "bf_relax": ("de", "para", "nova_dist"),
+    "dfs_enter": ("u", None, None),
+    "dfs_exit": ("u", None, None),
+    "dfs_tree": ("de", "para", None),
+    "dfs_backedge": ("de", "para", None),
+    "mst_check": ("de", "para", "peso"),
+    "mst_add": ("de", "para", "peso"),
+    # Lado reverso das buscas bidirecionais.
+    "bfs_visit_reversa": ("u", None, "nivel"),
+    "bfs_enfileira_reversa": ("de", "para", "nivel"),
+    "djk_visita_reversa": ("u", None, None),
+    "djk_relax_reversa": ("de", "para", "nova_dist"),
+}
+TIPOS: List[str] = list(ESQUEMAS)
+_COD_TIPO = {t: i for i, t in enumerate(TIPOS)}
+_EXTRA = 255  # evento guardado inteiro em _extras (msg, *_fim, ciclo_encontrado, formatos desconhecidos)
+
+CAMPOS: List[str] = ["dist", "prev", "cor", "visitados", "mst", "dist_reversa", "prev_reversa", "visitados_reversa"]
+_CAMPOS_PLANETA = ("prev", "prev_reversa")  # valores que são nomes de planeta
+_COD_CAMPO = {c: i for i, c in enumerate(CAMPOS)}
+
+
+class LinhaDoTempo:
+    def __init__(self, grafo, intervalo: int = INTERVALO_CHECKPOINT):
+        self.intervalo = intervalo
+        self.nomes: List[str] = list(grafo.planetas)
+        self.ids: Dict[str, int] = {nome: i for i, nome in enumerate(self.nomes)}
+
+        # Um registro por evento.
+        self._tipo = array("B")
+        self._a = array("i")
+        self._b = array("i")
+        self._valor = array("d")
+        self._ini_mud = array("I", [0])
+        # Um registro por mudança (campo, chave, antigo, novo); chave_b só para arestas da MST.
+        self._campo = array("B")
+        self._chave_a = array("i")
+        self._chave_b = array("i")
+        self._antigo = array("d")
+        self._novo = array("d")
+        self._extras: Dict[int, dict] = {}
+        self._extras_por_tipo: Dict[str, List[int]] = {}  # índices em ordem crescente
+
+        self._cabeca = EstadoAcumulado(grafo)   # sempre após o último evento gravado
+        self._cursor = EstadoAcumulado(grafo)   # posicionado por ir_para()
+        self.posicao = -1                       # último evento aplicado ao cursor
+        self._checkpoints: List[Dict[str, Dict[Any, Any]]] = []
+
+    def __len__(self) -> int:
+        return len(self._tipo)
+
+    # ---------------------------------------------------------------- gravação
+    def registrar(self, ev: dict) -> int:
+        """Grava o evento no fim da linha do tempo e devolve seu índice."""
+        k = len(self._tipo)
+        if k % self.intervalo == 0:
+            self._checkpoints.append(_copiar(self._cabeca.campos))
+        if not self._gravar_compacto(ev):
+            self._tipo.append(_EXTRA)
+            self._a.append(-1); self._b.append(-1); self._valor.append(0.0)
+            self._extras[k] = ev
+            self._extras_por_tipo.setdefault(ev.get("tipo"), []).append(k)
+        self._ini_mud.append(len(self._campo))
+        self._cabeca.aplicar(ev)
+        return k
+
+    def _gravar_compacto(self, ev: dict) -> bool:
+        esquema = ESQUEMAS.get(ev.get("tipo"))
+        if esquema is None:
+            return False
+        chave_a, chave_b, chave_valor = esquema
+        esperadas = {"tipo", "mudancas", chave_a} | {c for c in (chave_b, chave_valor) if c}
+        if not set(ev) <= esperadas or chave_a not in ev:
+            return False
+        mudancas = ev.get("mudancas", ())
+        codificadas = [self._codificar(m) for m in mudancas]
+        if None in codificadas or ev[chave_a] not in self.ids or (chave_b and ev.get(chave_b) not in self.ids):
+            return False
+        self._tipo.append(_COD_TIPO[ev["tipo"]])
+        self._a.append(self.ids[ev[chave_a]])
+        self._b.append(self.ids[ev[chave_b]] if chave_b else -1)
+        self._valor.append(float(ev[chave_valor]) if chave_valor else 0.0)
+        for campo, ka, kb, antigo, novo in codificadas:
+            self._campo.append(campo); self._chave_a.append(ka); self._chave_b.append(kb)
+            self._antigo.append(antigo); self._novo.append(novo)
+        return True
+
+    def _codificar(self, mudanca) -> Optional[Tuple[int, int, int, float, float]]:
+        campo, chave, antigo, novo = mudanca
+        if campo not in _COD_CAMPO:
+            return None
+        if campo == "mst":
+            if chave[0] not in self.ids or chave[1] not in self.ids: return None
+            ka, kb = self.ids[chave[0]], self.ids[chave[1]]
+        else:
+            if chave not in self.ids: return None
+            ka, kb = self.ids[chave], -1
+        if campo in _CAMPOS_PLANETA:
+            if (antigo is not None and antigo not in self.ids) or (novo is not None and novo not in self.ids): return None
+            antigo = self.ids[antigo] if antigo is not None else -1
+            novo = self.ids[novo] if novo is not None else -1
+        return _COD_CAMPO[campo], ka, kb, float(antigo), float(novo)
+
+    # ---------------------------------------------------------------- leitura
+    def evento(self, k: int) -> dict:
+        """Reconstrói o evento k no formato original (dict)."""
+        cod = self._tipo[k]
+        if cod == _EXTRA:
+            return self._extras[k]
+        tipo = TIPOS[cod]
+        chave_a, chave_b, chave_valor = ESQUEMAS[tipo]
+        ev = {"tipo": tipo, chave_a: self.nomes[self._a[k]]}
+        if chave_b: ev[chave_b] = self.nomes[self._b[k]]
+        if chave_valor:
+            v = self._valor[k]
+            ev[chave_valor] = int(v) if chave_valor == "nivel" else v
+        mudancas = self._mudancas(k)
+        if mudancas: ev["mudancas"] = mudancas
+        return ev
+
+    def _mudancas(self, k: int) -> list:
+        nomes = self.nomes
+        resultado = []
+        for j in range(self._ini_mud[k], self._ini_mud[k + 1]):
+            campo = CAMPOS[self._campo[j]]
+            ka, kb = self._chave_a[j], self._chave_b[j]
+            chave = (nomes[ka], nomes[kb]) if campo == "mst" else nomes[ka]
+            resultado.append((campo, chave, _decodificar(campo, self._antigo[j], nomes),
+                              _decodificar(campo, self._novo[j], nomes)))
+        return resultado
+
+    def contar(self, tipo: str) -> int:
+        """Quantos eventos do tipo foram gravados (ex.: djk_visita = planetas fixados)."""
+        if tipo in _COD_TIPO:
+            return self._tipo.count(_COD_TIPO[tipo])
+        return len(self._extras_por_tipo.get(tipo, []))
+
+    def mensagens_ate(self, k: int, n: int = 5) -> List[str]:
+        """Textos das últimas n mensagens emitidas até o evento k (inclusive)."""
+        msgs = self._extras_por_tipo.get("msg", [])
+        fim = bisect_right(msgs, k)
+        return [self._extras[i]["texto"] for i in msgs[max(0, fim - n):fim]]
+
+    def ultimo(self, k: int, tipo: str) -> Optional[dict]:
+        """Último evento não compacto do tipo dado até k (ex.: djk_fim, ciclo_encontrado)."""
+        indices = self._extras_por_tipo.get(tipo, [])
+        i = bisect_right(indices, k)
+        return self._extras[indices[i - 1]] if i else None
+
+    # ---------------------------------------------------------------- navegação
+    def ir_para(self, k: int) -> EstadoAcumulado:
+        """
+        Estado após os eventos 0..k (k = -1: antes do primeiro). Anda a partir da
+        posição atual quando ela está a menos de um intervalo; senão parte do
+        checkpoint anterior a k. Em ambos os casos aplica no máximo `intervalo` eventos.
+        """
+        k = max(-1, min(k, len(self) - 1))
+        p = self.posicao
+        if not (0 <= k - p < self.intervalo or 0 < p - k < self.intervalo):
+            c = min((k + 1) // self.intervalo, len(self._checkpoints) - 1)
+            self._cursor.campos = _copiar(self._checkpoints[c]) if c >= 0 else {}
+            p = max(c, 0) * self.intervalo - 1
+        while p < k:
+            p += 1
+            self._cursor.aplicar(self._so_mudancas(p))
+        while p > k:
+            self._cursor.desfazer(self._so_mudancas(p))
+            p -= 1
+        self.posicao = k
+        return self._cursor
+
+    def _so_mudancas(self, k: int) -> dict:
+        if self._tipo[k] == _EXTRA:
+            return self._extras[k]
+        return {"mudancas": self._mudancas(k)}
+
+    def memoria_aproximada(self) -> int:
+        """Bytes dos arrays de registros (sem contar extras e checkpoints)."""
+        arrays = (self._tipo, self._a, self._b, self._valor, self._ini_mud,
+                  self._campo, self._chave_a, self._chave_b, self._antigo, self._novo)
+        return sum(a.itemsize * len(a) for a in arrays)
+
+
+def _copiar(campos: Dict[str, Dict[Any, Any]]) -> Dict[str, Dict[Any, Any]]:
+    return {c: dict(v) for c, v in campos.items()}
+
+
+def _decodificar(campo: str, valor: float, nomes: List[str]) -> Any:
+    if campo in ("dist", "dist_reversa"):
+        return valor
+    if campo in _CAMPOS_PLANETA:
+        return nomes[int(valor)] if valor >= 0 else None
+    if campo == "cor":
+        return int(valor)
+    return bool(valor)
@@ -1,44 +1,108 @@
-import pygame
 import sys
+import time
+_T_INICIO = time.perf_counter()
+import pygame
+_T_PYGAME = time.perf_counter()
+import argparse
 import math
-from typing import List, Optional, Generator, Tuple, Set
+import os
+from collections import Counter
+from typing import Dict, List, Optional, Generator, Tuple, Set, Union
 
 from config import *
 from ui import UIManager
+from fontes import CacheFontes
+from camera import (Camera, DETALHE_AGREGADO, DETALHE_COMPLETO, agrupar_planetas,
+                    desbastar_rotas, raio_agregado)
 from graph_system import MapaGalactico
+from linha_do_tempo import LinhaDoTempo
+from perfil_quadros import PerfilQuadros
 import levels
+_T_MODULOS = time.perf_counter()
 
-from bfs import bfs_generator
-from dijkstra import dijkstra_generator
-from dfs import detecting_ciclo_generator
-from bellman_ford import bellman_ford_generator
-from mst import mst_prim_generator
+# Os módulos de algoritmo (bfs, dijkstra, ...) e o trabalhador são importados
+# só quando usados, para que a intro apareça sem esperar por eles (e pelo NumPy).
 
-class Jogo:
+# Buscas comparadas, para o mesmo par origem/destino, pelo número de planetas fixados (visitados na BFS).
+ROTULOS_BUSCA = {"dijkstra_heap_generator": "Dijkstra", "astar_generator": "A*", "alt_generator": "ALT",
+                 "dijkstra_bidirecional_generator": "Bidirecional",
+                 "bfs_generator": "BFS", "bfs_bidirecional_generator": "BFS Bidirecional"}
+TIPOS_FIXACAO = ("djk_visita", "djk_visita_reversa", "bfs_visit", "bfs_visit_reversa")
+
+
+class PerfilInicio:
+    """Tempo de cada fase da partida, do import do pygame ao primeiro quadro (--profile-startup)."""
     def __init__(self):
+        self.fases: List[Tuple[str, float]] = [
+            ("import pygame", _T_PYGAME - _T_INICIO),
+            ("import módulos do jogo", _T_MODULOS - _T_PYGAME),
+        ]
+        self._ultimo = time.perf_counter()
+        self.fases.append(("(até Jogo())", self._ultimo - _T_MODULOS))
+
+    def marcar(self, fase: str) -> None:
+        agora = time.perf_counter()
+        self.fases.append((fase, agora - self._ultimo))
+        self._ultimo = agora
+
+    def relatorio(self) -> str:
+        total = sum(t for _, t in self.fases)
+        linhas = [f"{fase:<40} {t * 1000:9.2f} ms  {t / total:6.1%}" for fase, t in self.fases]
+        linhas.append(f"{'total':<40} {total * 1000:9.2f} ms")
+        return "\n".join(linhas)
+
+
+class Jogo:
+    def __init__(self, perfil: Optional[PerfilInicio] = None, trace: Optional[str] = None):
+        self.perfil = perfil
+        # Tempo por etapa de cada quadro ([G] mostra o gráfico, [F9] grava/exporta Chrome trace).
+        self.quadros = PerfilQuadros()
+        self.arquivo_trace = trace  # --trace: grava a sessão inteira e exporta ao sair
+        if trace: self.quadros.gravar()
         pygame.init()
+        self._marcar("pygame.init")
         pygame.display.set_caption("Helldivers: Grafos da Super-Terra v3.5 - High Visibility")
         self.tela = pygame.display.set_mode((LARGURA, ALTURA))
         self.clock = pygame.time.Clock()
+        self._marcar("janela")
         
-        self.fonte_titulo = pygame.font.SysFont("consolas", 22, bold=True)
-        self.fonte_normal = pygame.font.SysFont("consolas", 12)
-        self.fonte_pequena = pygame.font.SysFont("consolas", 11)
-        self.fonte_peso_aresta = pygame.font.SysFont("consolas", 14, bold=True)
+        self.fontes = CacheFontes()
+        self.fonte_titulo = self.fontes.fonte("consolas", 22, negrito=True)
+        self.fonte_normal = self.fontes.fonte("consolas", 12)
+        self.fonte_pequena = self.fontes.fonte("consolas", 11)
+        self.fonte_peso_aresta = self.fontes.fonte("consolas", 14, negrito=True)
+        self._marcar(f"fontes ({self.fontes.acertos} do cache, {self.fontes.falhas} resolvidas)")
         
         self.ui = UIManager(self.tela, self.fonte_titulo, self.fonte_normal, self.fonte_pequena)
-        
-        try:
-            bg_orig = pygame.image.load("assets/background.png").convert()
-            self.background = pygame.transform.scale(bg_orig, (LARGURA, ALTURA))
-        except (pygame.error, FileNotFoundError):
-            self.background = None
+        self._marcar("UIManager (logo)")
+
+        # Fundo do mapa: não aparece na intro, então só é carregado no primeiro quadro do jogo.
+        self._background: Optional[pygame.Surface] = None
+        self._background_carregado = False
 
         self.game_state = "INTRO"
         self.fase = 1
         self.mapa: MapaGalactico = levels.construir_mapa_fase1()
+        # Mapas já construídos por fase: voltar a uma fase só reverte as rotas destruídas.
+        self._mapas_fase: Dict[int, MapaGalactico] = {1: self.mapa}
         self.msgs: List[str] = []
-        self.anim: Optional[Generator] = None
+        self.anim: Optional[Union[Generator, "Trabalhador"]] = None
+        self.modo_execucao = "inline"  # ou "thread"/"processo": gerador roda fora do laço principal (Trabalhador)
+        # Instrumentação opcional ([I]): contagens da execução atual e de todas as medidas na sessão ([X] exporta).
+        self.medir = False
+        self.medidor: Optional["Medidor"] = None
+        self.medicoes: List["Medidor"] = []
+        self.algoritmo_atual: Optional[str] = None  # __name__ do gerador da execução atual
+        # Planetas fixados por busca para o mesmo (mapa, versão, origem, destino), os marcos do ALT
+        # e o fator da heurística do A*.
+        self._fixados_busca: Dict[str, int] = {}
+        self._chave_busca: Optional[tuple] = None
+        self._marcos = None
+        self._fator = None
+        # Gravação da execução atual; pos_linha < len - 1 quando o usuário rebobinou.
+        self.linha: Optional[LinhaDoTempo] = None
+        self.pos_linha = -1
+        self._arrastando_linha = False
         
         self.selecao: Optional[str] = None
         self.selecao2: Optional[str] = None
@@ -53,13 +117,21 @@ class Jogo:
         self.highlight_color: Tuple[int, int, int] = CYAN_NEON
 
         self.mostrar_tutorial = True
-        self.componentes_visuais: Optional[List[Set[str]]] = None
+        self.componentes_visuais: Optional[Dict[str, int]] = None
         self.componentes_timer = 0
+
+        self._camada_estatica: Optional[pygame.Surface] = None
+        self._chave_camada: Optional[tuple] = None
+
+        self.camera = Camera(LARGURA, ALTURA)
+        self._arrastando = False
+        self._lod = DETALHE_COMPLETO  # nível de detalhe da última camada estática
         
         self.modo_manual = False
         self.solicitar_proximo_passo = False
         self.timer_animacao = 0 
         self.DELAY_MS = 600
+        self.modo_turbo = False  # drena quantos passos couberem em ORCAMENTO_TURBO_MS por quadro
         
         self.intro_text = [
             "> Atualizando Interface Tática...",
@@ -69,10 +141,26 @@ class Jogo:
         ]
         self.typed_chars = 0
         self.last_char_time = 0
+        self._marcar("estado inicial + mapa")
+
+    def _marcar(self, fase: str):
+        if self.perfil: self.perfil.marcar(fase)
+
+    @property
+    def background(self) -> Optional[pygame.Surface]:
+        if not self._background_carregado:
+            self._background_carregado = True
+            try:
+                bg_orig = pygame.image.load("assets/background.png").convert()
+                self._background = pygame.transform.scale(bg_orig, (LARGURA, ALTURA))
+            except (pygame.error, FileNotFoundError):
+                self._background = None
+        return self._background
 
     def set_fase(self, f: int):
         self.fase = f
-        self.anim = None
+        self._cancelar_anim()
+        self.linha = None; self.pos_linha = -1
         self._reset_visuals()
         self.selecao = None; self.selecao2 = None; self.componentes_visuais = None
         
@@ -83,10 +171,23 @@ class Jogo:
             4: levels.construir_mapa_fase4,
             5: levels.construir_mapa_fase5
         }
-        self.mapa = map_funcs[f]()
+        if f in self._mapas_fase:
+            self.mapa = self._mapas_fase[f]
+            self.mapa.resetar()
+        else:
+            self.mapa = self._mapas_fase[f] = map_funcs[f]()
+        self._enquadrar_mapa()
         self._say(f"Fase {f} Pronta. [T] Ajuda | [P] Manual")
         self.mostrar_tutorial = True
 
+    def _enquadrar_mapa(self):
+        """Vista padrão (zoom 1) se o mapa cabe na tela; senão ajusta o zoom ao mapa inteiro."""
+        caixa = self.mapa.indice_espacial().caixa
+        if caixa is None or (caixa[0] >= 0 and caixa[1] >= 0 and caixa[2] <= LARGURA and caixa[3] <= ALTURA):
+            self.camera.resetar()
+        else:
+            self.camera.enquadrar(caixa)
+
     def _reset_visuals(self):
         self.caminho_atual = []
         self.ciclo_atual = []
@@ -102,6 +203,8 @@ class Jogo:
     def handle_events(self):
         for ev in pygame.event.get():
             if ev.type == pygame.QUIT or (ev.type == pygame.KEYDOWN and ev.key == pygame.K_ESCAPE):
+                self._cancelar_anim()
+                if self.quadros.gravando: self.exportar_trace()
                 pygame.quit(); sys.exit(0)
             
             if self.game_state == "INTRO":
@@ -114,29 +217,81 @@ class Jogo:
                 if ev.type == pygame.KEYDOWN: self.mostrar_tutorial = False
                 continue
 
+            if ev.type == pygame.MOUSEWHEEL:
+                self.camera.zoom_em(1.15 ** ev.y, pygame.mouse.get_pos())
+            elif ev.type == pygame.MOUSEBUTTONDOWN and ev.button == 3:
+                self._arrastando = True
+            elif ev.type == pygame.MOUSEBUTTONUP and ev.button == 3:
+                self._arrastando = False
+            elif ev.type == pygame.MOUSEMOTION and self._arrastando:
+                self.camera.arrastar(*ev.rel)
+
             if ev.type == pygame.KEYDOWN:
                 key_map = {pygame.K_1: 1, pygame.K_2: 2, pygame.K_3: 3, pygame.K_4: 4, pygame.K_5: 5}
                 if ev.key in key_map: self.set_fase(key_map[ev.key])
                 elif ev.key == pygame.K_t: self.mostrar_tutorial = True
                 elif ev.key == pygame.K_r: self.evento_remover_rota()
+                elif ev.key == pygame.K_u: self.desfazer_dano()
                 elif ev.key == pygame.K_p: 
                     self.modo_manual = not self.modo_manual
                     self._say(f"Modo Manual: {'ATIVADO' if self.modo_manual else 'DESATIVADO'}")
                 elif ev.key == pygame.K_SPACE:
-                    if self.modo_manual and self.anim: self.solicitar_proximo_passo = True
+                    if self.modo_manual and (self.anim or self._revendo()): self.solicitar_proximo_passo = True
+                elif ev.key == pygame.K_LEFTBRACKET: self.ir_para_passo(self.pos_linha - 1)
+                elif ev.key == pygame.K_RIGHTBRACKET: self.ir_para_passo(self.pos_linha + 1)
+                elif ev.key == pygame.K_PAGEUP: self.ir_para_passo(self.pos_linha - 50)
+                elif ev.key == pygame.K_PAGEDOWN: self.ir_para_passo(self.pos_linha + 50)
+                elif ev.key == pygame.K_HOME: self.ir_para_passo(0)
+                elif ev.key == pygame.K_v:
+                    self.modo_turbo = not self.modo_turbo
+                    self._say(f"Turbo: {'ATIVADO' if self.modo_turbo else 'DESATIVADO'}")
+                elif ev.key in (pygame.K_e, pygame.K_END): self.pular_para_fim()
+                elif ev.key == pygame.K_w:
+                    modos = ["inline", "thread", "processo"]
+                    self.modo_execucao = modos[(modos.index(self.modo_execucao) + 1) % len(modos)]
+                    self._say(f"Execução: {self.modo_execucao.upper()} (vale para a próxima execução)")
+                elif ev.key == pygame.K_i:
+                    self.medir = not self.medir
+                    self._say(f"Contadores: {'ATIVADOS' if self.medir else 'DESATIVADOS'} (vale para a próxima execução)")
+                elif ev.key == pygame.K_x: self.exportar_medicoes()
+                elif ev.key == pygame.K_g:
+                    self._say(f"Perfil de quadros: {'ATIVADO' if self.quadros.alternar() else 'DESATIVADO'}")
+                elif ev.key == pygame.K_F9:
+                    if self.quadros.gravando: self.exportar_trace()
+                    else: self.quadros.gravar(); self._say("Gravando trace dos quadros... [F9] para exportar.")
 
                
                 elif ev.key == pygame.K_b: self.iniciar_bfs()
                 elif ev.key == pygame.K_d: self.iniciar_dijkstra()
+                elif ev.key == pygame.K_a: self.iniciar_astar()
+                elif ev.key == pygame.K_l: self.iniciar_alt()
+                elif ev.key == pygame.K_n: self.iniciar_bidirecional()
                 elif ev.key == pygame.K_c: self.iniciar_detecção_ciclo()
                 elif ev.key == pygame.K_f: self.iniciar_bellman_ford()
                 elif ev.key == pygame.K_m: self.iniciar_mst()
+                elif ev.key == pygame.K_k: self.iniciar_kruskal()
+
+                elif ev.key == pygame.K_0: self._enquadrar_mapa()
+                elif ev.key in (pygame.K_LEFT, pygame.K_RIGHT, pygame.K_UP, pygame.K_DOWN):
+                    dx = {pygame.K_LEFT: 60, pygame.K_RIGHT: -60}.get(ev.key, 0)
+                    dy = {pygame.K_UP: 60, pygame.K_DOWN: -60}.get(ev.key, 0)
+                    self.camera.arrastar(dx, dy)
+
+            if ev.type == pygame.MOUSEBUTTONUP and ev.button == 1:
+                self._arrastando_linha = False
+            if ev.type == pygame.MOUSEMOTION and self._arrastando_linha:
+                self._ir_para_x(ev.pos[0])
 
             if ev.type == pygame.MOUSEBUTTONDOWN and ev.button == 1:
                 
-                if self.anim and self.modo_manual and self.ui.rect_btn_proximo.collidepoint(ev.pos):
+                if (self.anim or self._revendo()) and self.modo_manual and self.ui.rect_btn_proximo.collidepoint(ev.pos):
                     self.solicitar_proximo_passo = True
                     return
+
+                if self.linha and len(self.linha) and self.ui.rect_linha_tempo.inflate(0, 12).collidepoint(ev.pos):
+                    self._arrastando_linha = True
+                    self._ir_para_x(ev.pos[0])
+                    continue
                 
                 if self.ui.rect_btn_menos.collidepoint(ev.pos):
                     self.DELAY_MS = max(50, self.DELAY_MS - 50)
@@ -152,46 +307,165 @@ class Jogo:
                     else:
                         self.selecao2 = clicado
                         self._say(f"Destino: {clicado}")
+                        if self.fase in (2, 4, 5) and not self.anim: self.mostrar_rota_em_cache()
 
     def evento_remover_rota(self):
-        comps_antes = len(self.mapa.encontrar_componentes_conexos())
+        comps_antes = self.mapa.num_componentes()
         removida = self.mapa.remover_rota_aleatoria()
         if not removida: self._say("Nenhuma rota vulnerável."); return
         self._say(f"Rota {removida[0]} <-> {removida[1]} destruída!")
-        comps_depois = self.mapa.encontrar_componentes_conexos()
-        if len(comps_depois) > comps_antes:
-            self._say(f"ALERTA: Fragmentação! {len(comps_depois)} setores isolados.")
-            self.componentes_visuais = comps_depois
+        comps_depois = self.mapa.num_componentes()
+        if comps_depois > comps_antes:
+            self._say(f"ALERTA: Fragmentação! {comps_depois} setores isolados.")
+            comps = self.mapa.encontrar_componentes_conexos()
+            self.componentes_visuais = {nome: i for i, comp in enumerate(comps) for nome in comp}
             self.componentes_timer = FPS * 5
 
+    def _iniciar_anim(self, funcao, *args, **kwargs):
+        """Começa uma execução: inline (gerador no laço principal) ou num Trabalhador."""
+        self._cancelar_anim()
+        self.linha = LinhaDoTempo(self.mapa)
+        self.pos_linha = -1
+        self.algoritmo_atual = funcao.__name__
+        modo = self.modo_execucao
+        self.medidor = None
+        if self.medir:
+            from instrumentacao import Medidor, instrumentado
+            self.medidor = Medidor(funcao.__name__)
+            self.medicoes.append(self.medidor)
+            funcao, args = instrumentado, (funcao, self.medidor, *args)
+            if modo == "processo":
+                modo = "thread"  # as contagens ficariam no outro processo
+                self._say("Contadores ativos: execução em THREAD em vez de processo.")
+        if modo == "inline":
+            self.anim = funcao(*args, **kwargs)
+        else:
+            from trabalhador import Trabalhador
+            self.anim = Trabalhador(funcao, *args, processo=modo == "processo", **kwargs)
+
+    def _cancelar_anim(self):
+        if self.anim is not None:
+            self.anim.close()
+            self.anim = None
+
+    def _proximo_passo(self) -> Optional[dict]:
+        """Próximo evento sem bloquear: None se o trabalhador ainda não o produziu; StopIteration no fim."""
+        if hasattr(self.anim, "tentar_proximo"):  # trabalhador.Trabalhador
+            return self.anim.tentar_proximo()
+        return next(self.anim)
+
+    def exportar_medicoes(self):
+        """Grava as medições da sessão em DIR_MEDICOES, em JSON e CSV."""
+        if not self.medicoes: self._say("Nenhuma execução medida. Ative os contadores com [I]."); return
+        from instrumentacao import exportar_csv, exportar_json
+        os.makedirs(DIR_MEDICOES, exist_ok=True)
+        base = os.path.join(DIR_MEDICOES, time.strftime("medicao-%Y%m%d-%H%M%S"))
+        exportar_json(self.medicoes, base + ".json")
+        exportar_csv(self.medicoes, base + ".csv")
+        self._say(f"{len(self.medicoes)} medição(ões) exportada(s) em {base}.json/.csv")
+
+    def exportar_trace(self):
+        """Encerra a gravação dos quadros e grava o Chrome trace (--trace ou DIR_MEDICOES)."""
+        caminho = self.arquivo_trace
+        if not caminho:
+            os.makedirs(DIR_MEDICOES, exist_ok=True)
+            caminho = os.path.join(DIR_MEDICOES, time.strftime("trace-%Y%m%d-%H%M%S.json"))
+        n = self.quadros.exportar_trace(caminho)
+        self.arquivo_trace = None
+        self._say(f"Trace com {n} eventos gravado em {caminho} (chrome://tracing ou ui.perfetto.dev).")
+
+    def desfazer_dano(self):
+        """Reverte a última rota destruída (histórico do mapa, O(1) + componentes)."""
+        desfeita = self.mapa.desfazer()
+        if not desfeita: self._say("Nenhum dano a desfazer."); return
+        u, v, ativa = desfeita
+        self._say(f"Rota {u} <-> {v} {'restaurada' if ativa else 'destruída'}. {self.mapa.num_componentes()} setor(es).")
+        self.componentes_visuais = None
+        self.componentes_timer = 0
+
+    def mostrar_rota_em_cache(self):
+        """
+        Rota mínima origem -> destino pela cache de distâncias do mapa: a
+        primeira consulta de uma origem calcula a linha, as seguintes custam
+        O(tamanho do caminho) até uma rota mudar. [D]/[F] seguem animando a busca.
+        """
+        cache = self.mapa.cache_distancias()
+        try:
+            caminho = cache.caminho(self.selecao, self.selecao2)
+        except ValueError:
+            self._say("Ciclo negativo alcançável: sem rota mínima definida. Use [F]."); return
+        self._reset_visuals()
+        if not caminho: self._say("Destino inalcançável a partir da origem."); return
+        self.caminho_atual = caminho
+        self._say(f"Rota em cache: custo {cache.distancia(self.selecao, self.selecao2):.1f}, {len(caminho) - 1} salto(s).")
+
     def iniciar_bfs(self):
         if self.fase != 1: return
-        if self.selecao: self._reset_visuals(); self.anim = bfs_generator(self.mapa, self.selecao)
+        from bfs import bfs_generator
+        if self.selecao: self._reset_visuals(); self._iniciar_anim(bfs_generator, self.mapa, self.selecao, delta=True)
         else: self._say("Selecione Origem.")
 
     def iniciar_dijkstra(self):
         if self.fase != 2: return
-        if self.selecao and self.selecao2: self._reset_visuals(); self.anim = dijkstra_generator(self.mapa, self.selecao, self.selecao2)
+        from dijkstra import dijkstra_heap_generator
+        if self.selecao and self.selecao2: self._reset_visuals(); self._iniciar_anim(dijkstra_heap_generator, self.mapa, self.selecao, self.selecao2, delta=True)
         else: self._say("Selecione Origem e Destino.")
 
+    def iniciar_astar(self):
+        if self.fase != 2: return
+        from astar import FatorEuclidiano, astar_generator
+        if not (self.selecao and self.selecao2): self._say("Selecione Origem e Destino."); return
+        if self._fator is None or not self._fator.valido_para(self.mapa):
+            self._fator = FatorEuclidiano(self.mapa)
+        self._reset_visuals(); self._iniciar_anim(astar_generator, self.mapa, self.selecao, self.selecao2, delta=True, fator=self._fator)
+
+    def iniciar_alt(self):
+        if self.fase != 2: return
+        from astar import Marcos, alt_generator
+        if not (self.selecao and self.selecao2): self._say("Selecione Origem e Destino."); return
+        if self._marcos is None or not self._marcos.valido_para(self.mapa):
+            self._marcos = Marcos(self.mapa)
+        self._reset_visuals(); self._iniciar_anim(alt_generator, self.mapa, self.selecao, self.selecao2, delta=True, marcos=self._marcos)
+
+    def iniciar_bidirecional(self):
+        """BFS (Fase 1) ou Dijkstra (Fases 2 e 4) crescendo de origem e destino ao mesmo tempo."""
+        if self.fase not in (1, 2, 4): return
+        if not (self.selecao and self.selecao2): self._say("Selecione Origem e Destino."); return
+        if self.fase == 1:
+            from bfs import bfs_bidirecional_generator as gerador
+        else:
+            if any(e.peso < 0 for e in self.mapa.rotas() if e.ativa):
+                self._say("Pesos negativos: a busca bidirecional não se aplica. Use [F]."); return
+            from dijkstra import dijkstra_bidirecional_generator as gerador
+        self._reset_visuals(); self._iniciar_anim(gerador, self.mapa, self.selecao, self.selecao2, delta=True)
+
     def iniciar_detecção_ciclo(self):
         if self.fase != 3: return
-        self._reset_visuals(); self.anim = detecting_ciclo_generator(self.mapa)
+        from dfs import detecting_ciclo_generator
+        self._reset_visuals(); self._iniciar_anim(detecting_ciclo_generator, self.mapa, delta=True)
 
     def iniciar_bellman_ford(self):
         if self.fase != 4: return
-        if self.selecao and self.selecao2: self._reset_visuals(); self.anim = bellman_ford_generator(self.mapa, self.selecao, self.selecao2)
+        from bellman_ford import bellman_ford_vetorizado_generator
+        if self.selecao and self.selecao2: self._reset_visuals(); self._iniciar_anim(bellman_ford_vetorizado_generator, self.mapa, self.selecao, self.selecao2, delta=True)
         else: self._say("Selecione Origem e Destino.")
 
     def iniciar_mst(self):
         if self.fase != 5: return
-        if self.selecao: self._reset_visuals(); self.anim = mst_prim_generator(self.mapa, self.selecao)
+        from mst import mst_prim_heap_generator
+        if self.selecao: self._reset_visuals(); self._iniciar_anim(mst_prim_heap_generator, self.mapa, self.selecao, delta=True)
         else: self._say("Selecione Origem.")
 
+    def iniciar_kruskal(self):
+        if self.fase != 5: return
+        from mst import mst_kruskal_generator
+        self._reset_visuals(); self._iniciar_anim(mst_kruskal_generator, self.mapa, delta=True)
+
     def _planeta_em(self, pos) -> Optional[str]:
-        for nome, p in self.mapa.planetas.items():
-            if math.hypot(p.pos[0] - pos[0], p.pos[1] - pos[1]) <= RAIO_PLANETA: return nome
-        return None
+        """Planeta sob o ponto de tela pos (raio de clique de pelo menos 6 px mesmo com zoom baixo)."""
+        x, y = self.camera.para_mundo(pos)
+        raio = max(RAIO_PLANETA, 6 / self.camera.zoom)
+        return self.mapa.indice_espacial().mais_proximo(x, y, raio_max=raio)
 
     def update(self):
         if self.game_state == "INTRO":
@@ -202,7 +476,9 @@ class Jogo:
         avancar = False
         agora = pygame.time.get_ticks()
 
-        if self.anim:
+        if (self.anim or self._revendo()) and self.modo_turbo and not self.modo_manual:
+            self._avancar_por_orcamento(ORCAMENTO_TURBO_MS / 1000)
+        elif self.anim or self._revendo():
             if not self.modo_manual:
                 if agora - self.timer_animacao > self.DELAY_MS:
                     avancar = True
@@ -212,20 +488,119 @@ class Jogo:
                     avancar = True
                     self.solicitar_proximo_passo = False
         
-        if avancar and self.anim:
+        if avancar:
             try:
-                passo = next(self.anim)
-                self._processa_passo(passo)
+                if not self._avancar_um() and self.modo_manual:
+                    self.solicitar_proximo_passo = True  # ainda não produzido: tenta no próximo quadro
             except StopIteration:
-                self.anim = None
-                self.highlight_node = None
-                self.highlight_edge = None
-                self.highlight_neighbors = []
+                self._encerrar_animacao()
         
         if self.componentes_timer > 0:
             self.componentes_timer -= 1
             if self.componentes_timer == 0: self.componentes_visuais = None
 
+    def _encerrar_animacao(self):
+        self.anim = None
+        self._comparar_buscas()
+        self.highlight_node = None
+        self.highlight_edge = None
+        self.highlight_neighbors = []
+
+    def _comparar_buscas(self):
+        """Ao fim de uma busca da Fase 2, compara os planetas fixados com as buscas anteriores do mesmo par."""
+        rotulo = ROTULOS_BUSCA.get(self.algoritmo_atual)
+        if rotulo is None or self.linha is None: return
+        chave = (id(self.mapa), self.mapa.versao, self.selecao, self.selecao2)
+        if chave != self._chave_busca:
+            self._chave_busca, self._fixados_busca = chave, {}
+        self._fixados_busca[rotulo] = sum(self.linha.contar(t) for t in TIPOS_FIXACAO)
+        if len(self._fixados_busca) > 1:
+            self._say("Planetas fixados: " + " | ".join(f"{r} {n}" for r, n in self._fixados_busca.items()))
+
+    def _avancar_por_orcamento(self, orcamento_s: float):
+        """
+        Modo turbo: aplica passos até estourar o orçamento de tempo do quadro.
+        Cada passo sobrescreve os destaques do anterior, então só o último
+        estado chega a ser desenhado.
+        """
+        limite = time.perf_counter() + orcamento_s
+        while True:
+            try:
+                if not self._avancar_um():
+                    return  # fila do trabalhador vazia: o resto fica para o próximo quadro
+            except StopIteration:
+                self._encerrar_animacao()
+                return
+            if time.perf_counter() >= limite:
+                return
+
+    def _avancar_um(self) -> bool:
+        """
+        Um passo adiante: repete a linha do tempo se ela foi rebobinada, senão
+        consome e grava o próximo evento do gerador. False se nada estava pronto.
+        """
+        if self._revendo():
+            self.ir_para_passo(self.pos_linha + 1)
+            return True
+        if not self.anim:
+            return False
+        passo = self._proximo_passo()
+        if passo is None:
+            return False
+        if self.linha is not None:
+            self.pos_linha = self.linha.registrar(passo)
+        self._processa_passo(passo)
+        return True
+
+    def _revendo(self) -> bool:
+        return self.linha is not None and self.pos_linha < len(self.linha) - 1
+
+    def ir_para_passo(self, k: int):
+        """
+        Mostra a execução gravada logo após o evento k: estado reconstruído pela
+        linha do tempo (a partir do checkpoint mais próximo) e destaques do evento k.
+        """
+        if not self.linha or not len(self.linha): return
+        k = max(0, min(k, len(self.linha) - 1))
+        estado = self.linha.ir_para(k)
+        self._reset_visuals()
+        fim_djk = self.linha.ultimo(k, "djk_fim")
+        ciclo = self.linha.ultimo(k, "ciclo_encontrado")
+        fim_mst = self.linha.ultimo(k, "mst_fim")
+        self.msgs = self.linha.mensagens_ate(k)
+        evento = self.linha.evento(k)
+        if evento.get("tipo") != "msg": self._processa_passo(evento)
+        self.caminho_atual = list(fim_djk.get("caminho", [])) if fim_djk else []
+        self.ciclo_atual = list(ciclo.get("ciclo", [])) if ciclo else []
+        self.mst_atual = list(fim_mst["mst"]) if fim_mst else list(estado.campos.get("mst", {}))
+        self.pos_linha = k
+
+    def _ir_para_x(self, x: int):
+        """Clique/arrasto na barra da linha do tempo: passo proporcional à posição x."""
+        barra = self.ui.rect_linha_tempo
+        frac = min(1.0, max(0.0, (x - barra.left) / barra.width))
+        self.ir_para_passo(round(frac * (len(self.linha) - 1)))
+
+    def pular_para_fim(self):
+        """
+        Roda o gerador até o fim sem processar os passos intermediários e aplica
+        só o resultado final (djk_fim, mst_fim ou ciclo_encontrado) e a última mensagem.
+        """
+        if not self.anim:
+            if self._revendo(): self.ir_para_passo(len(self.linha) - 1)
+            return
+        final: Optional[dict] = None
+        ultima_msg: Optional[dict] = None
+        for passo in self.anim:
+            if self.linha is not None: self.pos_linha = self.linha.registrar(passo)
+            t = passo.get("tipo")
+            if t in ("djk_fim", "mst_fim", "ciclo_encontrado"): final = passo
+            elif t == "msg": ultima_msg = passo
+        self._reset_visuals()
+        if ultima_msg: self._processa_passo(ultima_msg)
+        if final: self._processa_passo(final)
+        self._encerrar_animacao()
+
     def _processa_passo(self, passo: dict):
         t = passo.get("tipo")
         
@@ -251,6 +626,15 @@ class Jogo:
             self.highlight_edge = (passo["de"], passo["para"])
             self.highlight_neighbors = [passo["para"]]
             self.highlight_color = MAGENTA_NEON
+        # Lado reverso das buscas bidirecionais (parte do destino).
+        elif t in ("bfs_visit_reversa", "djk_visita_reversa"):
+            self.highlight_node = passo["u"]
+            self.highlight_color = AMARELO
+        elif t in ("bfs_enfileira_reversa", "djk_relax_reversa"):
+            self.highlight_node = passo["de"] if t == "bfs_enfileira_reversa" else None
+            self.highlight_edge = (passo["de"], passo["para"])
+            self.highlight_neighbors = [passo["para"]]
+            self.highlight_color = VERDE_NEON
         elif t == "djk_fim":
             self.caminho_atual = passo.get("caminho", [])
             custo = passo.get("custo", 0)
@@ -276,104 +660,228 @@ class Jogo:
             self.highlight_edge = (passo["de"], passo["para"])
             self.highlight_color = CINZA_CLARO
         elif t == "mst_add":
-            self.mst_atual = passo.get("mst", [])
+            if "mst" in passo: self.mst_atual = passo["mst"]
+            else: self.mst_atual.append((passo["de"], passo["para"]))
             self.highlight_edge = (passo["de"], passo["para"])
             self.highlight_color = VERDE_NEON
         elif t == "mst_fim":
             self.mst_atual = passo.get("mst", [])
             self._say(f"MST Custo: {passo.get('custo_total'):.1f}")
 
+    def _camada_estatica_atual(self) -> pygame.Surface:
+        """
+        Fundo + mapa (rotas, setas, pesos, planetas e nomes) pré-renderizados.
+        Só é refeita quando muda o mapa, sua versão (rota destruída/adicionada),
+        a fase ou a câmera. Desenha apenas o que cai no viewport, no nível de
+        detalhe que o zoom permite.
+        """
+        chave = (id(self.mapa), self.mapa.versao, self.fase, self.camera.estado())
+        if self._camada_estatica is not None and self._chave_camada == chave:
+            return self._camada_estatica
+
+        camada = pygame.Surface((LARGURA, ALTURA)).convert()
+        if self.background: camada.blit(self.background, (0, 0))
+        else: camada.fill(PRETO)
+
+        visiveis, rotas = self._no_viewport()
+        self._lod = self.camera.nivel_detalhe(len(visiveis))
+
+        # Etapas "draw/camada/*": partes do redesenho da camada, dentro de "draw/camada" no perfil.
+        q = self.quadros
+        if self._lod == DETALHE_AGREGADO:
+            with q.etapa("draw/camada/agregado"):
+                self._desenhar_agregado(visiveis, rotas, camada)
+        else:
+            tela = self.camera.para_tela
+            planetas = self.mapa.planetas
+            with q.etapa("draw/camada/arestas"):
+                for e in rotas:
+                    u_pos, v_pos = tela(planetas[e.u].pos), tela(planetas[e.v].pos)
+                    cor = CINZA_CLARO if e.ativa else (50, 50, 50)
+                    pygame.draw.line(camada, cor, u_pos, v_pos, self.camera.escala(3) if e.ativa else 1)
+                    if e.dirigida and e.ativa: self._desenhar_seta(u_pos, v_pos, cor, camada)
+
+            # Pesos numa segunda passada: ficam por cima de todas as linhas e têm etapa própria no perfil.
+            if self._lod == DETALHE_COMPLETO and self.fase in [2, 4, 5]:
+                with q.etapa("draw/camada/pesos"):
+                    for e in rotas:
+                        if e.ativa:
+                            self._desenhar_peso(tela(planetas[e.u].pos), tela(planetas[e.v].pos), e.peso, CINZA_CLARO, camada)
+
+            with q.etapa("draw/camada/planetas"):
+                for nome in visiveis:
+                    p = planetas[nome]
+                    self._desenhar_planeta(nome, CORES_FACCAO.get(p.faccao_inimiga, AZUL), camada)
+
+        self._camada_estatica = camada
+        self._chave_camada = chave
+        return camada
+
+    def _no_viewport(self) -> Tuple[List[str], List]:
+        """Planetas e rotas que podem aparecer na tela (com folga para rótulos)."""
+        indice = self.mapa.indice_espacial()
+        x0, y0, x1, y1 = self.camera.retangulo_mundo(margem_px=2 * RAIO_PLANETA)
+        caixa = indice.caixa
+        if caixa is None or (x0 <= caixa[0] and y0 <= caixa[1] and caixa[2] <= x1 and caixa[3] <= y1):
+            # Mapa inteiro na tela: evita a deduplicação da consulta por retângulo.
+            return list(self.mapa.planetas), self.mapa.rotas()
+        return indice.planetas_no_retangulo(x0, y0, x1, y1), indice.rotas_no_retangulo(x0, y0, x1, y1)
+
+    def _desenhar_agregado(self, visiveis: List[str], rotas, sup: pygame.Surface):
+        """LOD baixo: um glifo por célula de tela e uma linha fina por par de células."""
+        cam, planetas = self.camera, self.mapa.planetas
+        pos = self.mapa.indice_espacial().pos
+        grupos = agrupar_planetas(cam, visiveis, pos)
+        meio = TAM_AGREGADO_PX // 2
+        ancora = {c: (cam.para_tela(pos[nomes[0]]) if len(nomes) == 1 else
+                      (c[0] * TAM_AGREGADO_PX + meio, c[1] * TAM_AGREGADO_PX + meio))
+                  for c, nomes in grupos.items()}
+        centro = lambda c: ancora.get(c) or (c[0] * TAM_AGREGADO_PX + meio, c[1] * TAM_AGREGADO_PX + meio)
+
+        for (a, b), ativa in desbastar_rotas(cam, rotas, pos).items():
+            pygame.draw.line(sup, CINZA_CLARO if ativa else (50, 50, 50), centro(a), centro(b), 1)
+
+        raio_unico = cam.escala(RAIO_PLANETA, 2)
+        for c, nomes in grupos.items():
+            if len(nomes) == 1:
+                cor = CORES_FACCAO.get(planetas[nomes[0]].faccao_inimiga, AZUL)
+                pygame.draw.circle(sup, cor, ancora[c], raio_unico)
+                continue
+            faccao = Counter(planetas[n].faccao_inimiga for n in nomes).most_common(1)[0][0]
+            r = raio_agregado(len(nomes))
+            pygame.draw.circle(sup, CORES_FACCAO.get(faccao, AZUL), ancora[c], r)
+            pygame.draw.circle(sup, BRANCO, ancora[c], r, 1)
+
+    def _desenhar_planeta(self, nome: str, cor_base, sup: pygame.Surface):
+        p = self.mapa.planetas[nome]
+        pos = self.camera.para_tela(p.pos)
+        raio = self.camera.escala(RAIO_PLANETA, 2)
+        pygame.draw.circle(sup, cor_base, pos, raio)
+        if raio >= 4: pygame.draw.circle(sup, PRETO, pos, raio, 2)
+        if self._lod == DETALHE_COMPLETO:
+            self.ui._draw_text(nome, pos[0], pos[1] - self.camera.escala(25), font=self.ui.fonte_pequena, center_x=True, destino=sup)
+
     def draw(self):
-        if self.background: self.tela.blit(self.background, (0, 0))
-        else: self.tela.fill(PRETO)
-        
         if self.game_state == "INTRO":
             self.ui.draw_intro(self.typed_chars, self.intro_text)
             pygame.display.flip(); return
 
-        for e in self.mapa.arestas():
-            u_pos = self.mapa.planetas[e.u].pos
-            v_pos = self.mapa.planetas[e.v].pos
-            cor = CINZA_CLARO; width = 3
-            
-            if self.mst_atual:
-                if (e.u, e.v) in self.mst_atual or (e.v, e.u) in self.mst_atual:
-                    cor = (255, 180, 0); width = 6
+        q = self.quadros
+        with q.etapa("draw/camada"):
+            self.tela.blit(self._camada_estatica_atual(), (0, 0))
+
+        # Sobreposições: o custo por quadro depende só do que está destacado.
+        planetas = self.mapa.planetas
+        cam = self.camera
+        tela = lambda nome: cam.para_tela(planetas[nome].pos)
+        com_texto = self._lod == DETALHE_COMPLETO
+        redesenhar: Set[str] = set()
+
+        with q.etapa("draw/sobreposicoes"):
+            for u, v in self.mst_atual:
+                e = self.mapa.aresta(u, v) or self.mapa.aresta(v, u)
+                if e is None or not e.ativa: continue
+                cor = (255, 180, 0)
+                pygame.draw.line(self.tela, cor, tela(e.u), tela(e.v), cam.escala(6, 2))
+                if e.dirigida: self._desenhar_seta(tela(e.u), tela(e.v), cor)
+                if com_texto and self.fase in [2, 4, 5]: self._desenhar_peso(tela(e.u), tela(e.v), e.peso, cor)
+                redesenhar.update((u, v))
+
+            if len(self.caminho_atual) >= 2:
+                pts = [tela(p) for p in self.caminho_atual]
+                pygame.draw.lines(self.tela, VERDE, False, pts, cam.escala(6, 2))
+                redesenhar.update(self.caminho_atual)
+            if len(self.ciclo_atual) >= 1:
+                pts = [tela(p) for p in self.ciclo_atual] + [tela(self.ciclo_atual[0])]
+                pygame.draw.lines(self.tela, VERMELHO, False, pts, cam.escala(6, 2))
+                redesenhar.update(self.ciclo_atual)
+
+            if self.highlight_edge:
+                u, v = self.highlight_edge
+                if u in planetas and v in planetas:
+                    pygame.draw.line(self.tela, self.highlight_color, tela(u), tela(v), cam.escala(8, 3))
+                    redesenhar.update((u, v))
+
+        with q.etapa("draw/planetas"):
+            piscando = bool(self.componentes_visuais) and self.componentes_timer > 0 and (self.componentes_timer // 10) % 2 == 0
+            if piscando: redesenhar.update(self.componentes_visuais)
+            sob_mouse = self._planeta_em(pygame.mouse.get_pos())
+            for nome in (self.selecao, self.selecao2, self.highlight_node, sob_mouse, *self.highlight_neighbors):
+                if nome in planetas: redesenhar.add(nome)
+
+            raio = cam.escala(RAIO_PLANETA, 2)
+            for nome in redesenhar:
+                p = planetas[nome]
+                pos = tela(nome)
+                cor_base = CORES_FACCAO.get(p.faccao_inimiga, AZUL)
+                if piscando and nome in self.componentes_visuais:
+                    cor_base = [VERDE, VERMELHO, AZUL, AMARELO][self.componentes_visuais[nome] % 4]
+                self._desenhar_planeta(nome, cor_base, self.tela)
+
+                if nome == sob_mouse: pygame.draw.circle(self.tela, CINZA_CLARO, pos, raio + 3, 1)
+                if nome == self.selecao: pygame.draw.circle(self.tela, BRANCO, pos, raio + 4, 2)
+                if nome == self.selecao2: pygame.draw.circle(self.tela, VERDE, pos, raio + 4, 2)
             
-            if not e.ativa: cor = (50, 50, 50); width = 1
-            
-            pygame.draw.line(self.tela, cor, u_pos, v_pos, width)
-            if e.dirigida and e.ativa: self._desenhar_seta(u_pos, v_pos, cor)
-            
-            if (self.fase in [2, 4, 5]) and e.ativa: 
-                self._desenhar_peso(u_pos, v_pos, e.peso, cor)
-
-        if len(self.caminho_atual) >= 2:
-            pts = [self.mapa.planetas[p].pos for p in self.caminho_atual]
-            pygame.draw.lines(self.tela, VERDE, False, pts, 6)
-        if len(self.ciclo_atual) >= 1:
-            pts = [self.mapa.planetas[p].pos for p in self.ciclo_atual] + [self.mapa.planetas[self.ciclo_atual[0]].pos]
-            pygame.draw.lines(self.tela, VERMELHO, False, pts, 6)
-
-        if self.highlight_edge:
-            u, v = self.highlight_edge
-            if u in self.mapa.planetas and v in self.mapa.planetas:
-                pygame.draw.line(self.tela, self.highlight_color, self.mapa.planetas[u].pos, self.mapa.planetas[v].pos, 8)
-
-        for nome, p in self.mapa.planetas.items():
-            cor_base = CORES_FACCAO.get(p.faccao_inimiga, AZUL)
-            if self.componentes_visuais and self.componentes_timer > 0:
-                for i, comp in enumerate(self.componentes_visuais):
-                    if nome in comp and (self.componentes_timer // 10) % 2 == 0:
-                        cor_base = [VERDE, VERMELHO, AZUL, AMARELO][i % 4]; break
-
-            pygame.draw.circle(self.tela, cor_base, p.pos, RAIO_PLANETA)
-            pygame.draw.circle(self.tela, PRETO, p.pos, RAIO_PLANETA, 2)
-            
-            if nome == self.selecao: pygame.draw.circle(self.tela, BRANCO, p.pos, RAIO_PLANETA + 4, 2)
-            if nome == self.selecao2: pygame.draw.circle(self.tela, VERDE, p.pos, RAIO_PLANETA + 4, 2)
-            
-            if nome == self.highlight_node:
-                pygame.draw.circle(self.tela, self.highlight_color, p.pos, RAIO_PLANETA + 8, 4)
-            if nome in self.highlight_neighbors:
-                pygame.draw.circle(self.tela, LARANJA_VIVO, p.pos, RAIO_PLANETA + 6, 2)
-
-            self.ui._draw_text(nome, p.pos[0], p.pos[1] - 25, font=self.ui.fonte_pequena, center_x=True)
-
-        self.ui.draw_hud(self.fase, self.msgs, self.modo_manual)
-        self.ui.draw_speed_controls(self.DELAY_MS)
-        self.ui.draw_playback_controls(bool(self.anim), self.modo_manual)
-        if self.mostrar_tutorial: self.ui.draw_tutorial(self.fase)
-        pygame.display.flip()
-
-    def _desenhar_seta(self, a, b, cor):
+                if nome == self.highlight_node:
+                    pygame.draw.circle(self.tela, self.highlight_color, pos, raio + 8, 4)
+                if nome in self.highlight_neighbors:
+                    pygame.draw.circle(self.tela, LARANJA_VIVO, pos, raio + 6, 2)
+
+        with q.etapa("draw/hud"):
+            self.ui.draw_hud(self.fase, self.msgs, self.modo_manual)
+            self.ui.draw_speed_controls(self.DELAY_MS, self.modo_turbo)
+            self.ui.draw_playback_controls(bool(self.anim) or self._revendo(), self.modo_manual)
+            if self.linha and len(self.linha): self.ui.draw_linha_do_tempo(self.pos_linha, len(self.linha), bool(self.anim))
+            if self.medir and self.medidor: self.ui.draw_painel_medicao(self.medidor.linhas())
+        if self.mostrar_tutorial:
+            with q.etapa("draw/tutorial"): self.ui.draw_tutorial(self.fase)
+        if q.ativo:
+            with q.etapa("draw/perfil"): self.ui.draw_grafico_quadros(q.tempos_quadro(), q.linhas(), 1000 / FPS)
+        with q.etapa("draw/flip"): pygame.display.flip()
+
+    def _desenhar_seta(self, a, b, cor, sup: Optional[pygame.Surface] = None):
         ang = math.atan2(b[1] - a[1], b[0] - a[0])
-        p1 = (b[0] - 22 * math.cos(ang), b[1] - 22 * math.sin(ang))
-        p2 = (p1[0] - 10 * math.cos(ang - 0.5), p1[1] - 10 * math.sin(ang - 0.5))
-        p3 = (p1[0] - 10 * math.cos(ang + 0.5), p1[1] - 10 * math.sin(ang + 0.5))
-        pygame.draw.polygon(self.tela, cor, [p1, p2, p3])
-
-    def _desenhar_peso(self, a, b, w, cor):
+        recuo, ponta = self.camera.escala(RAIO_PLANETA + 2, 3), self.camera.escala(10, 3)
+        p1 = (b[0] - recuo * math.cos(ang), b[1] - recuo * math.sin(ang))
+        p2 = (p1[0] - ponta * math.cos(ang - 0.5), p1[1] - ponta * math.sin(ang - 0.5))
+        p3 = (p1[0] - ponta * math.cos(ang + 0.5), p1[1] - ponta * math.sin(ang + 0.5))
+        pygame.draw.polygon(sup or self.tela, cor, [p1, p2, p3])
+
+    def _desenhar_peso(self, a, b, w, cor, sup: Optional[pygame.Surface] = None):
+        sup = sup or self.tela
         mx, my = (a[0] + b[0]) / 2, (a[1] + b[1]) / 2
         
         texto_str = f"{int(w)}"
-        surf = self.fonte_peso_aresta.render(texto_str, True, BRANCO)
+        surf = self.ui.render_texto(texto_str, self.fonte_peso_aresta)
         rect = surf.get_rect(center=(mx, my))
         
         bg_rect = rect.inflate(10, 6)
         
-        pygame.draw.rect(self.tela, (20, 20, 30), bg_rect, border_radius=4)
+        pygame.draw.rect(sup, (20, 20, 30), bg_rect, border_radius=4)
         
-        pygame.draw.rect(self.tela, cor, bg_rect, 1, border_radius=4)
+        pygame.draw.rect(sup, cor, bg_rect, 1, border_radius=4)
         
-        self.tela.blit(surf, rect)
+        sup.blit(surf, rect)
 
     def run(self):
+        q = self.quadros
         while True:
-            self.handle_events()
-            self.update()
-            self.draw()
+            q.iniciar_quadro()
+            with q.etapa("eventos"): self.handle_events()
+            with q.etapa("update"): self.update()
+            with q.etapa("draw"): self.draw()
+            q.terminar_quadro()
+            if self.perfil:
+                self._marcar("primeiro quadro")
+                print(self.perfil.relatorio(), file=sys.stderr)
+                self.perfil = None
             self.clock.tick(FPS)
 
 if __name__ == "__main__":
-    Jogo().run()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Helldivers: Grafos da Super-Terra")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="Mostra o tempo de import e inicialização por fase até o primeiro quadro.")
+    parser.add_argument("--trace", metavar="ARQUIVO",
+                        help="Grava o tempo de cada etapa de cada quadro e exporta um Chrome trace JSON ao sair.")
+    args = parser.parse_args()
+    Jogo(PerfilInicio() if args.profile_startup else None, trace=args.trace).run()
\ No newline at end of file
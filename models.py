@@ -1,4 +1,4 @@
-from typing import Tuple
+from typing import Optional, Tuple
 
 class Planeta:
     def __init__(self, nome: str, faccao_inimiga: str, pos: Tuple[int, int],
@@ -15,4 +15,6 @@ class Aresta:
         self.v = v
         self.peso = peso
         self.ativa = ativa
-        self.dirigida = dirigida
\ No newline at end of file
+        self.dirigida = dirigida
+        self.gemea: Optional["Aresta"] = None  # meia-aresta reversa de uma rota bidirecional
+        self.rota: int = -1  # índice da rota no MapaGalactico (compartilhado pelas gêmeas)
\ No newline at end of file
@@ -1,23 +1,44 @@
-from typing import Generator, List, Tuple, Dict, Optional, Set
+import heapq
+from itertools import chain
+from typing import Generator, Hashable, Iterable, List, Tuple, Dict, Optional, Set
 
-def mst_prim_generator(grafo, origem: str) -> Generator[dict, None, List[Tuple[str, str]]]:
+def vizinhanca_nao_dirigida(grafo) -> Dict[str, List[Tuple[str, float]]]:
+    """
+    (vizinho, peso) de cada planeta pelas rotas ativas, ignorando a direção:
+    a regra das três MSTs (Prim, Prim com heap e Kruskal), que geram a
+    floresta mínima do mapa visto como não dirigido. Uma entrada por rota e ponta.
+    """
+    adj: Dict[str, List[Tuple[str, float]]] = {p: [] for p in grafo.planetas}
+    for e in grafo.rotas():
+        if e.ativa:
+            adj[e.u].append((e.v, e.peso))
+            adj[e.v].append((e.u, e.peso))
+    return adj
+
+def mst_prim_generator(grafo, origem: str, delta: bool = False, medidor=None) -> Generator[dict, None, List[Tuple[str, str]]]:
     """
     Seleciona a aresta de menor peso varrendo uma lista de candidatos.
+    Rotas dirigidas contam como não dirigidas (ver vizinhanca_nao_dirigida).
+    Com delta=True, mst_add traz só a aresta nova em "mudancas" (sem a lista "mst").
+    medidor: instrumentacao.Medidor opcional (contagens de operações).
     """
+    vizinhos = vizinhanca_nao_dirigida(grafo)
     visitados: Set[str] = {origem}
     mst_arestas: List[Tuple[str, str]] = []
     custo_total = 0.0
 
     fronteira: List[Tuple[float, str, str]] = []
     
-    for v, w in grafo.vizinhos(origem):
+    for v, w in vizinhos[origem]:
         fronteira.append((w, origem, v))
+        if medidor: medidor.conta("arestas_examinadas"); medidor.conta("fronteira_insercoes")
         yield {"tipo": "mst_check", "de": origem, "para": v, "peso": w}
 
     yield {"tipo": "msg", "texto": f"Construindo MST via Prim (Manual) a partir de {origem}..."}
 
     while len(visitados) < len(grafo.planetas) and fronteira:
         
+        if medidor: medidor.conta("fronteira_varredura", len(fronteira))
         fronteira = [aresta for aresta in fronteira if aresta[2] not in visitados]
         
         if not fronteira:
@@ -26,6 +47,7 @@ def mst_prim_generator(grafo, origem: str) -> Generator[dict, None, List[Tuple[s
         melhor_aresta = fronteira[0]
         idx_melhor = 0
         
+        if medidor: medidor.conta("fronteira_varredura", len(fronteira))
         for i in range(1, len(fronteira)):
             if fronteira[i][0] < melhor_aresta[0]:
                 melhor_aresta = fronteira[i]
@@ -37,12 +59,136 @@ def mst_prim_generator(grafo, origem: str) -> Generator[dict, None, List[Tuple[s
         mst_arestas.append((u, v))
         custo_total += peso
         
-        yield {"tipo": "mst_add", "de": u, "para": v, "peso": peso, "mst": list(mst_arestas)}
+        yield _evento_mst_add(u, v, peso, mst_arestas, delta)
         
-        for vizinho, w_vizinho in grafo.vizinhos(v):
+        for vizinho, w_vizinho in vizinhos[v]:
+            if medidor: medidor.conta("arestas_examinadas")
             if vizinho not in visitados:
                 fronteira.append((w_vizinho, v, vizinho))
+                if medidor: medidor.conta("fronteira_insercoes")
                 yield {"tipo": "mst_check", "de": v, "para": vizinho, "peso": w_vizinho}
 
+    yield {"tipo": "mst_fim", "mst": list(mst_arestas), "custo_total": custo_total}
+    return mst_arestas
+
+def _evento_mst_add(u: str, v: str, peso: float, mst_arestas: List[Tuple[str, str]], delta: bool) -> dict:
+    ev = {"tipo": "mst_add", "de": u, "para": v, "peso": peso}
+    if delta: ev["mudancas"] = [("mst", (u, v), False, True)]
+    else: ev["mst"] = list(mst_arestas)
+    return ev
+
+def mst_prim_heap_generator(grafo, origem: str, delta: bool = False, medidor=None) -> Generator[dict, None, List[Tuple[str, str]]]:
+    """
+    Prim com heap (versão preguiçosa): O(E log E).
+    Arestas que levam a planetas já na árvore são descartadas ao sair do heap.
+    Se o heap esvaziar com planetas de fora (mapa fragmentado), recomeça por
+    um deles e produz uma floresta geradora mínima. Rotas dirigidas contam
+    como não dirigidas, como no Kruskal (ver vizinhanca_nao_dirigida).
+    medidor: instrumentacao.Medidor opcional (contagens de operações).
+    """
+    vizinhos = vizinhanca_nao_dirigida(grafo)
+    visitados: Set[str] = set()
+    mst_arestas: List[Tuple[str, str]] = []
+    custo_total = 0.0
+
+    yield {"tipo": "msg", "texto": f"Construindo MST via Prim (Heap) a partir de {origem}..."}
+
+    for raiz in chain([origem], grafo.planetas):
+        if raiz in visitados:
+            continue
+        if visitados:
+            yield {"tipo": "msg", "texto": f"Setor isolado! Nova árvore a partir de {raiz}."}
+        visitados.add(raiz)
+
+        heap: List[Tuple[float, str, str]] = []
+        for v, w in vizinhos[raiz]:
+            if medidor: medidor.conta("arestas_examinadas")
+            if v not in visitados:
+                heapq.heappush(heap, (w, raiz, v))
+                if medidor: medidor.conta("heap_push")
+                yield {"tipo": "mst_check", "de": raiz, "para": v, "peso": w}
+
+        while heap:
+            peso, u, v = heapq.heappop(heap)
+            if medidor: medidor.conta("heap_pop")
+            if v in visitados:
+                if medidor: medidor.conta("heap_obsoletos")
+                continue
+
+            visitados.add(v)
+            mst_arestas.append((u, v))
+            custo_total += peso
+            yield _evento_mst_add(u, v, peso, mst_arestas, delta)
+
+            for vizinho, w_vizinho in vizinhos[v]:
+                if medidor: medidor.conta("arestas_examinadas")
+                if vizinho not in visitados:
+                    heapq.heappush(heap, (w_vizinho, v, vizinho))
+                    if medidor: medidor.conta("heap_push")
+                    yield {"tipo": "mst_check", "de": v, "para": vizinho, "peso": w_vizinho}
+
+    yield {"tipo": "mst_fim", "mst": list(mst_arestas), "custo_total": custo_total}
+    return mst_arestas
+
+class ConjuntoDisjunto:
+    """União-busca com compressão de caminho e união por posto."""
+    def __init__(self, elementos: Iterable[Hashable] = ()):
+        self.pai: Dict[Hashable, Hashable] = {}
+        self.posto: Dict[Hashable, int] = {}
+        for x in elementos:
+            self.adicionar(x)
+
+    def adicionar(self, x: Hashable) -> None:
+        if x not in self.pai:
+            self.pai[x] = x
+            self.posto[x] = 0
+
+    def encontrar(self, x: Hashable) -> Hashable:
+        raiz = x
+        while self.pai[raiz] != raiz:
+            raiz = self.pai[raiz]
+        while self.pai[x] != raiz:
+            self.pai[x], x = raiz, self.pai[x]
+        return raiz
+
+    def unir(self, a: Hashable, b: Hashable) -> bool:
+        """Une os conjuntos de a e b; retorna False se já estavam juntos."""
+        ra, rb = self.encontrar(a), self.encontrar(b)
+        if ra == rb:
+            return False
+        if self.posto[ra] < self.posto[rb]:
+            ra, rb = rb, ra
+        self.pai[rb] = ra
+        if self.posto[ra] == self.posto[rb]:
+            self.posto[ra] += 1
+        return True
+
+def mst_kruskal_generator(grafo, delta: bool = False, medidor=None) -> Generator[dict, None, List[Tuple[str, str]]]:
+    """
+    Algoritmo de Kruskal: rotas ativas em ordem crescente de peso, unidas por
+    ConjuntoDisjunto. Em mapas fragmentados o resultado é uma floresta.
+    A direção das rotas é ignorada, como nos Prim (ver vizinhanca_nao_dirigida).
+    medidor: instrumentacao.Medidor opcional (contagens de operações).
+    """
+    conjuntos = ConjuntoDisjunto(grafo.planetas)
+    mst_arestas: List[Tuple[str, str]] = []
+    custo_total = 0.0
+    alvo = len(grafo.planetas) - 1
+
+    candidatas = sorted((e.peso, e.u, e.v) for e in grafo.rotas() if e.ativa)
+    if medidor: medidor.conta("arestas_ordenadas", len(candidatas))
+
+    yield {"tipo": "msg", "texto": f"Construindo MST via Kruskal ({len(candidatas)} rotas ordenadas)..."}
+
+    for peso, u, v in candidatas:
+        if len(mst_arestas) >= alvo:
+            break
+        yield {"tipo": "mst_check", "de": u, "para": v, "peso": peso}
+        if medidor: medidor.conta("arestas_examinadas"); medidor.conta("uniao_busca")
+        if conjuntos.unir(u, v):
+            mst_arestas.append((u, v))
+            custo_total += peso
+            yield _evento_mst_add(u, v, peso, mst_arestas, delta)
+
     yield {"tipo": "mst_fim", "mst": list(mst_arestas), "custo_total": custo_total}
     return mst_arestas
\ No newline at end of file
@@ -0,0 +1,118 @@
+"""
+Tempo por quadro e por etapa do laço do jogo (eventos, update, draw e suas partes).
+
+Mantém os últimos JANELA_PERFIL_QUADROS quadros para percentis e, quando
+gravando, cada etapa como evento "X" do formato Chrome trace (abre em
+chrome://tracing ou ui.perfetto.dev). Desligado, `etapa()` devolve um
+contexto nulo compartilhado e nada é medido.
+"""
+import json
+import time
+from collections import deque
+from contextlib import nullcontext
+from typing import Deque, Dict, List, Optional, Tuple
+
+from config import JANELA_PERFIL_QUADROS, MAX_EVENTOS_TRACE
+
+_NULO = nullcontext()
+QUADRO = "quadro"
+
+
+class _Etapa:
+    __slots__ = ("perfil", "nome", "t0")
+
+    def __init__(self, perfil: "PerfilQuadros", nome: str):
+        self.perfil = perfil
+        self.nome = nome
+
+    def __enter__(self):
+        self.t0 = time.perf_counter()
+
+    def __exit__(self, *exc):
+        self.perfil._somar(self.nome, self.t0, time.perf_counter())
+
+
+class PerfilQuadros:
+    def __init__(self, janela: int = JANELA_PERFIL_QUADROS):
+        self.ativo = False
+        self.gravando = False
+        self.janela = janela
+        self.historico: Dict[str, Deque[float]] = {}  # etapa -> ms nos últimos quadros
+        self.quadros = 0
+        self._atual: Dict[str, float] = {}
+        self._inicio: Optional[float] = None
+        self._origem = time.perf_counter()
+        self._trace: List[dict] = []
+
+    # ---------------------------------------------------------------- medição
+    def iniciar_quadro(self) -> None:
+        if self.ativo:
+            self._atual = {}
+            self._inicio = time.perf_counter()
+
+    def etapa(self, nome: str):
+        """Contexto que soma o tempo do bloco à etapa `nome` do quadro atual."""
+        if not self.ativo or self._inicio is None:
+            return _NULO
+        return _Etapa(self, nome)
+
+    def terminar_quadro(self) -> None:
+        if not self.ativo or self._inicio is None:
+            return
+        self._somar(QUADRO, self._inicio, time.perf_counter())
+        # Etapas que não rodaram neste quadro entram com 0 ms, para os percentis serem por quadro.
+        for nome in self.historico.keys() | self._atual.keys():
+            hist = self.historico.setdefault(nome, deque([0.0] * min(self.quadros, self.janela), maxlen=self.janela))
+            hist.append(self._atual.get(nome, 0.0))
+        self.quadros += 1
+        self._inicio = None
+
+    def _somar(self, nome: str, t0: float, t1: float) -> None:
+        self._atual[nome] = self._atual.get(nome, 0.0) + (t1 - t0) * 1000
+        if self.gravando and len(self._trace) < MAX_EVENTOS_TRACE:
+            self._trace.append({"name": nome, "ph": "X", "pid": 1, "tid": 1,
+                                "ts": (t0 - self._origem) * 1e6, "dur": (t1 - t0) * 1e6})
+
+    # ---------------------------------------------------------------- controle
+    def alternar(self) -> bool:
+        self.ativo = not self.ativo
+        if not self.ativo:
+            self._inicio = None
+        return self.ativo
+
+    def gravar(self) -> None:
+        """Começa uma gravação nova (liga a medição, se preciso)."""
+        self.ativo = True
+        self.gravando = True
+        self._trace = []
+
+    def exportar_trace(self, caminho: str) -> int:
+        """Encerra a gravação e grava o JSON do Chrome trace; devolve o número de eventos."""
+        self.gravando = False
+        with open(caminho, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": self._trace, "displayTimeUnit": "ms"}, f)
+        n = len(self._trace)
+        self._trace = []
+        return n
+
+    # ---------------------------------------------------------------- leitura
+    def percentis(self, nome: str = QUADRO) -> Tuple[float, float, float]:
+        """(p50, p95, p99) em ms da etapa nos últimos quadros."""
+        valores = sorted(self.historico.get(nome, ()))
+        if not valores:
+            return (0.0, 0.0, 0.0)
+        ultimo = len(valores) - 1
+        return tuple(valores[min(ultimo, int(q * len(valores)))] for q in (0.50, 0.95, 0.99))
+
+    def tempos_quadro(self) -> List[float]:
+        return list(self.historico.get(QUADRO, ()))
+
+    def linhas(self) -> List[str]:
+        """Percentis por etapa, da mais cara (p95) para a mais barata."""
+        p = {nome: self.percentis(nome) for nome in self.historico}
+        ordem = sorted(p, key=lambda nome: (nome != QUADRO, -p[nome][1]))
+        linhas = [f"{'etapa':<22}{'p50':>7}{'p95':>7}{'p99':>7}"]
+        linhas += [f"{nome:<22}{a:7.2f}{b:7.2f}{c:7.2f}" for nome, (a, b, c) in ((n, p[n]) for n in ordem)]
+        if self.gravando:
+            linhas.append(f"GRAVANDO trace: {len(self._trace)} eventos")
+        return linhas
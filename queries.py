@@ -0,0 +1,99 @@
+"""Consultas em lote sem eventos nem pygame; cada árvore de caminhos é calculada uma vez por origem."""
+import math
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from bellman_ford import bellman_ford_vetorizado
+from dijkstra import dijkstra_distancias, reconstruir_caminho
+
+
+def _arvore(grafo, origem: str, negativos: bool) -> Tuple[Dict[str, float], Dict[str, Optional[str]]]:
+    if negativos:
+        dist, prev, ciclo, _ = bellman_ford_vetorizado(grafo, origem)
+        if ciclo:
+            raise ValueError(f"Ciclo de peso negativo alcançável a partir de {origem}: {ciclo}")
+        return dist, prev
+    return dijkstra_distancias(grafo, origem)
+
+
+def shortest_paths(grafo, pares: Iterable[Tuple[str, str]], usar_cache: bool = True
+                   ) -> Dict[Tuple[str, str], Tuple[List[str], float]]:
+    """
+    Caminhos mínimos para vários pares (origem, destino).
+    Retorna {(origem, destino): (caminho, custo)}; inalcançável -> ([], inf).
+    Com usar_cache e um MapaGalactico, as árvores ficam na cache de distâncias
+    do mapa e servem também às chamadas seguintes.
+    """
+    por_origem: Dict[str, List[str]] = {}
+    for o, d in pares:
+        por_origem.setdefault(o, []).append(d)
+
+    resultado: Dict[Tuple[str, str], Tuple[List[str], float]] = {}
+    if usar_cache and hasattr(grafo, "cache_distancias"):
+        cache = grafo.cache_distancias()
+        for o, destinos in por_origem.items():
+            for d in destinos:
+                resultado[(o, d)] = (cache.caminho(o, d), cache.distancia(o, d))
+        return resultado
+
+    negativos = any(e.peso < 0 for e in grafo.arestas() if e.ativa)
+    for o, destinos in por_origem.items():
+        dist, prev = _arvore(grafo, o, negativos)
+        for d in destinos:
+            if dist.get(d, math.inf) == math.inf:
+                resultado[(o, d)] = ([], math.inf)
+            else:
+                resultado[(o, d)] = (reconstruir_caminho(prev, dist, d), dist[d])
+    return resultado
+
+
+def bfs_levels(grafo, origens: Iterable[str]) -> Dict[str, int]:
+    """BFS a partir de várias origens ao mesmo tempo: nível = saltos até a origem mais próxima."""
+    if hasattr(grafo, "vizinhos_ids"):
+        return _bfs_levels_ids(grafo, origens)
+    nivel: Dict[str, int] = {}
+    fila = deque()
+    for o in origens:
+        if o not in nivel:
+            nivel[o] = 0
+            fila.append(o)
+    while fila:
+        u = fila.popleft()
+        prox = nivel[u] + 1
+        for v, _ in grafo.vizinhos(u):
+            if v not in nivel:
+                nivel[v] = prox
+                fila.append(v)
+    return nivel
+
+
+def _bfs_levels_ids(grafo, origens: Iterable[str]) -> Dict[str, int]:
+    """bfs_levels sobre os ids inteiros de um MapaCompacto (-1 = não alcançado)."""
+    nivel = [-1] * len(grafo.nomes)
+    fila = deque()
+    for o in origens:
+        i = grafo.ids[o]
+        if nivel[i] < 0:
+            nivel[i] = 0
+            fila.append(i)
+    ordem: List[int] = []
+    vizinhos = grafo.vizinhos_ids
+    while fila:
+        u = fila.popleft()
+        ordem.append(u)
+        prox = nivel[u] + 1
+        for v, _ in vizinhos(u):
+            if nivel[v] < 0:
+                nivel[v] = prox
+                fila.append(v)
+    nomes = grafo.nomes
+    return {nomes[i]: nivel[i] for i in ordem}
+
+
+def reachability(grafo, origens: Iterable[str]) -> Dict[str, Set[str]]:
+    """Conjunto de planetas alcançáveis a partir de cada origem (uma busca por origem distinta)."""
+    resultado: Dict[str, Set[str]] = {}
+    for o in origens:
+        if o not in resultado:
+            resultado[o] = set(bfs_levels(grafo, [o]))
+    return resultado
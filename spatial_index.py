@@ -0,0 +1,136 @@
+import math
+from itertools import chain
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from models import Aresta
+
+TAM_CELULA = 64          # lado da célula da grade, em pixels de mundo (~1 planeta por célula nos mapas sintéticos)
+MAX_CELULAS_ROTA = 64    # rotas cuja caixa cobre mais células que isso ficam numa lista à parte
+
+
+class IndiceEspacial:
+    """
+    Grade uniforme sobre Planeta.pos: cada célula guarda os planetas que caem nela
+    e as rotas cuja caixa envolvente a cobre. Consultas tocam só as células do
+    retângulo/raio pedido, então custam O(1) amortizado com densidade limitada.
+    """
+    def __init__(self, tam_celula: float = TAM_CELULA):
+        self.tam = tam_celula
+        self.pos: Dict[str, Tuple[float, float]] = {}
+        self._planetas: Dict[Tuple[int, int], List[str]] = {}
+        self._rotas: Dict[Tuple[int, int], List[Aresta]] = {}
+        self._rotas_longas: List[Aresta] = []
+        self._caixas: Dict[int, Tuple[float, float, float, float]] = {}
+        # Extensão ocupada, em células (limita a busca do mais próximo).
+        self._min_c = self._max_c = None
+        # Caixa envolvente dos planetas em coordenadas de mundo (x0, y0, x1, y1).
+        self.caixa: Optional[Tuple[float, float, float, float]] = None
+
+    def _celula(self, x: float, y: float) -> Tuple[int, int]:
+        return int(math.floor(x / self.tam)), int(math.floor(y / self.tam))
+
+    def _celulas(self, x0: float, y0: float, x1: float, y1: float) -> Iterable[Tuple[int, int]]:
+        cx0, cy0 = self._celula(min(x0, x1), min(y0, y1))
+        cx1, cy1 = self._celula(max(x0, x1), max(y0, y1))
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                yield cx, cy
+
+    # ---------------------------------------------------------------- inserção
+    def inserir_planeta(self, nome: str, pos: Tuple[float, float]) -> None:
+        self.pos[nome] = pos
+        c = self._celula(*pos)
+        self._planetas.setdefault(c, []).append(nome)
+        x, y = pos
+        if self._min_c is None:
+            self._min_c, self._max_c = c, c
+            self.caixa = (x, y, x, y)
+        else:
+            self._min_c = (min(self._min_c[0], c[0]), min(self._min_c[1], c[1]))
+            self._max_c = (max(self._max_c[0], c[0]), max(self._max_c[1], c[1]))
+            x0, y0, x1, y1 = self.caixa
+            self.caixa = (min(x0, x), min(y0, y), max(x1, x), max(y1, y))
+
+    def inserir_rota(self, e: Aresta) -> None:
+        """Registra a rota (uma meia-aresta por rota) pela caixa envolvente u-v."""
+        (xu, yu), (xv, yv) = self.pos[e.u], self.pos[e.v]
+        caixa = (min(xu, xv), min(yu, yv), max(xu, xv), max(yu, yv))
+        self._caixas[e.rota] = caixa
+        cx0, cy0 = self._celula(caixa[0], caixa[1])
+        cx1, cy1 = self._celula(caixa[2], caixa[3])
+        if (cx1 - cx0 + 1) * (cy1 - cy0 + 1) > MAX_CELULAS_ROTA:
+            self._rotas_longas.append(e)
+            return
+        for c in self._celulas(*caixa):
+            self._rotas.setdefault(c, []).append(e)
+
+    # ---------------------------------------------------------------- consultas
+    def planetas_no_retangulo(self, x0: float, y0: float, x1: float, y1: float) -> List[str]:
+        x0, x1 = min(x0, x1), max(x0, x1)
+        y0, y1 = min(y0, y1), max(y0, y1)
+        resultado = []
+        for c in self._celulas(x0, y0, x1, y1):
+            for nome in self._planetas.get(c, ()):
+                x, y = self.pos[nome]
+                if x0 <= x <= x1 and y0 <= y <= y1:
+                    resultado.append(nome)
+        return resultado
+
+    def planetas_no_raio(self, x: float, y: float, raio: float) -> List[str]:
+        r2 = raio * raio
+        return [nome for nome in self.planetas_no_retangulo(x - raio, y - raio, x + raio, y + raio)
+                if (self.pos[nome][0] - x) ** 2 + (self.pos[nome][1] - y) ** 2 <= r2]
+
+    def mais_proximo(self, x: float, y: float, raio_max: float = math.inf) -> Optional[str]:
+        """
+        Planeta mais próximo de (x, y) a no máximo raio_max. Percorre anéis de
+        células a partir da célula do ponto e para quando o anel seguinte já
+        não pode conter nada mais perto que o melhor encontrado.
+        """
+        if self._min_c is None:
+            return None
+        cx, cy = self._celula(x, y)
+        alcance = max(abs(cx - self._min_c[0]), abs(cx - self._max_c[0]),
+                      abs(cy - self._min_c[1]), abs(cy - self._max_c[1]))
+        if raio_max != math.inf:
+            alcance = min(alcance, int(raio_max // self.tam) + 1)
+        melhor, melhor_d2 = None, raio_max * raio_max
+        for k in range(alcance + 1):
+            # O anel k está a pelo menos (k - 1) * tam do ponto.
+            if k > 0 and ((k - 1) * self.tam) ** 2 > melhor_d2:
+                break
+            for c in self._anel(cx, cy, k):
+                for nome in self._planetas.get(c, ()):
+                    px, py = self.pos[nome]
+                    d2 = (px - x) ** 2 + (py - y) ** 2
+                    if d2 <= melhor_d2:
+                        melhor, melhor_d2 = nome, d2
+        return melhor
+
+    @staticmethod
+    def _anel(cx: int, cy: int, k: int) -> Iterable[Tuple[int, int]]:
+        if k == 0:
+            yield cx, cy
+            return
+        for dx in range(-k, k + 1):
+            yield cx + dx, cy - k
+            yield cx + dx, cy + k
+        for dy in range(-k + 1, k):
+            yield cx - k, cy + dy
+            yield cx + k, cy + dy
+
+    def rotas_no_retangulo(self, x0: float, y0: float, x1: float, y1: float) -> List[Aresta]:
+        """Rotas (ativas ou não) cuja caixa envolvente intersecta o retângulo."""
+        x0, x1 = min(x0, x1), max(x0, x1)
+        y0, y1 = min(y0, y1), max(y0, y1)
+        vistas: Set[int] = set()
+        resultado = []
+        candidatas = chain.from_iterable(self._rotas.get(c, ()) for c in self._celulas(x0, y0, x1, y1))
+        for e in chain(candidatas, self._rotas_longas):
+            if e.rota in vistas: continue
+            vistas.add(e.rota)
+            bx0, by0, bx1, by1 = self._caixas[e.rota]
+            if bx0 <= x1 and x0 <= bx1 and by0 <= y1 and y0 <= by1:
+                resultado.append(e)
+        return resultado
+
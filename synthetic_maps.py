@@ -0,0 +1,112 @@
+import math
+import random
+from typing import Callable, Dict, List, Tuple
+
+from graph_system import MapaGalactico
+from models import Planeta
+
+ESPACAMENTO = 60  # distância média entre planetas vizinhos, em pixels de mundo
+FACCOES = ["Autômatos", "Terminídeos", "Iluminados"]
+
+
+def _novo_mapa(posicoes: List[Tuple[int, int]], rng: random.Random) -> MapaGalactico:
+    mg = MapaGalactico()
+    for i, pos in enumerate(posicoes):
+        faccao = "Aliança" if i == 0 else rng.choice(FACCOES)
+        mg.adicionar_planeta(Planeta(f"P{i}", faccao, pos))
+    return mg
+
+
+def _ligar(mg: MapaGalactico, posicoes, a: int, b: int, dirigido: bool) -> None:
+    """Peso = comprimento euclidiano em unidades de ESPACAMENTO (mínimo 1)."""
+    (xa, ya), (xb, yb) = posicoes[a], posicoes[b]
+    peso = max(1, round(math.hypot(xa - xb, ya - yb) / ESPACAMENTO))
+    if dirigido:
+        # Orientação do menor para o maior id: grafo acíclico (DFS percorre tudo).
+        mg.adicionar_rota_dirigida(f"P{min(a, b)}", f"P{max(a, b)}", peso)
+    else:
+        mg.adicionar_rota(f"P{a}", f"P{b}", peso)
+
+
+def _posicoes_aleatorias(n: int, rng: random.Random) -> List[Tuple[int, int]]:
+    lado = int(math.sqrt(n) * ESPACAMENTO) + 1
+    return [(rng.randrange(lado), rng.randrange(lado)) for _ in range(n)]
+
+
+def gerar_grade(n: int, seed: int = 42, dirigido: bool = False) -> MapaGalactico:
+    """Grade aproximadamente quadrada com n planetas (vizinhança 4)."""
+    rng = random.Random(seed)
+    lado = max(1, int(math.sqrt(n)))
+    posicoes = [((i % lado) * ESPACAMENTO, (i // lado) * ESPACAMENTO) for i in range(n)]
+    mg = _novo_mapa(posicoes, rng)
+    for i in range(n):
+        if i % lado < lado - 1 and i + 1 < n: _ligar(mg, posicoes, i, i + 1, dirigido)
+        if i + lado < n: _ligar(mg, posicoes, i, i + lado, dirigido)
+    return mg
+
+
+def gerar_geometrico(n: int, seed: int = 42, dirigido: bool = False, grau_medio: float = 6.0) -> MapaGalactico:
+    """Grafo geométrico aleatório: liga planetas a menos de um raio (baldes em grade, O(n))."""
+    rng = random.Random(seed)
+    posicoes = _posicoes_aleatorias(n, rng)
+    # Densidade 1 / ESPACAMENTO^2: pi * r^2 / ESPACAMENTO^2 = grau_medio.
+    raio = ESPACAMENTO * math.sqrt(grau_medio / math.pi)
+    baldes: Dict[Tuple[int, int], List[int]] = {}
+    for i, (x, y) in enumerate(posicoes):
+        baldes.setdefault((int(x // raio), int(y // raio)), []).append(i)
+    mg = _novo_mapa(posicoes, rng)
+    r2 = raio * raio
+    for (bx, by), membros in baldes.items():
+        for dx, dy in ((0, 0), (1, 0), (0, 1), (1, 1), (1, -1)):
+            outros = baldes.get((bx + dx, by + dy))
+            if not outros: continue
+            for a in membros:
+                xa, ya = posicoes[a]
+                for b in outros:
+                    if (dx, dy) == (0, 0) and b <= a: continue
+                    xb, yb = posicoes[b]
+                    if (xa - xb) ** 2 + (ya - yb) ** 2 <= r2:
+                        _ligar(mg, posicoes, a, b, dirigido)
+    return mg
+
+
+def gerar_erdos_renyi(n: int, seed: int = 42, dirigido: bool = False, grau_medio: float = 6.0) -> MapaGalactico:
+    """G(n, m) com m = n * grau_medio / 2 rotas sorteadas sem repetição."""
+    rng = random.Random(seed)
+    posicoes = _posicoes_aleatorias(n, rng)
+    mg = _novo_mapa(posicoes, rng)
+    alvo = min(int(n * grau_medio / 2), n * (n - 1) // 2)
+    usados = set()
+    while len(usados) < alvo:
+        a, b = rng.randrange(n), rng.randrange(n)
+        if a == b: continue
+        par = (min(a, b), max(a, b))
+        if par in usados: continue
+        usados.add(par)
+        _ligar(mg, posicoes, a, b, dirigido)
+    return mg
+
+
+def gerar_livre_de_escala(n: int, seed: int = 42, dirigido: bool = False, m: int = 3) -> MapaGalactico:
+    """Barabási–Albert: cada planeta novo se liga a m existentes, com preferência pelo grau."""
+    rng = random.Random(seed)
+    posicoes = _posicoes_aleatorias(n, rng)
+    mg = _novo_mapa(posicoes, rng)
+    repetidos: List[int] = []
+    for novo in range(n):
+        if novo == 0: continue
+        alvos = set()
+        while len(alvos) < min(m, novo):
+            alvos.add(rng.choice(repetidos) if repetidos and rng.random() < 0.9 else rng.randrange(novo))
+        for alvo in alvos:
+            _ligar(mg, posicoes, novo, alvo, dirigido)
+            repetidos.extend((novo, alvo))
+    return mg
+
+
+GERADORES: Dict[str, Callable[..., MapaGalactico]] = {
+    "grade": gerar_grade,
+    "geometrico": gerar_geometrico,
+    "erdos-renyi": gerar_erdos_renyi,
+    "livre-de-escala": gerar_livre_de_escala,
+}
@@ -0,0 +1,41 @@
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from graph_system import MapaGalactico  # noqa: E402
+from models import Planeta  # noqa: E402
+
+
+def construir_mapa_misto(seed: int, n: int = 30, rotas: int = 60, negativos: bool = False,
+                         repetidas: bool = True) -> MapaGalactico:
+    """
+    Mapa aleatório com rotas dirigidas e bidirecionais, algumas desativadas.
+    Com repetidas, o mesmo par de planetas pode ganhar mais de uma rota.
+    """
+    rng = random.Random(seed)
+    mg = MapaGalactico()
+    for i in range(n):
+        mg.adicionar_planeta(Planeta(f"P{i}", "Autômatos", (rng.randrange(1000), rng.randrange(1000))))
+    pares = set()
+    for _ in range(rotas):
+        a, b = rng.sample(range(n), 2)
+        if not repetidas:
+            if frozenset((a, b)) in pares: continue
+            pares.add(frozenset((a, b)))
+        peso = rng.randint(-2 if negativos else 1, 9)
+        if rng.random() < 0.5:
+            mg.adicionar_rota_dirigida(f"P{a}", f"P{b}", peso)
+        else:
+            mg.adicionar_rota(f"P{a}", f"P{b}", max(peso, 1))
+    for _ in range(rotas // 10):
+        mg.remover_rota_aleatoria()
+    return mg
+
+
+@pytest.fixture
+def mapa_misto():
+    return construir_mapa_misto
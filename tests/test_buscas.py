@@ -0,0 +1,114 @@
+import math
+
+import pytest
+
+import astar
+from astar import FatorEuclidiano, Marcos, alt_generator, astar_generator
+from bfs import bfs_bidirecional_generator, bfs_generator
+from dijkstra import dijkstra_bidirecional_generator, dijkstra_heap_generator
+from queries import bfs_levels
+
+
+def _resultado(gen):
+    try:
+        while True:
+            next(gen)
+    except StopIteration as fim:
+        return fim.value
+
+
+def _custo_do_caminho(grafo, caminho):
+    return sum(min(w for v, w in grafo.vizinhos(a) if v == b) for a, b in zip(caminho, caminho[1:]))
+
+
+def _conferir_busca(grafo, gerador, origem, destino, **kw):
+    _, esperado = _resultado(dijkstra_heap_generator(grafo, origem, destino))
+    caminho, custo = _resultado(gerador(grafo, origem, destino, **kw))
+    if math.isinf(esperado):
+        assert math.isinf(custo) and not caminho
+        return
+    assert custo == esperado
+    assert caminho[0] == origem and caminho[-1] == destino
+    assert _custo_do_caminho(grafo, caminho) == esperado
+
+
+def _pares(grafo):
+    nomes = sorted(grafo.planetas)
+    return [(nomes[i], nomes[(i * 7 + 3) % len(nomes)]) for i in range(0, len(nomes), 3)]
+
+
+@pytest.mark.parametrize("compacto", [False, True])
+@pytest.mark.parametrize("seed", range(15))
+def test_astar_e_alt_batem_com_dijkstra(mapa_misto, seed, compacto):
+    grafo = mapa_misto(seed)
+    if compacto:
+        grafo = grafo.compactar()
+    marcos = Marcos(grafo)
+    for origem, destino in _pares(grafo):
+        _conferir_busca(grafo, astar_generator, origem, destino)
+        _conferir_busca(grafo, alt_generator, origem, destino, marcos=marcos)
+
+
+class _SoIda:
+    """Mapa dirigido sem índice reverso."""
+    def __init__(self, mg):
+        self.planetas = mg.planetas
+        self.versao = mg.versao
+        self.vizinhos = mg.vizinhos
+        self.rotas = mg.rotas
+        self.arestas = mg.arestas
+
+
+def test_marcos_recusam_mapa_dirigido_sem_indice_reverso(mapa_misto):
+    with pytest.raises(TypeError):
+        Marcos(_SoIda(mapa_misto(0)))
+
+
+@pytest.mark.parametrize("compacto", [False, True])
+def test_astar_reaproveita_o_fator_ate_o_mapa_mudar(mapa_misto, monkeypatch, compacto):
+    grafo = mapa_misto(0, negativos=False)
+    if compacto:
+        grafo = grafo.compactar()
+    varreduras = []
+    original = astar.fator_euclidiano
+    monkeypatch.setattr(astar, "fator_euclidiano", lambda g: varreduras.append(g) or original(g))
+
+    fator = FatorEuclidiano(grafo)
+    assert len(varreduras) == 1
+    for origem, destino in _pares(grafo):
+        _conferir_busca(grafo, astar_generator, origem, destino, fator=fator)
+    assert len(varreduras) == 1
+
+    grafo.remover_rota_aleatoria()
+    assert not fator.valido_para(grafo)
+    _resultado(astar_generator(grafo, "P0", "P1", fator=fator))
+    assert len(varreduras) == 2
+
+
+def _conferir_bfs_bidirecional(grafo, origem, destino):
+    alcancados = _resultado(bfs_generator(grafo, origem))
+    niveis = bfs_levels(grafo, [origem])
+    caminho = _resultado(bfs_bidirecional_generator(grafo, origem, destino))
+    if destino not in alcancados:
+        assert caminho == []
+        return
+    assert len(caminho) - 1 == niveis[destino]
+    assert caminho[0] == origem and caminho[-1] == destino
+    assert all(any(v == b for v, _ in grafo.vizinhos(a)) for a, b in zip(caminho, caminho[1:]))
+
+
+@pytest.mark.parametrize("compacto", [False, True])
+@pytest.mark.parametrize("seed", range(25))
+def test_bidirecionais_batem_com_as_buscas_de_um_lado(mapa_misto, seed, compacto):
+    grafo = mapa_misto(seed)
+    if compacto:
+        grafo = grafo.compactar()
+    for origem, destino in _pares(grafo) + [("P0", "P0")]:
+        _conferir_busca(grafo, dijkstra_bidirecional_generator, origem, destino)
+        _conferir_bfs_bidirecional(grafo, origem, destino)
+
+
+@pytest.mark.parametrize("gerador", [bfs_bidirecional_generator, dijkstra_bidirecional_generator])
+def test_bidirecionais_recusam_mapa_dirigido_sem_indice_reverso(mapa_misto, gerador):
+    with pytest.raises(TypeError):
+        _resultado(gerador(_SoIda(mapa_misto(0)), "P0", "P1"))
@@ -0,0 +1,61 @@
+import random
+from collections import deque
+
+import pytest
+
+
+def _componentes_do_zero(mg):
+    """Componentes fracos recalculados por BFS, como referência."""
+    vizinhos = {p: set() for p in mg.planetas}
+    for e in mg.arestas():
+        if e.ativa:
+            vizinhos[e.u].add(e.v)
+            vizinhos[e.v].add(e.u)
+    vistos, componentes = set(), []
+    for s in mg.planetas:
+        if s in vistos: continue
+        membros, fila = {s}, deque([s])
+        while fila:
+            for v in vizinhos[fila.popleft()]:
+                if v not in membros:
+                    membros.add(v)
+                    fila.append(v)
+        vistos |= membros
+        componentes.append(membros)
+    return sorted(sorted(m) for m in componentes)
+
+
+def _conferir(mg):
+    esperado = _componentes_do_zero(mg)
+    assert sorted(sorted(m) for m in mg.encontrar_componentes_conexos()) == esperado
+    assert mg.num_componentes() == len(esperado)
+    for membros in esperado:
+        assert len({mg.componente_de(p) for p in membros}) == 1
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_componentes_acompanham_remocoes_e_restauracoes(mapa_misto, seed):
+    mg = mapa_misto(seed, n=40, rotas=50)
+    _conferir(mg)
+    random.seed(seed)
+    for _ in range(30):
+        if mg.remover_rota_aleatoria() is None:
+            break
+        _conferir(mg)
+    while mg.desfazer() is not None:
+        _conferir(mg)
+    mg.resetar()
+    _conferir(mg)
+
+
+def test_componentes_acompanham_insercoes(mapa_misto):
+    mg = mapa_misto(3, n=40, rotas=20)
+    _conferir(mg)
+    rng = random.Random(3)
+    for _ in range(30):
+        a, b = rng.sample(sorted(mg.planetas), 2)
+        if rng.random() < 0.5:
+            mg.adicionar_rota_dirigida(a, b, 1)
+        else:
+            mg.adicionar_rota(a, b, 1)
+        _conferir(mg)
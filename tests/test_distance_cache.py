@@ -0,0 +1,93 @@
+import math
+
+import pytest
+
+import distance_cache
+from bellman_ford import bellman_ford_vetorizado
+from dijkstra import dijkstra_distancias
+
+
+def _referencia(mg, origem):
+    if any(e.peso < 0 for e in mg.arestas() if e.ativa):
+        dist, _, ciclo, _ = bellman_ford_vetorizado(mg, origem)
+        return None if ciclo else dist
+    return dijkstra_distancias(mg, origem)[0]
+
+
+def _conferir(mg, cache):
+    for origem in mg.planetas:
+        esperado = _referencia(mg, origem)
+        if esperado is None:
+            with pytest.raises(ValueError):
+                cache.distancia(origem, origem)
+            continue
+        for destino in mg.planetas:
+            d = esperado.get(destino, math.inf)
+            assert cache.distancia(origem, destino) == d
+            caminho = cache.caminho(origem, destino)
+            if d == math.inf:
+                assert caminho == []
+                continue
+            assert caminho[0] == origem and caminho[-1] == destino
+            custo = sum(min(w for v, w in mg.vizinhos(a) if v == b) for a, b in zip(caminho, caminho[1:]))
+            assert custo == d
+
+
+@pytest.mark.parametrize("seed", range(8))
+def test_cache_bate_com_buscas_de_origem_unica(mapa_misto, seed):
+    mg = mapa_misto(seed, n=20, rotas=40, negativos=seed % 2 == 1)
+    _conferir(mg, mg.cache_distancias())
+
+
+def test_cache_se_invalida_quando_o_mapa_muda(mapa_misto):
+    mg = mapa_misto(4, n=20, rotas=40)
+    cache = mg.cache_distancias()
+    _conferir(mg, cache)
+    for _ in range(5):
+        mg.remover_rota_aleatoria()
+        _conferir(mg, cache)
+    mg.adicionar_rota("P0", "P19", 1)
+    _conferir(mg, cache)
+    mg.desfazer()
+    _conferir(mg, cache)
+
+
+def test_consulta_repetida_nao_recalcula(mapa_misto):
+    mg = mapa_misto(5, n=20, rotas=40)
+    cache = mg.cache_distancias()
+    cache.caminho("P0", "P7")
+    calculadas = cache.linhas_calculadas
+    for destino in mg.planetas:
+        cache.caminho("P0", destino)
+    assert cache.linhas_calculadas == calculadas
+
+
+def _mapa_com_ciclo_negativo(mapa_misto, seed):
+    """Mapa misto com um ciclo negativo P1 -> P2 -> P3 -> P1 alcançável só por parte das origens."""
+    mg = mapa_misto(seed, n=20, rotas=25, negativos=True)
+    mg.adicionar_rota_dirigida("P1", "P2", -4)
+    mg.adicionar_rota_dirigida("P2", "P3", 1)
+    mg.adicionar_rota_dirigida("P3", "P1", 1)
+    return mg
+
+
+@pytest.mark.parametrize("preencher", [False, True])
+@pytest.mark.parametrize("seed", range(6))
+def test_ciclo_negativo_mesma_regra_com_e_sem_preencher(mapa_misto, seed, preencher):
+    """Com ou sem Floyd–Warshall, só origens que alcançam um ciclo negativo levantam."""
+    mg = _mapa_com_ciclo_negativo(mapa_misto, seed)
+    assert any(_referencia(mg, o) is None for o in mg.planetas)
+    cache = mg.cache_distancias()
+    if preencher:
+        cache.preencher()
+    _conferir(mg, cache)
+
+
+def test_linhas_em_memmap(mapa_misto, monkeypatch):
+    pytest.importorskip("numpy")
+    monkeypatch.setattr(distance_cache, "LIMITE_MEMMAP", 5)
+    monkeypatch.setattr(distance_cache, "LIMITE_FLOYD", 5)
+    mg = mapa_misto(6, n=20, rotas=40)
+    cache = distance_cache.CacheDistancias(mg)
+    cache.preencher()
+    _conferir(mg, cache)
@@ -0,0 +1,57 @@
+import pytest
+
+from bellman_ford import bellman_ford_generator
+from bfs import bfs_bidirecional_generator, bfs_generator
+from dfs import detecting_ciclo_generator
+from dijkstra import dijkstra_bidirecional_generator, dijkstra_generator, dijkstra_heap_generator
+from eventos import EstadoAcumulado
+from mst import mst_kruskal_generator, mst_prim_generator, mst_prim_heap_generator
+
+CAMPOS = ("visitados", "dist", "prev", "cor", "mst",
+          "visitados_reversa", "dist_reversa", "prev_reversa")
+
+GERADORES = {
+    "bfs": lambda g, **kw: bfs_generator(g, "P0", **kw),
+    "bfs_bidirecional": lambda g, **kw: bfs_bidirecional_generator(g, "P0", "P9", **kw),
+    "dijkstra": lambda g, **kw: dijkstra_generator(g, "P0", "P9", **kw),
+    "dijkstra_heap": lambda g, **kw: dijkstra_heap_generator(g, "P0", None, **kw),
+    "dijkstra_bidirecional": lambda g, **kw: dijkstra_bidirecional_generator(g, "P0", "P9", **kw),
+    "bellman_ford": lambda g, **kw: bellman_ford_generator(g, "P0", "P9", **kw),
+    "dfs": lambda g, **kw: detecting_ciclo_generator(g, **kw),
+    "prim": lambda g, **kw: mst_prim_generator(g, "P0", **kw),
+    "prim_heap": lambda g, **kw: mst_prim_heap_generator(g, "P0", **kw),
+    "kruskal": lambda g, **kw: mst_kruskal_generator(g, **kw),
+}
+
+
+@pytest.mark.parametrize("nome", sorted(GERADORES))
+@pytest.mark.parametrize("seed", range(5))
+def test_delta_reconstroi_as_copias(mapa_misto, nome, seed):
+    """Acumular os eventos delta reproduz, passo a passo, as cópias dos eventos sem delta."""
+    mg = mapa_misto(seed)
+    completos = list(GERADORES[nome](mg))
+    deltas = list(GERADORES[nome](mg, delta=True))
+    assert [ev["tipo"] for ev in deltas] == [ev["tipo"] for ev in completos]
+
+    estado = EstadoAcumulado(mg)
+    for completo, ev in zip(completos, deltas):
+        estado.aplicar(ev)
+        for campo in CAMPOS:
+            if campo in completo:
+                esperado = completo[campo]
+                if campo == "mst":
+                    assert estado.snapshot(campo) == esperado
+                else:
+                    assert estado.snapshot(campo) == (esperado if isinstance(esperado, set) else dict(esperado))
+
+
+def test_desfazer_volta_ao_estado_anterior(mapa_misto):
+    mg = mapa_misto(0)
+    deltas = list(dijkstra_heap_generator(mg, "P0", delta=True))
+    estado = EstadoAcumulado(mg)
+    for ev in deltas:
+        estado.aplicar(ev)
+    for ev in reversed(deltas):
+        estado.desfazer(ev)
+    assert estado.snapshot("dist") == {p: float("inf") for p in mg.planetas}
+    assert estado.snapshot("prev") == {p: None for p in mg.planetas}
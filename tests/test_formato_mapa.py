@@ -0,0 +1,72 @@
+import pytest
+
+import formato_mapa
+import levels
+from models import Planeta
+
+
+def _rotas(grafo):
+    return [(e.u, e.v, e.peso, type(e.peso), e.ativa, e.dirigida) for e in grafo.rotas()]
+
+
+def _vizinhancas(grafo):
+    return {p: (sorted(grafo.vizinhos(p)), sorted(grafo.vizinhos_reversos(p))) for p in grafo.planetas}
+
+
+def _ida_e_volta(mg, tmp_path):
+    caminho = str(tmp_path / f"mapa{formato_mapa.EXTENSAO}")
+    formato_mapa.exportar(mg, caminho)
+    return formato_mapa.abrir(caminho)
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_ida_e_volta_preserva_rotas(mapa_misto, tmp_path, seed):
+    mg = mapa_misto(seed)
+    arq = _ida_e_volta(mg, tmp_path)
+    try:
+        copia = arq.mapa()
+        assert list(copia.planetas) == list(mg.planetas)
+        assert _rotas(copia) == _rotas(mg)
+        assert _rotas(arq.compacto()) == _rotas(mg)
+        assert _vizinhancas(copia) == _vizinhancas(mg)
+        assert _vizinhancas(arq.compacto()) == _vizinhancas(mg)
+        assert copia.num_componentes() == mg.num_componentes()
+    finally:
+        arq.fechar()
+
+
+def test_rotas_repetidas_desativam_a_rota_certa(tmp_path):
+    mg = levels.construir_mapa_fase2()
+    a, b = "Super-Terra", "Marte"
+    barata = mg.adicionar_rota(a, b, 1)
+    mg.adicionar_rota(a, b, 7)
+    mg.desativar_aresta(barata)
+    arq = _ida_e_volta(mg, tmp_path)
+    try:
+        assert _rotas(arq.mapa()) == _rotas(mg)
+        assert sorted(w for v, w in arq.mapa().vizinhos(a) if v == b) == sorted(w for v, w in mg.vizinhos(a) if v == b)
+    finally:
+        arq.fechar()
+
+
+def test_pesos_fracionarios_e_planetas(tmp_path):
+    mg = levels.construir_mapa_fase1()
+    mg.adicionar_planeta(Planeta("Novo Éden", "Iluminados", (10.5, 20)))
+    mg.adicionar_rota_dirigida("Novo Éden", "Super-Terra", 2.5)
+    arq = _ida_e_volta(mg, tmp_path)
+    try:
+        assert _rotas(arq.mapa()) == _rotas(mg)
+        p = arq.mapa().planetas["Novo Éden"]
+        assert (p.faccao_inimiga, p.pos) == ("Iluminados", (10.5, 20))
+    finally:
+        arq.fechar()
+
+
+def test_versao_desconhecida_e_recusada(tmp_path):
+    caminho = tmp_path / f"velho{formato_mapa.EXTENSAO}"
+    formato_mapa.exportar(levels.construir_mapa_fase1(), str(caminho))
+    dados = bytearray(caminho.read_bytes())
+    dados[8] = formato_mapa.VERSAO + 1
+    caminho.write_bytes(bytes(dados))
+    with pytest.raises(ValueError):
+        formato_mapa.abrir(str(caminho))
@@ -0,0 +1,108 @@
+import copy
+import math
+import random
+
+import pytest
+
+from bfs import bfs_generator
+from dijkstra import dijkstra_distancias, dijkstra_heap_generator
+from queries import bfs_levels
+
+
+def _drenar(gen):
+    try:
+        while True:
+            next(gen)
+    except StopIteration as fim:
+        return fim.value
+
+
+def _vizinhos(grafo, nome, reversos=False):
+    metodo = grafo.vizinhos_reversos if reversos else grafo.vizinhos
+    return sorted(metodo(nome))
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_compacto_tem_as_mesmas_vizinhancas(mapa_misto, seed):
+    mg = mapa_misto(seed)
+    c = mg.compactar()
+    for nome in mg.planetas:
+        assert _vizinhos(c, nome) == _vizinhos(mg, nome)
+        assert _vizinhos(c, nome, reversos=True) == _vizinhos(mg, nome, reversos=True)
+
+
+def test_compacto_acompanha_remocoes(mapa_misto):
+    mg = mapa_misto(1, repetidas=False)
+    c = mg.compactar()
+    random.seed(7)
+    for _ in range(15):
+        u, v = c.remover_rota_aleatoria()
+        e = mg.aresta(u, v)
+        mg.desativar_rota(e.u, e.v)
+        for nome in mg.planetas:
+            assert _vizinhos(c, nome) == _vizinhos(mg, nome)
+            assert _vizinhos(c, nome, reversos=True) == _vizinhos(mg, nome, reversos=True)
+    assert c.num_ativas == sum(1 for e in mg.arestas() if e.ativa)
+
+
+def test_compacto_preserva_rotas_e_pesos_inteiros(mapa_misto):
+    mg = mapa_misto(2)
+    c = mg.compactar()
+    original = [(e.u, e.v, e.peso, e.ativa, e.dirigida) for e in mg.rotas()]
+    assert [(e.u, e.v, e.peso, e.ativa, e.dirigida) for e in c.rotas()] == original
+    assert all(type(w) is int for nome in c.planetas for _, w in c.vizinhos(nome))
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_algoritmos_no_compacto_batem_com_o_galactico(mapa_misto, seed):
+    mg = mapa_misto(seed)
+    c = mg.compactar()
+    dist_c, prev_c = dijkstra_distancias(c, "P0")
+    dist_g, _ = dijkstra_distancias(mg, "P0")
+    assert dist_c == dist_g
+    # Empates podem escolher outro predecessor; basta ser um predecessor de caminho mínimo.
+    for v, u in prev_c.items():
+        if u is not None:
+            assert any(x == v and dist_c[u] + w == dist_c[v] for x, w in mg.vizinhos(u))
+    assert bfs_levels(c, ["P0"]) == bfs_levels(mg, ["P0"])
+    assert _drenar(bfs_generator(c, "P0", delta=True)) == _drenar(bfs_generator(mg, "P0", delta=True))
+    for destino in ("P5", "P17"):
+        _, custo_c = _drenar(dijkstra_heap_generator(c, "P0", destino, delta=True))
+        _, custo_g = _drenar(dijkstra_heap_generator(mg, "P0", destino, delta=True))
+        assert custo_c == custo_g or math.isinf(custo_c) and math.isinf(custo_g)
+
+
+def test_componentes_do_compacto(mapa_misto):
+    mg = mapa_misto(3, n=40, rotas=30)
+    c = mg.compactar()
+    normalizar = lambda comps: sorted(sorted(m) for m in comps)
+    assert normalizar(c.encontrar_componentes_conexos()) == normalizar(mg.encontrar_componentes_conexos())
+
+
+def test_remocao_aleatoria_uniforme_por_rota():
+    """Rota bidirecional e rota dirigida têm a mesma chance, nos dois backends."""
+    from graph_system import MapaGalactico
+    from models import Planeta
+    mg = MapaGalactico()
+    for nome in "ABC":
+        mg.adicionar_planeta(Planeta(nome, "Autômatos", (0, 0)))
+    mg.adicionar_rota("A", "B", 1)
+    mg.adicionar_rota_dirigida("B", "C", 1)
+    random.seed(11)
+    for novo_mapa in (mg.compactar, lambda: copy.deepcopy(mg)):
+        contagem = {("A", "B"): 0, ("B", "C"): 0}
+        for _ in range(4000):
+            contagem[novo_mapa().remover_rota_aleatoria()] += 1
+        assert abs(contagem[("A", "B")] - 2000) < 200
+
+
+def test_remocao_aleatoria_esgota_todas_as_rotas(mapa_misto):
+    mg = mapa_misto(5, rotas=200)
+    c = mg.compactar()
+    random.seed(5)
+    removidas = []
+    while (par := c.remover_rota_aleatoria()) is not None:
+        removidas.append(par)
+    assert c.num_ativas == 0
+    assert len(removidas) == mg.num_rotas_ativas()
+    assert all(not list(c.vizinhos(p)) for p in c.planetas)
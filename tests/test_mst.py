@@ -0,0 +1,37 @@
+import pytest
+
+from graph_system import MapaGalactico
+from models import Planeta
+from mst import mst_kruskal_generator, mst_prim_generator, mst_prim_heap_generator
+
+
+def _fim(gen):
+    return [ev for ev in gen if ev["tipo"] == "mst_fim"][-1]
+
+
+@pytest.mark.parametrize("compacto", [False, True])
+@pytest.mark.parametrize("seed", range(10))
+def test_prim_e_kruskal_geram_a_mesma_floresta_com_rotas_dirigidas(mapa_misto, seed, compacto):
+    """As três MSTs ignoram a direção das rotas: mesmo custo e mesmo tamanho de floresta."""
+    grafo = mapa_misto(seed)
+    if compacto:
+        grafo = grafo.compactar()
+    kruskal = _fim(mst_kruskal_generator(grafo))
+    prim_heap = _fim(mst_prim_heap_generator(grafo, "P0"))
+    assert prim_heap["custo_total"] == pytest.approx(kruskal["custo_total"])
+    assert len(prim_heap["mst"]) == len(kruskal["mst"])
+
+    prim = _fim(mst_prim_generator(grafo, "P0"))
+    if len(prim["mst"]) == len(grafo.planetas) - 1:
+        assert prim["custo_total"] == pytest.approx(kruskal["custo_total"])
+
+
+def test_rota_de_mao_unica_entra_na_arvore_pelos_dois_lados():
+    mg = MapaGalactico()
+    for p in ("A", "B", "C"):
+        mg.adicionar_planeta(Planeta(p, "Autômatos", (0, 0)))
+    mg.adicionar_rota_dirigida("A", "B", 1)
+    mg.adicionar_rota("B", "C", 5)
+    mg.adicionar_rota("A", "C", 9)
+    for gen in (mst_prim_generator(mg, "B"), mst_prim_heap_generator(mg, "B"), mst_kruskal_generator(mg)):
+        assert _fim(gen)["custo_total"] == 6
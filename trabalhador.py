@@ -0,0 +1,118 @@
+"""
+Execução de um gerador de eventos fora do laço do pygame.
+
+O gerador roda numa thread (ou num processo) e entrega os eventos por uma
+fila limitada: quando a fila enche, o produtor espera (contrapressão), então
+a memória fica limitada a `capacidade` eventos independentemente do ritmo da UI.
+"""
+import multiprocessing
+import queue
+import threading
+from typing import Any, Callable, Optional
+
+from config import TAM_FILA_EVENTOS
+
+_FIM = "fim"
+_ERRO = "erro"
+_EVENTO = "evento"
+_ESPERA_S = 0.05  # intervalo em que o produtor bloqueado revisa o pedido de cancelamento
+
+
+def _produzir(funcao: Callable, args: tuple, kwargs: dict, fila, cancelado) -> None:
+    """Corpo do produtor (thread ou processo): drena o gerador para a fila."""
+    gen = funcao(*args, **kwargs)
+    try:
+        while not cancelado.is_set():
+            try:
+                ev = next(gen)
+            except StopIteration as fim:
+                _colocar(fila, (_FIM, fim.value), cancelado)
+                return
+            if not _colocar(fila, (_EVENTO, ev), cancelado):
+                return
+    except Exception as exc:  # repassado ao consumidor, que o relança
+        _colocar(fila, (_ERRO, exc), cancelado)
+    finally:
+        gen.close()
+
+
+def _colocar(fila, item, cancelado) -> bool:
+    while not cancelado.is_set():
+        try:
+            fila.put(item, timeout=_ESPERA_S)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+class Trabalhador:
+    """
+    Iterador sobre os eventos de funcao(*args, **kwargs), produzidos em segundo plano.
+    `next()` bloqueia até haver evento; `tentar_proximo()` não bloqueia e devolve
+    None quando a fila está vazia. Com processo=True o gerador roda em outro
+    processo (args precisam ser serializáveis por pickle, o mapa incluso) e não
+    disputa o GIL com a renderização.
+    """
+    def __init__(self, funcao: Callable, *args, processo: bool = False,
+                 capacidade: int = TAM_FILA_EVENTOS, **kwargs):
+        self.processo = processo
+        self.resultado: Any = None  # valor de retorno do gerador, quando ele termina
+        self.terminado = False
+        if processo:
+            self._fila = multiprocessing.Queue(maxsize=capacidade)
+            self._cancelado = multiprocessing.Event()
+            self._execucao = multiprocessing.Process(
+                target=_produzir, args=(funcao, args, kwargs, self._fila, self._cancelado), daemon=True)
+        else:
+            self._fila = queue.Queue(maxsize=capacidade)
+            self._cancelado = threading.Event()
+            self._execucao = threading.Thread(
+                target=_produzir, args=(funcao, args, kwargs, self._fila, self._cancelado), daemon=True)
+        self._execucao.start()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> dict:
+        while True:
+            ev = self._receber(bloquear=True)
+            if ev is not None:
+                return ev
+
+    def tentar_proximo(self) -> Optional[dict]:
+        """Próximo evento já produzido, ou None se ainda não há; StopIteration no fim."""
+        return self._receber(bloquear=False)
+
+    def _receber(self, bloquear: bool) -> Optional[dict]:
+        if self.terminado:
+            raise StopIteration(self.resultado)
+        try:
+            tipo, valor = self._fila.get(timeout=_ESPERA_S) if bloquear else self._fila.get_nowait()
+        except queue.Empty:
+            if not self._execucao.is_alive() and self._fila.empty():
+                # Produtor morreu sem avisar (processo encerrado à força).
+                self.terminado = True
+                raise StopIteration(None)
+            return None
+        if tipo == _EVENTO:
+            return valor
+        self.terminado = True
+        if tipo == _ERRO:
+            raise valor
+        self.resultado = valor
+        raise StopIteration(valor)
+
+    def cancelar(self, espera_s: float = 1.0) -> None:
+        """Pede a parada do produtor e aguarda até espera_s (processos são terminados se não pararem)."""
+        self.terminado = True
+        self._cancelado.set()
+        self._execucao.join(espera_s)
+        if self.processo:
+            if self._execucao.is_alive():
+                self._execucao.terminate()
+            self._fila.cancel_join_thread()
+            self._fila.close()
+
+    # Mesma interface de encerramento de um gerador.
+    close = cancelar
@@ -1,4 +1,5 @@
 import pygame
+from collections import OrderedDict
 from config import *
 
 class UIManager:
@@ -7,11 +8,18 @@ class UIManager:
         self.fonte_titulo = fonte_titulo
         self.fonte_normal = fonte_normal
         self.fonte_pequena = fonte_pequena
+
+        # Superfícies de texto já rasterizadas: (texto, fonte, cor, antialias) -> Surface, em ordem LRU.
+        self._cache_texto: "OrderedDict[tuple, pygame.Surface]" = OrderedDict()
+        self.cache_acertos = 0
+        self.cache_falhas = 0
         
         self.rect_btn_proximo = pygame.Rect(LARGURA - 180, ALTURA - 60, 160, 40)
         
         self.rect_btn_menos = pygame.Rect(LARGURA - 150, 45, 30, 30)
         self.rect_btn_mais = pygame.Rect(LARGURA - 40, 45, 30, 30)
+
+        self.rect_linha_tempo = pygame.Rect(20, ALTURA - 28, LARGURA - 240, 8)
         
         try:
             self.logo = pygame.image.load("assets/logo.png").convert_alpha()
@@ -25,14 +33,17 @@ class UIManager:
                 "MISSÃO: Expandir fronteiras.",
                 "O algoritmo BFS (Busca em Largura) explora o mapa em camadas,",
                 "garantindo que visitamos os planetas mais próximos primeiro.",
-                "", "CONTROLES: [1] Selecionar | [B] Executar BFS | [R] Destruir Rota"
+                "A BFS bidirecional cresce a partir da origem e do destino até se encontrarem.",
+                "", "CONTROLES: [1] Selecionar | [B] BFS | [N] Bidirecional (Origem+Destino) | [R] Destruir Rota"
             ],
             2: [
                 "FASE 2: SETOR TERMINÍDEO (Dijkstra)", "", 
                 "MISSÃO: Logística de Precisão.",
                 "O algoritmo de Dijkstra encontra o caminho de MENOR CUSTO.",
                 "Crucial quando o combustível (peso da aresta) é limitado.",
-                "", "CONTROLES: [2] Selecionar | [D] Executar Dijkstra | Clique Origem+Destino"
+                "A* e ALT usam estimativas da distância restante (posição no mapa ou",
+                "planetas-marco) e fixam menos planetas para achar a mesma rota.",
+                "", "CONTROLES: [2] | [D] Dijkstra | [A] A* | [L] ALT | [N] Bidirecional | Origem+Destino"
             ],
             3: [
                 "FASE 3: SETOR ILUMINADO (DFS/Ciclos)", "", 
@@ -47,26 +58,41 @@ class UIManager:
                 "Bellman-Ford é mais lento que Dijkstra, mas mais robusto.",
                 "Ele relaxa todas as rotas repetidamente para garantir a otimização,",
                 "mesmo em sistemas complexos.",
-                "", "CONTROLES: [4] Selecionar | [F] Executar Bellman-Ford | Clique Origem+Destino"
+                "", "CONTROLES: [4] Selecionar | [F] Bellman-Ford | [N] Dijkstra Bidirecional | Origem+Destino"
             ],
             5: [
                 "FASE 5: REDE DE ABASTECIMENTO (MST - Prim)", "",
                 "MISSÃO: Conexão Total Econômica.",
                 "Precisamos conectar TODOS os planetas gastando o mínimo possível.",
                 "A Árvore Geradora Mínima (MST) cria essa espinha dorsal.",
-                "", "CONTROLES: [5] Selecionar | [M] Gerar MST | Clique Origem"
+                "", "CONTROLES: [5] Selecionar | [M] Prim (Clique Origem) | [K] Kruskal"
             ]
         }
 
-    def _draw_text(self, txt: str, x: int, y: int, color=BRANCO, font=None, center_x=False, center_y=False):
+    def render_texto(self, txt: str, font, color=BRANCO, antialias: bool = True) -> pygame.Surface:
+        """font.render com cache LRU limitada a TAM_CACHE_TEXTO superfícies."""
+        chave = (txt, font, tuple(color), antialias)
+        surf = self._cache_texto.get(chave)
+        if surf is not None:
+            self._cache_texto.move_to_end(chave)
+            self.cache_acertos += 1
+            return surf
+        self.cache_falhas += 1
+        surf = font.render(txt, antialias, color)
+        self._cache_texto[chave] = surf
+        if len(self._cache_texto) > TAM_CACHE_TEXTO:
+            self._cache_texto.popitem(last=False)
+        return surf
+
+    def _draw_text(self, txt: str, x: int, y: int, color=BRANCO, font=None, center_x=False, center_y=False, destino=None):
         if font is None: font = self.fonte_normal
-        surf = font.render(txt, True, color)
+        surf = self.render_texto(txt, font, color)
         rect = surf.get_rect()
         if center_x and center_y: rect.center = (x, y)
         elif center_x: rect.centerx, rect.top = x, y
         elif center_y: rect.left, rect.centery = x, y
         else: rect.topleft = (x, y)
-        self.tela.blit(surf, rect)
+        (destino or self.tela).blit(surf, rect)
 
     def draw_intro(self, typed_chars, intro_text):
         self.tela.fill(PRETO)
@@ -98,15 +124,15 @@ class UIManager:
         largura_txt = self.fonte_titulo.size(status_txt)[0]
         self._draw_text(status_txt, x=LARGURA - largura_txt - 20, y=10, color=cor_status, font=self.fonte_titulo)
 
-        controles = "[1-5] Mudar Fase | [T] Tutorial | [R] Evento | [P] Auto/Manual"
+        controles = "[1-5] Mudar Fase | [T] Tutorial | [R] Evento | [U] Desfazer | [P] Auto/Manual | [0] Vista"
         self._draw_text(controles, x=20, y=50)
         
         if msgs:
             last_msg = msgs[-1]
-            last_msg_surf = self.fonte_normal.render(f"> {last_msg}", True, BRANCO)
+            last_msg_surf = self.render_texto(f"> {last_msg}", self.fonte_normal)
             self.tela.blit(last_msg_surf, (LARGURA/2, 50)) 
 
-    def draw_speed_controls(self, delay_ms):
+    def draw_speed_controls(self, delay_ms, turbo: bool = False):
         """Desenha os controles de velocidade no HUD."""
         mouse_pos = pygame.mouse.get_pos()
         
@@ -120,9 +146,9 @@ class UIManager:
         pygame.draw.rect(self.tela, BRANCO, self.rect_btn_mais, 1, border_radius=5)
         self._draw_text("+", self.rect_btn_mais.centerx, self.rect_btn_mais.centery, font=self.fonte_titulo, center_x=True, center_y=True)
 
-        texto_speed = f"{delay_ms}ms"
+        texto_speed = "TURBO" if turbo else f"{delay_ms}ms"
         centro_x = (self.rect_btn_menos.right + self.rect_btn_mais.left) / 2
-        self._draw_text(texto_speed, centro_x, 52, font=self.fonte_normal, center_x=True, center_y=True)
+        self._draw_text(texto_speed, centro_x, 52, font=self.fonte_normal, color=LARANJA_VIVO if turbo else BRANCO, center_x=True, center_y=True)
         self._draw_text("DELAY", centro_x, 40, font=self.fonte_pequena, color=CINZA_CLARO, center_x=True, center_y=True)
 
     def draw_playback_controls(self, anim_ativa: bool, modo_manual: bool):
@@ -135,6 +161,48 @@ class UIManager:
             
             self._draw_text("PRÓXIMO [Espaço]", self.rect_btn_proximo.centerx, self.rect_btn_proximo.centery, font=self.fonte_titulo, center_x=True, center_y=True)
 
+    def draw_linha_do_tempo(self, posicao: int, total: int, gravando: bool):
+        """Barra de progresso da execução gravada; clicar/arrastar nela volta ou avança passos."""
+        barra = self.rect_linha_tempo
+        pygame.draw.rect(self.tela, (40, 40, 50), barra, border_radius=4)
+        frac = (posicao + 1) / total if total else 0
+        pygame.draw.rect(self.tela, AMARELO, (barra.left, barra.top, int(barra.width * frac), barra.height), border_radius=4)
+        pygame.draw.circle(self.tela, BRANCO, (barra.left + int(barra.width * frac), barra.centery), 7)
+        estado = "GRAVANDO" if gravando else "GRAVADO"
+        self._draw_text(f"PASSO {posicao + 1}/{total} [{estado}]  [ ] Voltar/Avançar  [Home] Início",
+                        barra.left, barra.top - 16, font=self.fonte_pequena, color=CINZA_CLARO)
+
+    def draw_painel_medicao(self, linhas, max_linhas: int = 18):
+        """Contadores da execução atual (instrumentacao.Medidor.linhas) no canto direito."""
+        linhas = linhas[:max_linhas]
+        largura, altura = 300, 16 + 15 * len(linhas)
+        x, y = LARGURA - largura - 10, 90
+        painel = pygame.Surface((largura, altura)); painel.set_alpha(COR_PAINEL[3]); painel.fill(COR_PAINEL[:-1])
+        self.tela.blit(painel, (x, y))
+        pygame.draw.rect(self.tela, CINZA_CLARO, (x, y, largura, altura), 1)
+        for i, linha in enumerate(linhas):
+            self._draw_text(linha, x + 8, y + 8 + i * 15, color=AMARELO if i == 0 else BRANCO, font=self.fonte_pequena)
+
+    def draw_grafico_quadros(self, tempos_ms, linhas, orcamento_ms: float, escala_ms: float = 50.0):
+        """Barras do tempo dos últimos quadros (linha amarela = orçamento do FPS) e percentis por etapa."""
+        largura, altura_grafico = 320, 80
+        altura = altura_grafico + 12 + 14 * len(linhas)
+        x, y = 10, ALTURA - altura - 50
+        painel = pygame.Surface((largura, altura)); painel.set_alpha(COR_PAINEL[3]); painel.fill(COR_PAINEL[:-1])
+        self.tela.blit(painel, (x, y))
+        pygame.draw.rect(self.tela, CINZA_CLARO, (x, y, largura, altura), 1)
+
+        base = y + altura_grafico
+        tempos_ms = tempos_ms[-(largura - 8):]
+        for i, t in enumerate(tempos_ms):
+            h = int(min(t, escala_ms) / escala_ms * (altura_grafico - 8))
+            cor = VERDE if t <= orcamento_ms else (LARANJA_VIVO if t <= 2 * orcamento_ms else VERMELHO)
+            pygame.draw.line(self.tela, cor, (x + 4 + i, base), (x + 4 + i, base - h))
+        y_orcamento = base - int(orcamento_ms / escala_ms * (altura_grafico - 8))
+        pygame.draw.line(self.tela, AMARELO, (x + 4, y_orcamento), (x + largura - 4, y_orcamento))
+        for i, linha in enumerate(linhas):
+            self._draw_text(linha, x + 8, base + 6 + i * 14, color=AMARELO if i == 0 else BRANCO, font=self.fonte_pequena)
+
     def draw_tutorial(self, fase):
         panel_w, panel_h = 700, 450
         panel_x, panel_y = (LARGURA - panel_w) / 2, (ALTURA - panel_h) / 2